@@ -0,0 +1,101 @@
+"""Client Overhead Benchmark - Command round trips without a network.
+
+Drives a ButtplugClient against an in-process LoopbackServer, so every
+number is pure client cost: message construction, encoding, Id sorting,
+decoding and dispatch. Runs sequential run_output() calls, concurrent
+ones, and pipelined ones.
+
+Usage:
+    python benchmarks/client_overhead_benchmark.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from buttplug import (
+    ButtplugClient,
+    DeviceOutputCommand,
+    LoopbackConnector,
+    LoopbackServer,
+    OutputType,
+)
+
+COMMANDS = 20_000
+CONCURRENCY = 64
+
+DEVICES = {
+    "0": {
+        "DeviceName": "Benchmark Vibrator",
+        "DeviceIndex": 0,
+        "DeviceMessageTimingGap": 0,
+        "DeviceFeatures": {
+            "0": {"FeatureIndex": 0, "Output": {"Vibrate": {"Value": [0, 20]}}},
+        },
+    }
+}
+
+
+async def connected_client(pipeline: bool = False) -> tuple[ButtplugClient, LoopbackServer]:
+    server = LoopbackServer(DEVICES)
+    client = ButtplugClient("Benchmark")
+    client.pipeline_outputs = pipeline
+    await client.connect(LoopbackConnector(server))
+    return client, server
+
+
+async def sequential() -> float:
+    client, _ = await connected_client()
+    feature = client.devices[0].features[0]
+    start = time.perf_counter()
+    for i in range(COMMANDS):
+        await feature.run_output(DeviceOutputCommand(OutputType.VIBRATE, (i % 20) / 20))
+    elapsed = time.perf_counter() - start
+    await client.disconnect()
+    return elapsed
+
+
+async def concurrent() -> float:
+    client, _ = await connected_client()
+    feature = client.devices[0].features[0]
+
+    async def worker(count: int) -> None:
+        for i in range(count):
+            await feature.run_output(DeviceOutputCommand(OutputType.VIBRATE, (i % 20) / 20))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(COMMANDS // CONCURRENCY) for _ in range(CONCURRENCY)))
+    elapsed = time.perf_counter() - start
+    await client.disconnect()
+    return elapsed
+
+
+async def pipelined() -> float:
+    client, _ = await connected_client(pipeline=True)
+    feature = client.devices[0].features[0]
+    start = time.perf_counter()
+    for i in range(COMMANDS):
+        await feature.run_output(DeviceOutputCommand(OutputType.VIBRATE, (i % 20) / 20))
+    while client.pipeline_stats.outstanding:
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    await client.disconnect()
+    return elapsed
+
+
+async def main() -> None:
+    print(f"{'scenario':<14}{'commands':>10}{'us/cmd':>10}{'cmd/s':>12}")
+    for name, scenario in (
+        ("sequential", sequential),
+        ("concurrent", concurrent),
+        ("pipelined", pipelined),
+    ):
+        elapsed = await scenario()
+        print(
+            f"{name:<14}{COMMANDS:>10}{elapsed / COMMANDS * 1e6:>10.2f}{COMMANDS / elapsed:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
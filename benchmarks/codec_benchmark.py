@@ -0,0 +1,81 @@
+"""Codec Benchmark - Per-message cost of each JSON codec.
+
+Measures encode and decode time for the protocol frames that dominate
+real traffic: outgoing OutputCmd, incoming Ok, and a DeviceList with a
+handful of multi-feature devices. Codecs that aren't installed are
+skipped.
+
+Usage:
+    python benchmarks/codec_benchmark.py
+    pip install orjson msgspec  # to compare the optional backends
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any
+
+from buttplug._messages import Ok, OutputCmd
+from buttplug.codec import JsonCodec, MsgspecCodec, OrjsonCodec, StdlibJsonCodec
+
+ITERATIONS = 50_000
+
+
+def device_list_frame(device_count: int = 8) -> list[dict[str, Any]]:
+    """Build a DeviceList frame resembling a busy server."""
+    devices = {}
+    for index in range(device_count):
+        devices[str(index)] = {
+            "DeviceName": f"Benchmark Device {index}",
+            "DeviceIndex": index,
+            "DeviceMessageTimingGap": 50,
+            "DeviceFeatures": {
+                "0": {"FeatureIndex": 0, "Output": {"Vibrate": {"Value": [0, 20]}}},
+                "1": {"FeatureIndex": 1, "Output": {"Rotate": {"Value": [-20, 20]}}},
+                "2": {
+                    "FeatureIndex": 2,
+                    "Input": {"Battery": {"Value": [[0, 100]], "Command": ["Read"]}},
+                },
+            },
+        }
+    return [{"DeviceList": {"Id": 1, "Devices": devices}}]
+
+
+def frames() -> dict[str, list[dict[str, Any]]]:
+    """Protocol frames to benchmark, by message name."""
+    output_cmd = OutputCmd(
+        id=42, device_index=0, feature_index=1, command={"Vibrate": {"Value": 10}}
+    )
+    return {
+        "OutputCmd": output_cmd.to_protocol(),
+        "Ok": Ok(id=42).to_protocol(),
+        "DeviceList": device_list_frame(),
+    }
+
+
+def available_codecs() -> list[JsonCodec]:
+    """Every codec that can be constructed in this environment."""
+    codecs: list[JsonCodec] = [StdlibJsonCodec()]
+    for codec_type in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec_type())
+        except ImportError:
+            print(f"({codec_type.__name__} unavailable, skipping)")
+    return codecs
+
+
+def main() -> None:
+    print(f"{'codec':<10}{'message':<12}{'encode (us)':>14}{'decode (us)':>14}")
+    for codec in available_codecs():
+        for name, frame in frames().items():
+            raw = codec.encode(frame).decode()
+            encode = timeit.timeit(lambda: codec.encode(frame), number=ITERATIONS)
+            decode = timeit.timeit(lambda: codec.decode(raw), number=ITERATIONS)
+            print(
+                f"{codec.name:<10}{name:<12}"
+                f"{encode / ITERATIONS * 1e6:>14.3f}{decode / ITERATIONS * 1e6:>14.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Message Benchmark - Compact hot-path messages vs pydantic models.
+
+OutputCmd, StopCmd, Ok and InputReading are compact slotted classes. This
+compares constructing/serializing and parsing them against equivalent
+pydantic models (the pre-compact implementation), so regressions in either
+path show up side by side.
+
+Usage:
+    python benchmarks/message_benchmark.py
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from buttplug._messages import InputReading, Ok, OutputCmd, StopCmd
+from buttplug._messages.base import ButtplugModel
+
+ITERATIONS = 100_000
+
+
+class PydanticOutputCmd(ButtplugModel):
+    _message_type: ClassVar[str] = "OutputCmd"
+
+    device_index: int = Field(alias="DeviceIndex")
+    feature_index: int = Field(alias="FeatureIndex")
+    command: dict[str, Any] = Field(alias="Command")
+
+
+class PydanticStopCmd(ButtplugModel):
+    _message_type: ClassVar[str] = "StopCmd"
+
+    device_index: int | None = Field(default=None, alias="DeviceIndex")
+    feature_index: int | None = Field(default=None, alias="FeatureIndex")
+    inputs: bool = Field(default=True, alias="Inputs")
+    outputs: bool = Field(default=True, alias="Outputs")
+
+
+class PydanticOk(ButtplugModel):
+    _message_type: ClassVar[str] = "Ok"
+
+
+class PydanticInputReadingValue(BaseModel):
+    model_config = ConfigDict(populate_by_name=True, extra="allow")
+
+    value: int = Field(alias="Value")
+
+
+class PydanticInputReading(ButtplugModel):
+    _message_type: ClassVar[str] = "InputReading"
+
+    device_index: int = Field(alias="DeviceIndex")
+    feature_index: int = Field(alias="FeatureIndex")
+    reading: dict[str, PydanticInputReadingValue] = Field(alias="Reading")
+
+
+OK_FIELDS = {"Id": 42}
+READING_FIELDS = {
+    "Id": 42,
+    "DeviceIndex": 0,
+    "FeatureIndex": 2,
+    "Reading": {"Battery": {"Value": 75}},
+}
+
+
+def cases() -> dict[str, tuple[Callable[[], object], Callable[[], object]]]:
+    """(compact, pydantic) callables for each measured operation."""
+    command = {"Vibrate": {"Value": 10}}
+    return {
+        "OutputCmd build+serialize": (
+            lambda: OutputCmd(id=1, device_index=0, feature_index=1, command=command).to_protocol(),
+            lambda: PydanticOutputCmd(
+                id=1, device_index=0, feature_index=1, command=command
+            ).to_protocol(),
+        ),
+        "StopCmd build+serialize": (
+            lambda: StopCmd(id=1, device_index=0).to_protocol(),
+            lambda: PydanticStopCmd(id=1, device_index=0).to_protocol(),
+        ),
+        "Ok parse": (
+            lambda: Ok.from_protocol(OK_FIELDS),
+            lambda: PydanticOk.from_protocol(OK_FIELDS),
+        ),
+        "InputReading parse": (
+            lambda: InputReading.from_protocol(READING_FIELDS),
+            lambda: PydanticInputReading.from_protocol(READING_FIELDS),
+        ),
+    }
+
+
+def main() -> None:
+    print(f"{'operation':<28}{'compact (us)':>14}{'pydantic (us)':>15}{'speedup':>10}")
+    for name, (compact, pydantic) in cases().items():
+        compact_time = timeit.timeit(compact, number=ITERATIONS) / ITERATIONS * 1e6
+        pydantic_time = timeit.timeit(pydantic, number=ITERATIONS) / ITERATIONS * 1e6
+        print(
+            f"{name:<28}{compact_time:>14.3f}{pydantic_time:>15.3f}"
+            f"{pydantic_time / compact_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
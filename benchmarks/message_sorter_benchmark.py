@@ -0,0 +1,107 @@
+"""Message Sorter Benchmark - Outstanding request handling at scale.
+
+Registers thousands of outstanding requests, then either resolves them all
+or lets them all time out, and reports per-request cost. The lock-free,
+timer-wheel MessageSorter is compared against the previous implementation
+(an asyncio.Lock around the pending table plus one wait_for() per request).
+
+Usage:
+    python benchmarks/message_sorter_benchmark.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from buttplug._messages import ButtplugMessage, Ok
+from buttplug._utils.message_sorter import MessageSorter
+
+SIZES = (10_000, 50_000)
+
+
+class LockingMessageSorter:
+    """The previous MessageSorter, kept here for comparison."""
+
+    def __init__(self) -> None:
+        self._pending: dict[int, asyncio.Future[ButtplugMessage]] = {}
+        self._lock = asyncio.Lock()
+
+    async def wait_for_response(self, msg_id: int, timeout: float = 30.0) -> ButtplugMessage:
+        future: asyncio.Future[ButtplugMessage] = asyncio.get_running_loop().create_future()
+        async with self._lock:
+            self._pending[msg_id] = future
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            async with self._lock:
+                self._pending.pop(msg_id, None)
+
+    async def resolve(self, msg_id: int, response: ButtplugMessage) -> bool:
+        async with self._lock:
+            future = self._pending.get(msg_id)
+            if future and not future.done():
+                future.set_result(response)
+                return True
+        return False
+
+
+async def resolve_new(count: int) -> float:
+    sorter = MessageSorter()
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(sorter.wait_for_response(i)) for i in range(1, count + 1)]
+    await asyncio.sleep(0)
+    for i in range(1, count + 1):
+        sorter.resolve(i, Ok(id=i))
+    await asyncio.gather(*tasks)
+    return time.perf_counter() - start
+
+
+async def resolve_old(count: int) -> float:
+    sorter = LockingMessageSorter()
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(sorter.wait_for_response(i)) for i in range(1, count + 1)]
+    await asyncio.sleep(0)
+    for i in range(1, count + 1):
+        await sorter.resolve(i, Ok(id=i))
+    await asyncio.gather(*tasks)
+    return time.perf_counter() - start
+
+
+async def expire_new(count: int) -> float:
+    sorter = MessageSorter(tick=0.01)
+    start = time.perf_counter()
+    tasks = [
+        asyncio.create_task(sorter.wait_for_response(i, timeout=0.05)) for i in range(1, count + 1)
+    ]
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return time.perf_counter() - start - 0.05
+
+
+async def expire_old(count: int) -> float:
+    sorter = LockingMessageSorter()
+    start = time.perf_counter()
+    tasks = [
+        asyncio.create_task(sorter.wait_for_response(i, timeout=0.05)) for i in range(1, count + 1)
+    ]
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return time.perf_counter() - start - 0.05
+
+
+async def main() -> None:
+    print(f"{'scenario':<22}{'outstanding':>12}{'new (us/req)':>14}{'old (us/req)':>14}")
+    for count in SIZES:
+        for name, new, old in (
+            ("resolve all", resolve_new, resolve_old),
+            ("expire all", expire_new, expire_old),
+        ):
+            new_time = await new(count)
+            old_time = await old(count)
+            print(
+                f"{name:<22}{count:>12}"
+                f"{new_time / count * 1e6:>14.2f}{old_time / count * 1e6:>14.2f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
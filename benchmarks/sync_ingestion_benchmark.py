@@ -0,0 +1,76 @@
+"""Sync Ingestion Benchmark - Submitting commands from a foreign thread.
+
+Compares SyncButtplugClient.post_output(), which drains many submissions
+per loop wakeup, against one asyncio.run_coroutine_threadsafe() call per
+command. The client talks to an in-process LoopbackServer, so only the
+cross-thread hand-off and client overhead are measured.
+
+Usage:
+    python benchmarks/sync_ingestion_benchmark.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from buttplug import (
+    DeviceOutputCommand,
+    LoopbackConnector,
+    LoopbackServer,
+    OutputType,
+    SyncButtplugClient,
+)
+
+COMMANDS = 20_000
+
+DEVICES = {
+    "0": {
+        "DeviceName": "Benchmark Vibrator",
+        "DeviceIndex": 0,
+        "DeviceFeatures": {
+            "0": {"FeatureIndex": 0, "Output": {"Vibrate": {"Value": [0, 20]}}},
+        },
+    }
+}
+
+
+def post_output(client: SyncButtplugClient) -> float:
+    start = time.perf_counter()
+    for i in range(COMMANDS):
+        client.post_output(0, DeviceOutputCommand(OutputType.VIBRATE, i % 20), feature_index=0)
+    client.call(client.client.stop_all_devices)
+    return time.perf_counter() - start
+
+
+def run_coroutine_threadsafe(client: SyncButtplugClient) -> float:
+    feature = client.devices[0].features[0]
+    start = time.perf_counter()
+    futures = [
+        asyncio.run_coroutine_threadsafe(
+            feature.run_output(DeviceOutputCommand(OutputType.VIBRATE, i % 20)), client.loop
+        )
+        for i in range(COMMANDS)
+    ]
+    for future in futures:
+        future.result()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{'method':<28}{'commands':>10}{'us/cmd':>10}")
+    for name, method in (
+        ("post_output", post_output),
+        ("run_coroutine_threadsafe", run_coroutine_threadsafe),
+    ):
+        with SyncButtplugClient("Benchmark") as client:
+            client.connect(LoopbackConnector(LoopbackServer(DEVICES)))
+            elapsed = method(client)
+            print(f"{name:<28}{COMMANDS:>10}{elapsed / COMMANDS * 1e6:>10.2f}")
+            if name == "post_output":
+                stats = client.ingestion_stats
+                print(f"{'':<28}{stats.wakeups:>10} wakeups, {stats.mean_batch:.0f} per wakeup")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,13 +26,12 @@ Basic usage:
 
 __version__ = "1.0.0"
 
-# Client and Device (public API)
+from buttplug.batch import BatchResult
 from buttplug.client import ButtplugClient
 from buttplug.command import DeviceOutputCommand
+from buttplug.connector import ButtplugConnector, WebSocketConnector
 from buttplug.device import ButtplugDevice
 from buttplug.enums import ErrorCode, InputCommandType, InputType, OutputType
-
-# Errors (public API)
 from buttplug.errors import (
     ButtplugConnectorError,
     ButtplugDeviceError,
@@ -42,9 +41,42 @@ from buttplug.errors import (
     ButtplugPingError,
     ButtplugUnknownError,
 )
-
-# Feature-level control (advanced API)
 from buttplug.feature import CommandValue, DeviceFeature
+from buttplug.flow import FlowControl, OverflowPolicy
+from buttplug.history import DecimatedHistory, SensorHistory
+from buttplug.latency import LatencyHistogram
+from buttplug.loopback import LoopbackConnector, LoopbackServer
+from buttplug.motion import MotionPlan, MotionPlanner, Move
+from buttplug.playback import Pattern, PatternPlayer
+from buttplug.read_cache import ReadCachePolicy
+from buttplug.reconnect import ReconnectPolicy
+from buttplug.resample import (
+    Interpolation,
+    ResampledBlock,
+    ResampledFrame,
+    SensorResampler,
+    resample,
+)
+from buttplug.scheduler import OutputScheduler
+from buttplug.stats import (
+    ConnectionStats,
+    DispatchStats,
+    IngestionStats,
+    MotionPlanStats,
+    OutputCacheStats,
+    PipelineStats,
+    PlaybackStats,
+    ReadCacheStats,
+    SchedulerStats,
+    SendQueueStats,
+    SorterStats,
+    SweeperStats,
+    TrajectoryStats,
+)
+from buttplug.subscription import InputSubscription, SensorOverflow, SensorReading
+from buttplug.sweeper import SensorChange, SensorSweeper, SweepReading
+from buttplug.sync import SyncButtplugClient
+from buttplug.trajectory import Action, Trajectory, TrajectoryPlayer
 
 __all__ = [
     # Version
@@ -66,7 +98,57 @@ __all__ = [
     "ButtplugClient",
     "ButtplugDevice",
     "DeviceOutputCommand",
+    "BatchResult",
+    "SyncButtplugClient",
+    "ReconnectPolicy",
+    "FlowControl",
+    "OverflowPolicy",
+    "ReadCachePolicy",
+    # Connectors
+    "ButtplugConnector",
+    "WebSocketConnector",
+    "LoopbackConnector",
+    "LoopbackServer",
     # Feature-level control
     "DeviceFeature",
     "CommandValue",
+    "OutputScheduler",
+    # Pattern and trajectory playback
+    "Pattern",
+    "PatternPlayer",
+    "Action",
+    "Trajectory",
+    "TrajectoryPlayer",
+    "MotionPlanner",
+    "MotionPlan",
+    "Move",
+    # Sensor streaming and history
+    "InputSubscription",
+    "SensorOverflow",
+    "SensorReading",
+    "SensorHistory",
+    "DecimatedHistory",
+    "SensorResampler",
+    "ResampledFrame",
+    "ResampledBlock",
+    "Interpolation",
+    "resample",
+    "SensorSweeper",
+    "SweepReading",
+    "SensorChange",
+    # Statistics
+    "ConnectionStats",
+    "DispatchStats",
+    "IngestionStats",
+    "MotionPlanStats",
+    "OutputCacheStats",
+    "PipelineStats",
+    "PlaybackStats",
+    "ReadCacheStats",
+    "SchedulerStats",
+    "SendQueueStats",
+    "SorterStats",
+    "SweeperStats",
+    "TrajectoryStats",
+    "LatencyHistogram",
 ]
@@ -1,6 +1,6 @@
 """Internal message models for Buttplug protocol."""
 
-from buttplug._messages.base import ButtplugMessage
+from buttplug._messages.base import ButtplugMessage, ButtplugModel, CompactMessage
 from buttplug._messages.commands import (
     InputCmd,
     InputReading,
@@ -29,6 +29,8 @@ from buttplug._messages.handshake import (
 
 __all__ = [
     "ButtplugMessage",
+    "ButtplugModel",
+    "CompactMessage",
     "RequestServerInfo",
     "ServerInfo",
     "Ok",
@@ -1,28 +1,46 @@
-"""Base message class and serialization utilities."""
+"""Base message classes and serialization utilities."""
 
 from __future__ import annotations
 
-from typing import Any, ClassVar
+import functools
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
+MessageT = TypeVar("MessageT", bound="ButtplugMessage")
 
-class ButtplugMessage(BaseModel):
-    """Base class for all Buttplug protocol messages."""
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        extra="forbid",
-    )
+class ButtplugMessage:
+    """Base class for all Buttplug protocol messages.
+
+    Cold-path messages (handshake, DeviceList, ...) are pydantic models derived
+    from ButtplugModel. The high-rate messages derive from CompactMessage
+    instead and serialize straight to the wire format.
+    """
+
+    if not TYPE_CHECKING:
+        # Hidden from mypy, which would otherwise reject assigning .id through
+        # the base type even though every concrete subclass provides it
+        __slots__ = ()
 
     # Message type name used in JSON (set by subclasses)
     _message_type: ClassVar[str] = ""
 
-    id: int = Field(alias="Id")
+    id: int
 
     def to_protocol(self) -> list[dict[str, Any]]:
         """Serialize message to Buttplug protocol format."""
-        return [{self._message_type: self.model_dump(by_alias=True, exclude_none=True)}]
+        raise NotImplementedError
+
+    @classmethod
+    def from_protocol(cls: type[MessageT], data: dict[str, Any]) -> MessageT:
+        """Validate and build a message from its protocol fields.
+
+        Raises:
+            ValueError: If the fields are invalid.
+        """
+        raise NotImplementedError
 
     @classmethod
     def get_message_type(cls) -> str:
@@ -30,18 +48,99 @@ class ButtplugMessage(BaseModel):
         return cls._message_type
 
 
-def parse_message(data: dict[str, Any]) -> ButtplugMessage:
-    """Parse a single message from protocol format.
+class ButtplugModel(ButtplugMessage, BaseModel):
+    """Base class for pydantic-validated protocol messages."""
 
-    Args:
-        data: A dict with a single key (message type) and value (message fields).
+    model_config = ConfigDict(
+        populate_by_name=True,
+        extra="forbid",
+    )
 
-    Returns:
-        Parsed message object.
+    id: int = Field(alias="Id")
+
+    def to_protocol(self) -> list[dict[str, Any]]:
+        """Serialize message to Buttplug protocol format."""
+        return [{self._message_type: self.model_dump(by_alias=True, exclude_none=True)}]
+
+    @classmethod
+    def from_protocol(cls: type[MessageT], data: dict[str, Any]) -> MessageT:
+        """Validate and build a message from its protocol fields."""
+        return cls.model_validate(data)  # type: ignore[attr-defined, no-any-return]
+
+
+class CompactMessage(ButtplugMessage):
+    """Base class for hot-path messages that bypass pydantic.
+
+    Subclasses declare their fields in __slots__, write to_protocol() by hand
+    and validate in from_protocol() with the field helpers below.
+    """
+
+    __slots__ = ("id",)
+
+    _fields: ClassVar[tuple[str, ...]] = ("id",)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        fields: list[str] = []
+        for klass in reversed(cls.__mro__):
+            fields.extend(klass.__dict__.get("__slots__", ()))
+        cls._fields = tuple(fields)
+
+    def __eq__(self, other: object) -> bool:
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+def check_fields(
+    message_type: str, data: Any, required: tuple[str, ...], optional: tuple[str, ...] = ()
+) -> dict[str, Any]:
+    """Validate the key set of a compact message's protocol fields.
 
     Raises:
-        ValueError: If message type is unknown.
+        ValueError: If data isn't a dict, misses a required key or has extra keys.
     """
+    if not isinstance(data, dict):
+        msg = f"{message_type} fields must be an object"
+        raise ValueError(msg)
+    missing = [key for key in required if key not in data]
+    if missing:
+        msg = f"{message_type} missing field(s): {', '.join(missing)}"
+        raise ValueError(msg)
+    extra = [key for key in data if key not in required and key not in optional]
+    if extra:
+        msg = f"{message_type} has unexpected field(s): {', '.join(extra)}"
+        raise ValueError(msg)
+    return data
+
+
+def int_field(message_type: str, data: dict[str, Any], key: str) -> int:
+    """Read an integer field, rejecting bools and other types.
+
+    Floats with an integral value (e.g. 50.0) are accepted and converted, as
+    some servers serialize every number as a float.
+
+    Raises:
+        ValueError: If the field isn't an integer.
+    """
+    value = data[key]
+    if type(value) is int:
+        return value
+    if type(value) is float and value.is_integer():
+        return int(value)
+    msg = f"{message_type}.{key} must be an integer, got {value!r}"
+    raise ValueError(msg)
+
+
+@functools.cache
+def message_types() -> dict[str, type[ButtplugMessage]]:
+    """Registry of message classes by protocol type name, built on first use."""
     from buttplug._messages.commands import (
         InputCmd,
         InputReading,
@@ -62,7 +161,7 @@ def parse_message(data: dict[str, Any]) -> ButtplugMessage:
         StopScanning,
     )
 
-    message_types: dict[str, type[ButtplugMessage]] = {
+    return {
         "RequestServerInfo": RequestServerInfo,
         "ServerInfo": ServerInfo,
         "Ok": Ok,
@@ -80,20 +179,82 @@ def parse_message(data: dict[str, Any]) -> ButtplugMessage:
         "StopCmd": StopCmd,
     }
 
+
+@functools.cache
+def fast_decoders() -> dict[str, Callable[[Any], ButtplugMessage]]:
+    """Unvalidated decoders for the inbound messages that dominate traffic.
+
+    These trust the server's field types and skip key-set checks. Malformed
+    input surfaces as KeyError/TypeError/ValueError, in which case callers
+    fall back to the validating path for a proper error.
+    """
+    from buttplug._messages.commands import InputReading, InputReadingValue
+    from buttplug._messages.handshake import Error, Ok
+    from buttplug.enums import ErrorCode
+
+    def decode_ok(fields: Any) -> ButtplugMessage:
+        return Ok(fields["Id"])
+
+    def decode_error(fields: Any) -> ButtplugMessage:
+        return Error.model_construct(
+            id=fields["Id"],
+            error_message=fields["ErrorMessage"],
+            error_code=ErrorCode(fields["ErrorCode"]),
+        )
+
+    def decode_input_reading(fields: Any) -> ButtplugMessage:
+        reading = {name: InputReadingValue(v["Value"]) for name, v in fields["Reading"].items()}
+        return InputReading(fields["Id"], fields["DeviceIndex"], fields["FeatureIndex"], reading)
+
+    return {
+        "Ok": decode_ok,
+        "Error": decode_error,
+        "InputReading": decode_input_reading,
+    }
+
+
+def parse_message(data: dict[str, Any], strict: bool = True) -> ButtplugMessage:
+    """Parse a single message from protocol format.
+
+    Args:
+        data: A dict with a single key (message type) and value (message fields).
+        strict: Fully validate every message. When False, Ok, Error and
+            InputReading take an unvalidated fast path.
+
+    Returns:
+        Parsed message object.
+
+    Raises:
+        ValueError: If message type is unknown.
+    """
+    if not isinstance(data, dict):
+        msg = f"Expected message object, got {type(data).__name__}"
+        raise ValueError(msg)
     if len(data) != 1:
         msg = f"Expected single message type, got {len(data)}"
         raise ValueError(msg)
 
-    msg_type = next(iter(data.keys()))
-    msg_data = data[msg_type]
+    msg_type, msg_data = next(iter(data.items()))
 
-    if msg_type not in message_types:
+    if not strict:
+        decoder = fast_decoders().get(msg_type)
+        if decoder is not None:
+            try:
+                return decoder(msg_data)
+            except (KeyError, TypeError, ValueError, AttributeError):
+                pass  # Let the validating path report what's wrong
+
+    message_type = message_types().get(msg_type)
+    if message_type is None:
         msg = f"Unknown message type: {msg_type}"
         raise ValueError(msg)
 
-    return message_types[msg_type].model_validate(msg_data)
+    return message_type.from_protocol(msg_data)
 
 
-def parse_messages(data: list[dict[str, Any]]) -> list[ButtplugMessage]:
+def parse_messages(data: list[dict[str, Any]], strict: bool = True) -> list[ButtplugMessage]:
     """Parse an array of messages from protocol format."""
-    return [parse_message(msg) for msg in data]
+    if not isinstance(data, list):
+        msg = f"Expected message array, got {type(data).__name__}"
+        raise ValueError(msg)
+    return [parse_message(msg, strict) for msg in data]
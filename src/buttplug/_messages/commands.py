@@ -1,4 +1,8 @@
-"""Device control command messages."""
+"""Device control command messages.
+
+OutputCmd, StopCmd and InputReading make up most of the traffic on a busy
+connection, so they are compact slotted classes rather than pydantic models.
+"""
 
 from __future__ import annotations
 
@@ -6,7 +10,7 @@ from typing import Any, ClassVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from buttplug._messages.base import ButtplugMessage
+from buttplug._messages.base import ButtplugModel, CompactMessage, check_fields, int_field
 
 
 class OutputCommand(BaseModel):
@@ -29,17 +33,50 @@ class OutputCommandWithDirection(OutputCommand):
     clockwise: bool = Field(alias="Clockwise")
 
 
-class OutputCmd(ButtplugMessage):
+class OutputCmd(CompactMessage):
     """Command to control device output (vibrate, rotate, position, etc.)."""
 
-    _message_type: ClassVar[str] = "OutputCmd"
-
-    device_index: int = Field(alias="DeviceIndex")
-    feature_index: int = Field(alias="FeatureIndex")
-    command: dict[str, Any] = Field(alias="Command")
+    __slots__ = ("device_index", "feature_index", "command")
 
+    _message_type: ClassVar[str] = "OutputCmd"
 
-class InputCmd(ButtplugMessage):
+    def __init__(
+        self, id: int, device_index: int, feature_index: int, command: dict[str, Any]
+    ) -> None:
+        self.id = id
+        self.device_index = device_index
+        self.feature_index = feature_index
+        self.command = command
+
+    def to_protocol(self) -> list[dict[str, Any]]:
+        """Serialize message to Buttplug protocol format."""
+        return [
+            {
+                "OutputCmd": {
+                    "Id": self.id,
+                    "DeviceIndex": self.device_index,
+                    "FeatureIndex": self.feature_index,
+                    "Command": self.command,
+                }
+            }
+        ]
+
+    @classmethod
+    def from_protocol(cls, data: dict[str, Any]) -> OutputCmd:
+        """Validate and build a message from its protocol fields."""
+        check_fields("OutputCmd", data, ("Id", "DeviceIndex", "FeatureIndex", "Command"))
+        command = data["Command"]
+        if not isinstance(command, dict):
+            raise ValueError("OutputCmd.Command must be an object")
+        return cls(
+            int_field("OutputCmd", data, "Id"),
+            int_field("OutputCmd", data, "DeviceIndex"),
+            int_field("OutputCmd", data, "FeatureIndex"),
+            command,
+        )
+
+
+class InputCmd(ButtplugModel):
     """Command to read or subscribe to device sensor."""
 
     _message_type: ClassVar[str] = "InputCmd"
@@ -50,30 +87,123 @@ class InputCmd(ButtplugMessage):
     command: str = Field(alias="Command")
 
 
-class InputReadingValue(BaseModel):
+class InputReadingValue:
     """Single input reading value."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="allow")
+    __slots__ = ("value",)
 
-    value: int = Field(alias="Value")
+    def __init__(self, value: int) -> None:
+        self.value = value
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, InputReadingValue):
+            return NotImplemented
+        return self.value == other.value
 
-class InputReading(ButtplugMessage):
-    """Sensor reading from device."""
+    __hash__ = None  # type: ignore[assignment]
 
-    _message_type: ClassVar[str] = "InputReading"
+    def __repr__(self) -> str:
+        return f"InputReadingValue(value={self.value!r})"
 
-    device_index: int = Field(alias="DeviceIndex")
-    feature_index: int = Field(alias="FeatureIndex")
-    reading: dict[str, InputReadingValue] = Field(alias="Reading")
 
+class InputReading(CompactMessage):
+    """Sensor reading from device."""
+
+    __slots__ = ("device_index", "feature_index", "reading")
+
+    _message_type: ClassVar[str] = "InputReading"
 
-class StopCmd(ButtplugMessage):
+    def __init__(
+        self,
+        id: int,
+        device_index: int,
+        feature_index: int,
+        reading: dict[str, InputReadingValue],
+    ) -> None:
+        self.id = id
+        self.device_index = device_index
+        self.feature_index = feature_index
+        self.reading = reading
+
+    def to_protocol(self) -> list[dict[str, Any]]:
+        """Serialize message to Buttplug protocol format."""
+        return [
+            {
+                "InputReading": {
+                    "Id": self.id,
+                    "DeviceIndex": self.device_index,
+                    "FeatureIndex": self.feature_index,
+                    "Reading": {name: {"Value": r.value} for name, r in self.reading.items()},
+                }
+            }
+        ]
+
+    @classmethod
+    def from_protocol(cls, data: dict[str, Any]) -> InputReading:
+        """Validate and build a message from its protocol fields."""
+        check_fields("InputReading", data, ("Id", "DeviceIndex", "FeatureIndex", "Reading"))
+        raw_reading = data["Reading"]
+        if not isinstance(raw_reading, dict):
+            raise ValueError("InputReading.Reading must be an object")
+
+        reading: dict[str, InputReadingValue] = {}
+        for name, value in raw_reading.items():
+            if not isinstance(value, dict) or "Value" not in value:
+                raise ValueError(f"InputReading.Reading.{name} must have a Value")
+            reading[name] = InputReadingValue(int_field("InputReading", value, "Value"))
+
+        return cls(
+            int_field("InputReading", data, "Id"),
+            int_field("InputReading", data, "DeviceIndex"),
+            int_field("InputReading", data, "FeatureIndex"),
+            reading,
+        )
+
+
+class StopCmd(CompactMessage):
     """Stop device outputs and/or unsubscribe from inputs."""
 
+    __slots__ = ("device_index", "feature_index", "inputs", "outputs")
+
     _message_type: ClassVar[str] = "StopCmd"
 
-    device_index: int | None = Field(default=None, alias="DeviceIndex")
-    feature_index: int | None = Field(default=None, alias="FeatureIndex")
-    inputs: bool = Field(default=True, alias="Inputs")
-    outputs: bool = Field(default=True, alias="Outputs")
+    def __init__(
+        self,
+        id: int,
+        device_index: int | None = None,
+        feature_index: int | None = None,
+        inputs: bool = True,
+        outputs: bool = True,
+    ) -> None:
+        self.id = id
+        self.device_index = device_index
+        self.feature_index = feature_index
+        self.inputs = inputs
+        self.outputs = outputs
+
+    def to_protocol(self) -> list[dict[str, Any]]:
+        """Serialize message to Buttplug protocol format."""
+        fields: dict[str, Any] = {"Id": self.id}
+        if self.device_index is not None:
+            fields["DeviceIndex"] = self.device_index
+        if self.feature_index is not None:
+            fields["FeatureIndex"] = self.feature_index
+        fields["Inputs"] = self.inputs
+        fields["Outputs"] = self.outputs
+        return [{"StopCmd": fields}]
+
+    @classmethod
+    def from_protocol(cls, data: dict[str, Any]) -> StopCmd:
+        """Validate and build a message from its protocol fields."""
+        check_fields("StopCmd", data, ("Id",), ("DeviceIndex", "FeatureIndex", "Inputs", "Outputs"))
+        inputs = data.get("Inputs", True)
+        outputs = data.get("Outputs", True)
+        if not isinstance(inputs, bool) or not isinstance(outputs, bool):
+            raise ValueError("StopCmd.Inputs and StopCmd.Outputs must be booleans")
+        return cls(
+            int_field("StopCmd", data, "Id"),
+            int_field("StopCmd", data, "DeviceIndex") if "DeviceIndex" in data else None,
+            int_field("StopCmd", data, "FeatureIndex") if "FeatureIndex" in data else None,
+            inputs,
+            outputs,
+        )
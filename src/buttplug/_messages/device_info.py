@@ -6,7 +6,7 @@ from typing import Any, ClassVar
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-from buttplug._messages.base import ButtplugMessage
+from buttplug._messages.base import ButtplugModel
 
 
 class FeatureOutputDefinition(BaseModel):
@@ -69,7 +69,7 @@ class DeviceInfo(BaseModel):
         return data
 
 
-class DeviceList(ButtplugMessage):
+class DeviceList(ButtplugModel):
     """List of connected devices."""
 
     _message_type: ClassVar[str] = "DeviceList"
@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from pydantic import Field
 
-from buttplug._messages.base import ButtplugMessage
+from buttplug._messages.base import ButtplugModel, CompactMessage, check_fields, int_field
 from buttplug.enums import ErrorCode
 
 
-class RequestServerInfo(ButtplugMessage):
+class RequestServerInfo(ButtplugModel):
     """Client identification message sent at connection start."""
 
     _message_type: ClassVar[str] = "RequestServerInfo"
@@ -20,7 +20,7 @@ class RequestServerInfo(ButtplugMessage):
     protocol_version_minor: int = Field(default=0, alias="ProtocolVersionMinor")
 
 
-class ServerInfo(ButtplugMessage):
+class ServerInfo(ButtplugModel):
     """Server identification response."""
 
     _message_type: ClassVar[str] = "ServerInfo"
@@ -31,13 +31,31 @@ class ServerInfo(ButtplugMessage):
     protocol_version_minor: int = Field(alias="ProtocolVersionMinor")
 
 
-class Ok(ButtplugMessage):
-    """Success response from server."""
+class Ok(CompactMessage):
+    """Success response from server.
+
+    The most common message on the wire, so it bypasses pydantic.
+    """
+
+    __slots__ = ()
 
     _message_type: ClassVar[str] = "Ok"
 
+    def __init__(self, id: int) -> None:
+        self.id = id
+
+    def to_protocol(self) -> list[dict[str, Any]]:
+        """Serialize message to Buttplug protocol format."""
+        return [{"Ok": {"Id": self.id}}]
+
+    @classmethod
+    def from_protocol(cls, data: dict[str, Any]) -> Ok:
+        """Validate and build a message from its protocol fields."""
+        check_fields("Ok", data, ("Id",))
+        return cls(int_field("Ok", data, "Id"))
+
 
-class Error(ButtplugMessage):
+class Error(ButtplugModel):
     """Error response from server."""
 
     _message_type: ClassVar[str] = "Error"
@@ -46,37 +64,37 @@ class Error(ButtplugMessage):
     error_code: ErrorCode = Field(alias="ErrorCode")
 
 
-class Ping(ButtplugMessage):
+class Ping(ButtplugModel):
     """Keepalive ping message."""
 
     _message_type: ClassVar[str] = "Ping"
 
 
-class Disconnect(ButtplugMessage):
+class Disconnect(ButtplugModel):
     """Graceful disconnection request."""
 
     _message_type: ClassVar[str] = "Disconnect"
 
 
-class StartScanning(ButtplugMessage):
+class StartScanning(ButtplugModel):
     """Start scanning for devices."""
 
     _message_type: ClassVar[str] = "StartScanning"
 
 
-class StopScanning(ButtplugMessage):
+class StopScanning(ButtplugModel):
     """Stop scanning for devices."""
 
     _message_type: ClassVar[str] = "StopScanning"
 
 
-class ScanningFinished(ButtplugMessage):
+class ScanningFinished(ButtplugModel):
     """Notification that scanning has completed."""
 
     _message_type: ClassVar[str] = "ScanningFinished"
 
 
-class RequestDeviceList(ButtplugMessage):
+class RequestDeviceList(ButtplugModel):
     """Request list of connected devices."""
 
     _message_type: ClassVar[str] = "RequestDeviceList"
@@ -1,6 +1,7 @@
 """Internal utilities."""
 
+from buttplug._utils.capability_index import CapabilityIndex
 from buttplug._utils.events import EventHandler
 from buttplug._utils.message_sorter import MessageSorter
 
-__all__ = ["EventHandler", "MessageSorter"]
+__all__ = ["CapabilityIndex", "EventHandler", "MessageSorter"]
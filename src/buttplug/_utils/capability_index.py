@@ -0,0 +1,91 @@
+"""Client-wide index of device capabilities."""
+
+from __future__ import annotations
+
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from buttplug.device import ButtplugDevice
+    from buttplug.enums import OutputType
+    from buttplug.feature import DeviceFeature
+
+
+class CapabilityIndex:
+    """Maps output types to the (device, feature) pairs supporting them.
+
+    Kept up to date incrementally as devices come and go, so fleet-wide
+    queries cost a dict lookup instead of a walk over every feature of every
+    device. Results for a given (output type, name pattern) are cached until
+    the device set changes.
+    """
+
+    def __init__(self) -> None:
+        self._devices: dict[int, ButtplugDevice] = {}
+        # Output type -> device index -> supporting features
+        self._by_output: dict[str, dict[int, list[DeviceFeature]]] = {}
+        self._queries: dict[tuple[str, str | None], list[tuple[ButtplugDevice, DeviceFeature]]] = {}
+
+    def add(self, device: ButtplugDevice) -> None:
+        """Index a device, replacing any entry for the same device index."""
+        self.remove(device.index)
+        self._devices[device.index] = device
+        for output_name in device.output_types:
+            features = device._features_by_output[output_name]
+            self._by_output.setdefault(output_name, {})[device.index] = features
+        self._queries.clear()
+
+    def remove(self, device_index: int) -> None:
+        """Drop a device from the index."""
+        device = self._devices.pop(device_index, None)
+        if device is None:
+            return
+        for output_name in list(self._by_output):
+            by_device = self._by_output[output_name]
+            if by_device.pop(device_index, None) is not None and not by_device:
+                del self._by_output[output_name]
+        self._queries.clear()
+
+    def clear(self) -> None:
+        """Drop every device."""
+        self._devices.clear()
+        self._by_output.clear()
+        self._queries.clear()
+
+    def find(
+        self, output_type: OutputType | str, name_pattern: str | None = None
+    ) -> list[tuple[ButtplugDevice, DeviceFeature]]:
+        """Get (device, feature) pairs supporting an output type.
+
+        Args:
+            output_type: Output type to look for.
+            name_pattern: Optional case-insensitive glob (e.g. "*lovense*")
+                matched against device names and display names.
+
+        Returns:
+            Matching pairs, ordered by device index and feature index.
+        """
+        # OutputType members hash and compare like their protocol names
+        key = (output_type, name_pattern)
+        cached = self._queries.get(key)
+        if cached is None:
+            cached = self._queries[key] = self._lookup(output_type, name_pattern)
+        return list(cached)
+
+    def _lookup(
+        self, output_name: str, name_pattern: str | None
+    ) -> list[tuple[ButtplugDevice, DeviceFeature]]:
+        pattern = name_pattern.lower() if name_pattern is not None else None
+        matches: list[tuple[ButtplugDevice, DeviceFeature]] = []
+        for device_index, features in sorted(self._by_output.get(output_name, {}).items()):
+            device = self._devices[device_index]
+            if pattern is not None and not _matches(device, pattern):
+                continue
+            matches.extend((device, feature) for feature in features)
+        return matches
+
+
+def _matches(device: ButtplugDevice, pattern: str) -> bool:
+    """Check a lowercased glob against a device's name or display name."""
+    names = (device.name, device.display_name)
+    return any(name is not None and fnmatchcase(name.lower(), pattern) for name in names)
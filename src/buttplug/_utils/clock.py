@@ -0,0 +1,93 @@
+"""Media timeline clock and interruptible sleeps for playback."""
+
+from __future__ import annotations
+
+import asyncio
+
+
+class PlaybackClock:
+    """Position on a timeline, derived from the event loop's monotonic clock.
+
+    The position is anchor_position + (now - anchor_time) * speed while
+    running, and anchor_position while paused. Every control re-anchors, so
+    the position is never accumulated from sleeps and can't drift.
+    """
+
+    def __init__(self, speed: float = 1.0) -> None:
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self._anchor_time = 0.0
+        self._anchor_position = 0.0
+        self._speed = speed
+        self._paused = False
+
+    @property
+    def speed(self) -> float:
+        """Timeline seconds per loop second."""
+        return self._speed
+
+    @property
+    def paused(self) -> bool:
+        """True while the position is frozen."""
+        return self._paused
+
+    def position(self, now: float) -> float:
+        """Timeline position at a loop time."""
+        if self._paused:
+            return self._anchor_position
+        return self._anchor_position + (now - self._anchor_time) * self._speed
+
+    def loop_time(self, position: float) -> float:
+        """Loop time at which a timeline position is reached while running."""
+        return self._anchor_time + (position - self._anchor_position) / self._speed
+
+    def set(self, position: float, now: float) -> None:
+        """Jump to a position."""
+        self._anchor_position = position
+        self._anchor_time = now
+
+    def set_speed(self, speed: float, now: float) -> None:
+        """Change speed, keeping the current position."""
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.set(self.position(now), now)
+        self._speed = speed
+
+    def pause(self, now: float) -> None:
+        """Freeze the position."""
+        self.set(self.position(now), now)
+        self._paused = True
+
+    def resume(self, now: float) -> None:
+        """Continue from the frozen position."""
+        self._anchor_time = now
+        self._paused = False
+
+
+class Alarm:
+    """Sleeps until a loop time, unless woken earlier by a control change."""
+
+    def __init__(self) -> None:
+        self._wakeup: asyncio.Future[None] | None = None
+
+    def wake(self) -> None:
+        """Interrupt the current sleep, if any."""
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+
+    async def sleep_until(self, deadline: float | None) -> None:
+        """Sleep until a loop time, or until woken if deadline is None."""
+        loop = asyncio.get_running_loop()
+        self._wakeup = wakeup = loop.create_future()
+        handle = loop.call_at(deadline, _resolve, wakeup) if deadline is not None else None
+        try:
+            await wakeup
+        finally:
+            if handle is not None:
+                handle.cancel()
+            self._wakeup = None
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
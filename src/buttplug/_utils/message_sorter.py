@@ -3,22 +3,80 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import math
 from typing import TYPE_CHECKING
 
+from buttplug._messages.handshake import Error
+from buttplug.latency import LatencyHistogram
+from buttplug.stats import PipelineStats, SorterStats
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from buttplug._messages.base import ButtplugMessage
 
+# (message type, device index or None) a request's round-trip time is filed under
+LatencyLabel = tuple[str, int | None]
+
+# Ids of abandoned requests remembered to tell late responses from unknown ones
+_ABANDONED_LIMIT = 1024
+
 
 class MessageSorter:
     """Correlates outgoing requests with incoming responses by message Id.
 
-    Thread-safe for concurrent request handling.
+    Everything runs on a single event loop, so registering and resolving are
+    plain dict operations with no locking. Timeouts are handled by a coarse
+    timer wheel: requests are dropped into per-tick buckets, and a single timer
+    handle fires for the earliest occupied bucket, instead of one wait_for()
+    task per request.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        tick: float = 0.05,
+        on_settled: Callable[[int], None] | None = None,
+    ) -> None:
+        """Initialize sorter.
+
+        Args:
+            tick: Timer wheel resolution in seconds. Timeouts fire up to one
+                tick late.
+            on_settled: Called with the message Id whenever a tracked pipelined
+                request stops being outstanding (acknowledged, expired, untracked
+                or rejected).
+        """
         self._next_id = 1
         self._pending: dict[int, asyncio.Future[ButtplugMessage]] = {}
-        self._lock = asyncio.Lock()
+
+        # Timer wheel: tick number -> message Ids due in that tick. Resolved Ids
+        # are left in their bucket and skipped when it expires.
+        self._tick = tick
+        self._buckets: dict[int, list[int]] = {}
+        self._bucket_heap: list[int] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_tick: int | None = None
+
+        self._resolved = 0
+        self._expired = 0
+        self._rejected = 0
+
+        # Round-trip timing of labelled requests, and responses nobody waited for
+        self._started: dict[int, tuple[float, LatencyLabel]] = {}
+        self._latency_by_type: dict[str, LatencyHistogram] = {}
+        self._latency_by_device: dict[int, LatencyHistogram] = {}
+        self._abandoned: dict[int, None] = {}
+        self._late = 0
+        self._unknown = 0
+
+        # Pipelined requests nobody is waiting on
+        self._unacknowledged: set[int] = set()
+        self._on_settled = on_settled
+        self._pipelined_sent = 0
+        self._pipelined_acknowledged = 0
+        self._pipelined_errors = 0
+        self._pipelined_expired = 0
 
     def get_next_id(self) -> int:
         """Get next available message ID."""
@@ -28,8 +86,33 @@ class MessageSorter:
             self._next_id = 1
         return msg_id
 
+    def register(
+        self, msg_id: int, timeout: float = 30.0, label: LatencyLabel | None = None
+    ) -> asyncio.Future[ButtplugMessage]:
+        """Register a pending request before its frame is written.
+
+        Registering ahead of the write guarantees a response can never arrive
+        before anyone is waiting for it, even when the write itself is deferred.
+
+        Args:
+            msg_id: Message ID to wait for.
+            timeout: Seconds until the future fails with asyncio.TimeoutError.
+            label: (message type, device index) to record the round-trip time
+                under once resolved. None records nothing.
+
+        Returns:
+            Future resolved with the response message.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ButtplugMessage] = loop.create_future()
+        self._pending[msg_id] = future
+        if label is not None:
+            self._started[msg_id] = (loop.time(), label)
+        self._schedule(loop, msg_id, timeout)
+        return future
+
     async def wait_for_response(self, msg_id: int, timeout: float = 30.0) -> ButtplugMessage:
-        """Wait for response with matching message ID.
+        """Register a request and wait for its response.
 
         Args:
             msg_id: Message ID to wait for.
@@ -42,18 +125,24 @@ class MessageSorter:
             asyncio.TimeoutError: If timeout expires.
             asyncio.CancelledError: If cancelled.
         """
-        future: asyncio.Future[ButtplugMessage] = asyncio.get_event_loop().create_future()
-
-        async with self._lock:
-            self._pending[msg_id] = future
-
+        future = self.register(msg_id, timeout)
         try:
-            return await asyncio.wait_for(future, timeout=timeout)
+            return await future
         finally:
-            async with self._lock:
-                self._pending.pop(msg_id, None)
+            self.discard(msg_id)
+
+    def discard(self, msg_id: int) -> None:
+        """Forget a pending request without delivering anything to it.
 
-    async def resolve(self, msg_id: int, response: ButtplugMessage) -> bool:
+        A no-op once the request has been resolved, rejected or expired.
+        """
+        future = self._pending.pop(msg_id, None)
+        if future is not None and not future.done():
+            future.cancel()
+            self._started.pop(msg_id, None)
+            self._abandon(msg_id)
+
+    def resolve(self, msg_id: int, response: ButtplugMessage) -> bool:
         """Resolve pending request with response.
 
         Args:
@@ -61,24 +150,223 @@ class MessageSorter:
             response: Response message.
 
         Returns:
-            True if a pending request was resolved, False otherwise.
+            True if a pending request was resolved, False otherwise. A False
+            result is counted as a late or unknown response.
+        """
+        future = self._pending.pop(msg_id, None)
+        if future is None or future.done():
+            if future is not None or msg_id in self._abandoned:
+                self._abandoned.pop(msg_id, None)
+                self._late += 1
+            else:
+                self._unknown += 1
+            return False
+        future.set_result(response)
+        self._resolved += 1
+        self._record_latency(msg_id)
+        return True
+
+    def reject(self, msg_id: int, error: Exception) -> bool:
+        """Reject a single pending request with an error.
+
+        Args:
+            msg_id: Message ID of request.
+            error: Exception raised to the waiting caller.
+
+        Returns:
+            True if a pending request was rejected, False otherwise.
+        """
+        future = self._pending.pop(msg_id, None)
+        if future is None or future.done():
+            return False
+        future.set_exception(error)
+        self._rejected += 1
+        self._started.pop(msg_id, None)
+        return True
+
+    def track(self, msg_id: int, timeout: float = 30.0, label: LatencyLabel | None = None) -> None:
+        """Track a pipelined request whose response nobody waits for.
+
+        Args:
+            msg_id: Message ID of request.
+            timeout: Seconds until the request is counted as expired.
+            label: (message type, device index) to record the round-trip time
+                under once acknowledged. None records nothing.
+        """
+        loop = asyncio.get_running_loop()
+        self._unacknowledged.add(msg_id)
+        self._pipelined_sent += 1
+        if label is not None:
+            self._started[msg_id] = (loop.time(), label)
+        self._schedule(loop, msg_id, timeout)
+
+    def untrack(self, msg_id: int) -> None:
+        """Stop tracking a pipelined request that never made it onto the wire."""
+        if msg_id in self._unacknowledged:
+            self._unacknowledged.discard(msg_id)
+            self._pipelined_sent -= 1
+            self._started.pop(msg_id, None)
+            if self._on_settled:
+                self._on_settled(msg_id)
+
+    def acknowledge(self, msg_id: int, response: ButtplugMessage) -> bool:
+        """Match a response against tracked pipelined requests.
+
+        Args:
+            msg_id: Message ID of request.
+            response: Response message.
+
+        Returns:
+            True if the response belonged to a pipelined request, False otherwise.
         """
-        async with self._lock:
-            future = self._pending.get(msg_id)
-            if future and not future.done():
-                future.set_result(response)
-                return True
-        return False
-
-    async def reject_all(self, error: Exception) -> None:
+        if msg_id not in self._unacknowledged:
+            return False
+        self._unacknowledged.discard(msg_id)
+        if isinstance(response, Error):
+            self._pipelined_errors += 1
+        else:
+            self._pipelined_acknowledged += 1
+        self._record_latency(msg_id)
+        if self._on_settled:
+            self._on_settled(msg_id)
+        return True
+
+    def reject_all(self, error: Exception) -> None:
         """Reject all pending requests with an error."""
-        async with self._lock:
-            for future in self._pending.values():
-                if not future.done():
-                    future.set_exception(error)
-            self._pending.clear()
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+                self._rejected += 1
+        unacknowledged, self._unacknowledged = self._unacknowledged, set()
+        self._started.clear()
+        if self._on_settled:
+            for msg_id in unacknowledged:
+                self._on_settled(msg_id)
+
+        # Nothing left to time out
+        if self._timer:
+            self._timer.cancel()
+        self._timer = None
+        self._timer_tick = None
+        self._buckets.clear()
+        self._bucket_heap.clear()
 
     @property
     def pending_count(self) -> int:
         """Number of pending requests."""
         return len(self._pending)
+
+    @property
+    def stats(self) -> SorterStats:
+        """Snapshot of request counters."""
+        return SorterStats(
+            in_flight=len(self._pending),
+            resolved=self._resolved,
+            expired=self._expired,
+            rejected=self._rejected,
+        )
+
+    @property
+    def pipeline_stats(self) -> PipelineStats:
+        """Snapshot of pipelined request counters."""
+        return PipelineStats(
+            sent=self._pipelined_sent,
+            acknowledged=self._pipelined_acknowledged,
+            errors=self._pipelined_errors,
+            expired=self._pipelined_expired,
+            outstanding=len(self._unacknowledged),
+        )
+
+    @property
+    def late_count(self) -> int:
+        """Responses that arrived after their request expired or was discarded."""
+        return self._late
+
+    @property
+    def unknown_count(self) -> int:
+        """Responses whose Id matched no request."""
+        return self._unknown
+
+    @property
+    def latency_by_type(self) -> dict[str, LatencyHistogram]:
+        """Copies of the round-trip time histograms per message type."""
+        return {name: histogram.copy() for name, histogram in self._latency_by_type.items()}
+
+    @property
+    def latency_by_device(self) -> dict[int, LatencyHistogram]:
+        """Copies of the round-trip time histograms per device index."""
+        return {index: histogram.copy() for index, histogram in self._latency_by_device.items()}
+
+    # ============ Latency ============
+
+    def _record_latency(self, msg_id: int) -> None:
+        """File the round-trip time of an answered request under its label."""
+        started = self._started.pop(msg_id, None)
+        if started is None:
+            return
+        start, (message_type, device_index) = started
+        elapsed = asyncio.get_running_loop().time() - start
+        histogram = self._latency_by_type.get(message_type)
+        if histogram is None:
+            histogram = self._latency_by_type[message_type] = LatencyHistogram()
+        histogram.record(elapsed)
+        if device_index is not None:
+            histogram = self._latency_by_device.get(device_index)
+            if histogram is None:
+                histogram = self._latency_by_device[device_index] = LatencyHistogram()
+            histogram.record(elapsed)
+
+    def _abandon(self, msg_id: int) -> None:
+        """Remember an Id nobody waits for anymore, so its response counts as late."""
+        self._abandoned[msg_id] = None
+        if len(self._abandoned) > _ABANDONED_LIMIT:
+            del self._abandoned[next(iter(self._abandoned))]
+
+    # ============ Timer Wheel ============
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop, msg_id: int, timeout: float) -> None:
+        """Drop a message Id into the bucket for its deadline."""
+        tick = math.ceil((loop.time() + timeout) / self._tick)
+        bucket = self._buckets.get(tick)
+        if bucket is None:
+            self._buckets[tick] = [msg_id]
+            heapq.heappush(self._bucket_heap, tick)
+            if self._timer_tick is None or tick < self._timer_tick:
+                self._arm(loop, tick)
+        else:
+            bucket.append(msg_id)
+
+    def _arm(self, loop: asyncio.AbstractEventLoop, tick: int) -> None:
+        """Point the single timer at the given tick."""
+        if self._timer:
+            self._timer.cancel()
+        self._timer_tick = tick
+        self._timer = loop.call_at(tick * self._tick, self._expire, loop, tick)
+
+    def _expire(self, loop: asyncio.AbstractEventLoop, armed_tick: int) -> None:
+        """Fail every request in the buckets that are now due."""
+        self._timer = None
+        self._timer_tick = None
+        # The loop may fire us a hair early, so never go below the armed tick
+        now_tick = max(armed_tick, math.floor(loop.time() / self._tick))
+
+        while self._bucket_heap and self._bucket_heap[0] <= now_tick:
+            tick = heapq.heappop(self._bucket_heap)
+            for msg_id in self._buckets.pop(tick, ()):
+                future = self._pending.pop(msg_id, None)
+                if future is not None and not future.done():
+                    future.set_exception(asyncio.TimeoutError())
+                    self._expired += 1
+                    self._started.pop(msg_id, None)
+                    self._abandon(msg_id)
+                elif msg_id in self._unacknowledged:
+                    self._unacknowledged.discard(msg_id)
+                    self._pipelined_expired += 1
+                    self._started.pop(msg_id, None)
+                    self._abandon(msg_id)
+                    if self._on_settled:
+                        self._on_settled(msg_id)
+
+        if self._bucket_heap:
+            self._arm(loop, self._bucket_heap[0])
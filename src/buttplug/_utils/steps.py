@@ -0,0 +1,56 @@
+"""Vectorized step conversion. Requires NumPy."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from buttplug.errors import ButtplugDeviceError
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+
+def convert_to_steps(values: ArrayLike, step_range: tuple[int, int]) -> NDArray[np.int64]:
+    """Convert an array of command values to validated steps.
+
+    Same semantics as DeviceFeature.convert_to_step(), element-wise: floating
+    arrays are percentages (-1.0 to 1.0) rounded away from zero, integer and
+    boolean arrays are raw steps.
+
+    Args:
+        values: Array-like of command values. Its dtype decides how every
+            element is interpreted.
+        step_range: (min_step, max_step) of the output.
+
+    Returns:
+        Array of the same shape with the step values.
+
+    Raises:
+        ButtplugDeviceError: If any value is out of range or values aren't numeric.
+    """
+    array = np.asarray(values)
+    min_step, max_step = step_range
+
+    if array.dtype.kind == "f":
+        # Also catches NaN, which fails both comparisons
+        invalid = ~((array >= -1.0) & (array <= 1.0))
+        if invalid.any():
+            value = array[invalid].flat[0]
+            raise ButtplugDeviceError(f"Float value {value} must be between -1.0 and 1.0")
+
+        # Float64 products, so the results match math.ceil/math.floor exactly
+        scaled = array.astype(np.float64) * max_step
+        steps = np.where(array >= 0, np.ceil(scaled), np.floor(scaled)).astype(np.int64)
+    elif array.dtype.kind in "biu":
+        steps = array.astype(np.int64)
+    else:
+        raise ButtplugDeviceError(f"Unsupported command value dtype {array.dtype}")
+
+    out_of_range = (steps < min_step) | (steps > max_step)
+    if out_of_range.any():
+        step = steps[out_of_range].flat[0]
+        raise ButtplugDeviceError(f"Step value {step} out of range [{min_step}, {max_step}]")
+
+    return steps
@@ -0,0 +1,32 @@
+"""Results of multi-feature output batches."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from buttplug.enums import OutputType
+
+# (device index, feature index, output type) addressing one output in a batch
+OutputKey = tuple[int, int, OutputType | str]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of ButtplugClient.apply().
+
+    Args:
+        sent: Commands sent to the server.
+        skipped: Commands not sent because the feature was already at that step
+            (only with cache_outputs).
+        errors: Failed entries by their key in the batch, with the error the
+            server (or the connection) reported for each.
+    """
+
+    sent: int = 0
+    skipped: int = 0
+    errors: dict[OutputKey, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """True if every entry was applied."""
+        return not self.errors
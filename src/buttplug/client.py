@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+import time
+from collections.abc import Awaitable, Callable, Mapping
 from typing import TYPE_CHECKING
 
 from buttplug._messages import (
     DeviceList,
     Error,
+    InputReading,
+    Ok,
+    OutputCmd,
     Ping,
     RequestDeviceList,
     RequestServerInfo,
@@ -19,16 +23,38 @@ from buttplug._messages import (
     StopScanning,
 )
 from buttplug._messages.base import ButtplugMessage
-from buttplug.connector import WebSocketConnector
+from buttplug._utils.capability_index import CapabilityIndex
+from buttplug.batch import BatchResult, OutputKey
+from buttplug.codec import JsonCodec
+from buttplug.command import DeviceOutputCommand
+from buttplug.connector import ButtplugConnector, WebSocketConnector
+from buttplug.enums import InputCommandType, InputType, OutputType
 from buttplug.errors import (
     ButtplugConnectorError,
+    ButtplugDeviceError,
     ButtplugHandshakeError,
     ButtplugPingError,
     error_from_code,
 )
+from buttplug.flow import FlowControl
+from buttplug.history import SensorHistory
+from buttplug.read_cache import ReadCachePolicy
+from buttplug.reconnect import ReconnectPolicy
+from buttplug.stats import (
+    ConnectionStats,
+    DispatchStats,
+    OutputCacheStats,
+    PipelineStats,
+    ReadCacheStats,
+    SendQueueStats,
+    SorterStats,
+)
+from buttplug.subscription import InputSubscription, SensorReading
 
 if TYPE_CHECKING:
     from buttplug.device import ButtplugDevice
+    from buttplug.feature import CommandValue, DeviceFeature
+    from buttplug.scheduler import OutputScheduler
 
 
 class ButtplugClient:
@@ -54,9 +80,25 @@ class ButtplugClient:
             name: Client application name (sent to server during handshake).
         """
         self._name = name
-        self._connector: WebSocketConnector | None = None
+        self._connector: ButtplugConnector | None = None
         self._connected = False
         self._scanning = False
+        self._pipeline_outputs = False
+
+        # Redundant output suppression
+        self._cache_outputs = False
+        self._outputs_sent = 0
+        self._outputs_suppressed = 0
+
+        # Sensor read caching
+        self._read_cache: ReadCachePolicy | None = None
+        self._read_counts = dict.fromkeys(
+            ("hits", "stale_hits", "misses", "collapsed", "refreshes"), 0
+        )
+
+        # Reconnect management
+        self._reconnect_policy: ReconnectPolicy | None = None
+        self._reconnect_task: asyncio.Task[None] | None = None
 
         # Server info from handshake
         self._server_name: str | None = None
@@ -67,6 +109,16 @@ class ButtplugClient:
 
         # Device tracking
         self._devices: dict[int, ButtplugDevice] = {}
+        self._capabilities = CapabilityIndex()
+
+        # Sensor subscriptions per (device index, feature index, input type)
+        self._subscriptions: dict[tuple[int, int, str], list[InputSubscription]] = {}
+        # Outcome of Subscribe requests in flight: None on success, else the error
+        self._subscribing: dict[tuple[int, int, str], asyncio.Future[Exception | None]] = {}
+
+        # Recent readings per (device index, feature index, input type)
+        self._history_size = 0
+        self._histories: dict[tuple[int, int, str], SensorHistory] = {}
 
         # Event callbacks
         self._on_device_added: (
@@ -77,6 +129,7 @@ class ButtplugClient:
         ) = None
         self._on_scanning_finished: Callable[[], None] | Callable[[], Awaitable[None]] | None = None
         self._on_server_disconnect: Callable[[], None] | Callable[[], Awaitable[None]] | None = None
+        self._on_reconnected: Callable[[], None] | Callable[[], Awaitable[None]] | None = None
         self._on_error: (
             Callable[[Exception], None] | Callable[[Exception], Awaitable[None]] | None
         ) = None
@@ -106,6 +159,158 @@ class ButtplugClient:
         """True if currently scanning for devices."""
         return self._scanning
 
+    @property
+    def reconnecting(self) -> bool:
+        """True while trying to re-establish a dropped connection."""
+        return self._reconnect_task is not None and not self._reconnect_task.done()
+
+    @property
+    def reconnect_policy(self) -> ReconnectPolicy | None:
+        """Policy for automatically reconnecting after the connection drops.
+
+        None (the default) disables reconnecting: devices are cleared and
+        on_server_disconnect fires as soon as the connection is lost.
+        """
+        return self._reconnect_policy
+
+    @reconnect_policy.setter
+    def reconnect_policy(self, policy: ReconnectPolicy | None) -> None:
+        self._reconnect_policy = policy
+
+    @property
+    def pipeline_outputs(self) -> bool:
+        """True if output commands are sent without waiting for the server's Ok.
+
+        In pipelined mode run_output() returns as soon as the command is written,
+        so control loops aren't bound by the round-trip time. Error responses
+        arrive asynchronously through on_error and are counted in
+        pipeline_stats.
+        """
+        return self._pipeline_outputs
+
+    @pipeline_outputs.setter
+    def pipeline_outputs(self, enabled: bool) -> None:
+        self._pipeline_outputs = enabled
+
+    @property
+    def cache_outputs(self) -> bool:
+        """True if output commands that wouldn't change the device are skipped.
+
+        Every feature remembers the last step (and duration) the server
+        acknowledged per output type. A command quantizing to the same step is
+        then dropped locally instead of being sent, e.g. 0.46 and 0.5 on a
+        20-step vibrator. The cache is cleared when outputs are stopped, on
+        errors and on reconnects. In pipelined mode a command counts as
+        acknowledged as soon as it is written.
+        """
+        return self._cache_outputs
+
+    @cache_outputs.setter
+    def cache_outputs(self, enabled: bool) -> None:
+        self._cache_outputs = enabled
+        if not enabled:
+            self._invalidate_output_caches()
+
+    @property
+    def read_cache(self) -> ReadCachePolicy | None:
+        """Caching policy for sensor reads (battery(), rssi()), or None to always read.
+
+        Setting a new policy drops cached values.
+        """
+        return self._read_cache
+
+    @read_cache.setter
+    def read_cache(self, policy: ReadCachePolicy | None) -> None:
+        self._read_cache = policy
+        for device in self._devices.values():
+            for feature in device.features.values():
+                feature._input_cache.clear()
+
+    @property
+    def read_cache_stats(self) -> ReadCacheStats:
+        """Counters for sensor reads answered from cache vs. the server."""
+        return ReadCacheStats(**self._read_counts)
+
+    @property
+    def history_size(self) -> int:
+        """Readings kept per sensor for sensor_history(), or 0 to keep none.
+
+        Every InputReading the client sees, whether pushed for a subscription
+        or answering a read, is recorded in a fixed-size ring buffer for its
+        (device, feature, input type). Changing the size drops recorded history.
+        """
+        return self._history_size
+
+    @history_size.setter
+    def history_size(self, size: int) -> None:
+        if size < 0:
+            raise ValueError("history_size must not be negative")
+        self._history_size = size
+        self._histories.clear()
+
+    def sensor_history(
+        self, device_index: int, feature_index: int, input_type: InputType | str
+    ) -> SensorHistory | None:
+        """Get the recorded readings of a sensor.
+
+        Args:
+            device_index: Device index.
+            feature_index: Feature index within the device.
+            input_type: Sensor input type.
+
+        Returns:
+            The sensor's history, or None if nothing was recorded for it.
+        """
+        input_name = input_type.value if isinstance(input_type, InputType) else input_type
+        return self._histories.get((device_index, feature_index, input_name))
+
+    @property
+    def output_cache_stats(self) -> OutputCacheStats:
+        """Counters for output commands sent vs. suppressed as redundant."""
+        return OutputCacheStats(sent=self._outputs_sent, suppressed=self._outputs_suppressed)
+
+    @property
+    def pipeline_stats(self) -> PipelineStats:
+        """Counters for output commands sent in pipelined mode."""
+        if not self._connector:
+            return PipelineStats()
+        return self._connector.pipeline_stats
+
+    @property
+    def request_stats(self) -> SorterStats:
+        """In-flight, resolved and expired request counters for this connection."""
+        if not self._connector:
+            return SorterStats()
+        return self._connector.request_stats
+
+    @property
+    def dispatch_stats(self) -> DispatchStats:
+        """Backlog of server events waiting for event callbacks on this connection."""
+        if not self._connector:
+            return DispatchStats()
+        return self._connector.dispatch_stats
+
+    @property
+    def send_queue_stats(self) -> SendQueueStats:
+        """Flow-control queue depth and wait-time counters for this connection."""
+        if not self._connector:
+            return SendQueueStats()
+        return self._connector.send_queue_stats
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """Traffic counters, in-flight gauges and round-trip times for this connection.
+
+        A cheap snapshot: poll it as often as needed.
+
+        Example:
+            stats = client.connection_stats
+            print(stats.latency.percentile(99), stats.timeouts, stats.in_flight)
+        """
+        if not self._connector:
+            return ConnectionStats()
+        return self._connector.connection_stats
+
     # Event callback properties
     @property
     def on_device_added(
@@ -156,7 +361,10 @@ class ButtplugClient:
     def on_server_disconnect(
         self,
     ) -> Callable[[], None] | Callable[[], Awaitable[None]] | None:
-        """Callback when server disconnects unexpectedly."""
+        """Callback when server disconnects unexpectedly.
+
+        With a reconnect_policy set, this only fires once reconnecting gives up.
+        """
         return self._on_server_disconnect
 
     @on_server_disconnect.setter
@@ -165,6 +373,19 @@ class ButtplugClient:
     ) -> None:
         self._on_server_disconnect = callback
 
+    @property
+    def on_reconnected(
+        self,
+    ) -> Callable[[], None] | Callable[[], Awaitable[None]] | None:
+        """Callback when a dropped connection has been re-established."""
+        return self._on_reconnected
+
+    @on_reconnected.setter
+    def on_reconnected(
+        self, callback: Callable[[], None] | Callable[[], Awaitable[None]] | None
+    ) -> None:
+        self._on_reconnected = callback
+
     @property
     def on_error(
         self,
@@ -179,11 +400,50 @@ class ButtplugClient:
     ) -> None:
         self._on_error = callback
 
-    async def connect(self, url: str) -> None:
+    def find_features(
+        self, output_type: OutputType | str, name_pattern: str | None = None
+    ) -> list[tuple[ButtplugDevice, DeviceFeature]]:
+        """Find every feature of every device supporting an output type.
+
+        Answered from an index maintained as devices are added and removed,
+        so it doesn't walk the device list.
+
+        Args:
+            output_type: Output type to look for (e.g. OutputType.VIBRATE).
+            name_pattern: Optional case-insensitive glob (e.g. "*lovense*")
+                matched against device names and display names.
+
+        Returns:
+            (device, feature) pairs, ordered by device and feature index.
+
+        Example:
+            for device, feature in client.find_features(OutputType.VIBRATE):
+                await feature.run_output(DeviceOutputCommand(OutputType.VIBRATE, 0.5))
+        """
+        return self._capabilities.find(output_type, name_pattern)
+
+    async def connect(
+        self,
+        url: str | ButtplugConnector,
+        *,
+        batch_window: float | None = None,
+        codec: JsonCodec | None = None,
+        flow_control: FlowControl | None = None,
+    ) -> None:
         """Connect to a Buttplug server.
 
         Args:
-            url: WebSocket URL (e.g., "ws://127.0.0.1:12345")
+            url: WebSocket URL (e.g., "ws://127.0.0.1:12345"), or an already
+                configured connector such as a LoopbackConnector.
+            batch_window: Opt-in outbound batching window in seconds. Messages sent
+                within the window (0.0 = the same event-loop tick) share a single
+                WebSocket frame, e.g. when run_output() drives several features.
+                Only used when url is a string.
+            codec: JSON codec for frames. Defaults to the fastest installed codec.
+                Only used when url is a string.
+            flow_control: Opt-in bound on device commands in flight. Commands
+                beyond it wait in a send queue, which sheds load according to its
+                overflow policy once full. Only used when url is a string.
 
         Raises:
             ButtplugConnectorError: If connection fails.
@@ -192,46 +452,72 @@ class ButtplugClient:
         if self._connected:
             return
 
+        self._cancel_reconnect()
+
         # Create connector and set up callbacks
-        self._connector = WebSocketConnector(url)
+        if isinstance(url, ButtplugConnector):
+            self._connector = url
+        else:
+            self._connector = WebSocketConnector(
+                url, batch_window=batch_window, codec=codec, flow_control=flow_control
+            )
         self._connector.set_message_callback(self._handle_server_message)
         self._connector.set_disconnect_callback(self._handle_disconnect)
 
-        # Connect WebSocket
+        # Open the transport
         await self._connector.connect()
 
         # Perform handshake
         try:
-            request = RequestServerInfo(id=0, client_name=self._name)
-            response = await self._connector.send(request)
+            await self._handshake()
+        except Exception:
+            await self._connector.disconnect()
+            self._connector = None
+            raise
 
-            if isinstance(response, Error):
-                raise ButtplugHandshakeError(response.error_message)
+    async def _handshake(self) -> None:
+        """Identify to the server, start pinging and fetch the device list."""
+        if not self._connector:
+            raise ButtplugConnectorError("Not connected")
 
-            if not isinstance(response, ServerInfo):
-                raise ButtplugHandshakeError(f"Unexpected response: {type(response).__name__}")
+        request = RequestServerInfo(id=0, client_name=self._name)
+        response = await self._connector.send(request)
 
-            self._server_name = response.server_name
-            self._max_ping_time = response.max_ping_time
-            self._connected = True
+        if isinstance(response, Error):
+            raise ButtplugHandshakeError(response.error_message)
 
-            # Start ping timer if required
-            if self._max_ping_time > 0:
-                self._start_ping_timer()
+        if not isinstance(response, ServerInfo):
+            raise ButtplugHandshakeError(f"Unexpected response: {type(response).__name__}")
 
-            # Request initial device list
-            await self._request_device_list()
+        self._server_name = response.server_name
+        self._max_ping_time = response.max_ping_time
+        self._connected = True
 
-        except Exception:
-            await self._connector.disconnect()
-            self._connector = None
-            raise
+        # Start ping timer if required
+        if self._max_ping_time > 0:
+            self._start_ping_timer()
+
+        # Request initial device list
+        await self._request_device_list()
 
     async def disconnect(self) -> None:
         """Disconnect from the server.
 
-        Automatically stops all devices before disconnecting.
+        Automatically stops all devices before disconnecting. Also abandons any
+        reconnect in progress.
         """
+        if self.reconnecting:
+            self._cancel_reconnect()
+            if self._connector:
+                await self._connector.disconnect()
+                self._connector = None
+            self._devices.clear()
+            self._capabilities.clear()
+            self._end_subscriptions()
+            self._histories.clear()
+            self._server_name = None
+            return
+
         if not self._connected or not self._connector:
             return
 
@@ -252,6 +538,9 @@ class ButtplugClient:
 
         # Clear state
         self._devices.clear()
+        self._capabilities.clear()
+        self._end_subscriptions()
+        self._histories.clear()
         self._server_name = None
         self._scanning = False
 
@@ -300,12 +589,128 @@ class ButtplugClient:
         if not self._connector or not self._connected:
             raise ButtplugConnectorError("Not connected")
 
+        for device in self._devices.values():
+            device._discard_scheduled()
+
         msg = StopCmd(id=0)
         response = await self._connector.send(msg)
 
         if isinstance(response, Error):
             raise error_from_code(response.error_code, response.error_message)
 
+        for device in self._devices.values():
+            device._forget_outputs()
+
+    async def apply(
+        self,
+        outputs: Mapping[OutputKey, CommandValue | DeviceOutputCommand],
+        timeout: float = 30.0,
+    ) -> BatchResult:
+        """Set several outputs, across any features and devices, in one frame.
+
+        Every entry is validated and converted to steps before anything is
+        sent, so an invalid entry fails the whole call without touching any
+        device. The commands then go out as a single JSON-array frame.
+
+        Args:
+            outputs: Values by (device index, feature index, output type). A value
+                is a float (0.0-1.0 percent), an int (step value) or a
+                DeviceOutputCommand, which is needed to give a duration for
+                POSITION_WITH_DURATION.
+            timeout: Maximum seconds to wait for each response.
+
+        Returns:
+            How many commands were sent and skipped, and the error of every
+            entry the server rejected.
+
+        Raises:
+            ButtplugConnectorError: If not connected or the frame can't be sent.
+            ButtplugDeviceError: If an entry names an unknown device or feature,
+                an unsupported output or an out-of-range value.
+
+        Example:
+            result = await client.apply({
+                (0, 0, OutputType.VIBRATE): 0.4,
+                (0, 1, OutputType.VIBRATE): 0.8,
+                (1, 0, OutputType.ROTATE): 0.2,
+            })
+        """
+        if not self._connector or not self._connected:
+            raise ButtplugConnectorError("Not connected")
+
+        built: list[
+            tuple[OutputKey, DeviceFeature, DeviceOutputCommand, OutputCmd, int, int | None]
+        ] = []
+        for key, value in outputs.items():
+            feature, command = self._resolve_output(key, value)
+            try:
+                msg, step, duration = feature._build_output(command)
+            except ButtplugDeviceError as e:
+                raise ButtplugDeviceError(f"{key}: {e}") from e
+            built.append((key, feature, command, msg, step, duration))
+
+        # Only touch output state once every entry is known to be valid
+        planned: list[tuple[OutputKey, DeviceFeature, DeviceOutputCommand, int, int | None]] = []
+        messages: list[ButtplugMessage] = []
+        skipped = 0
+        for key, feature, command, msg, step, duration in built:
+            if feature._is_redundant(command.output_type.value, step, duration):
+                feature._last_outputs[command.output_type.value] = command
+                skipped += 1
+                continue
+            planned.append((key, feature, command, step, duration))
+            messages.append(msg)
+
+        for _, feature, command, _, _ in planned:
+            # Newer than anything still scheduled, and unknown until acknowledged
+            device = self._devices[feature._device_index]
+            device._discard_scheduled(feature.index, command.output_type)
+            feature._acked_outputs.pop(command.output_type.value, None)
+
+        self._outputs_sent += len(messages)
+        responses = await self._connector.send_batch(messages, timeout)
+
+        errors: dict[OutputKey, Exception] = {}
+        for (key, feature, command, step, duration), response in zip(planned, responses):
+            if isinstance(response, Exception):
+                errors[key] = response
+            elif isinstance(response, Error):
+                errors[key] = error_from_code(response.error_code, response.error_message)
+            elif not isinstance(response, Ok):
+                errors[key] = ButtplugDeviceError(f"Unexpected response: {type(response).__name__}")
+            else:
+                feature._record_output(command, step, duration)
+        return BatchResult(sent=len(messages), skipped=skipped, errors=errors)
+
+    def _resolve_output(
+        self, key: OutputKey, value: CommandValue | DeviceOutputCommand
+    ) -> tuple[DeviceFeature, DeviceOutputCommand]:
+        """Look up the feature and command for one apply() entry."""
+        device_index, feature_index, output_type = key
+        try:
+            output_type = OutputType(output_type)
+        except ValueError:
+            raise ButtplugDeviceError(f"{key}: Unknown output type {output_type!r}") from None
+
+        if isinstance(value, DeviceOutputCommand):
+            if value.output_type != output_type:
+                raise ButtplugDeviceError(
+                    f"{key}: Command is for {value.output_type.value}, not {output_type.value}"
+                )
+            command = value
+        else:
+            command = DeviceOutputCommand(output_type, value)
+
+        device = self._devices.get(device_index)
+        if device is None:
+            raise ButtplugDeviceError(f"{key}: No device with index {device_index}")
+        feature = device.features.get(feature_index)
+        if feature is None:
+            raise ButtplugDeviceError(
+                f"{key}: Device {device_index} has no feature {feature_index}"
+            )
+        return feature, command
+
     async def _request_device_list(self) -> None:
         """Request current device list from server."""
         if not self._connector:
@@ -323,6 +728,8 @@ class ButtplugClient:
 
         if isinstance(msg, DeviceList):
             await self._handle_device_list(msg)
+        elif isinstance(msg, InputReading):
+            self._route_reading(msg)
         elif isinstance(msg, ScanningFinished):
             self._scanning = False
             if self._on_scanning_finished:
@@ -330,6 +737,8 @@ class ButtplugClient:
                 if inspect.isawaitable(result):
                     await result
         elif isinstance(msg, Error):
+            # Could be a pipelined output failing - device state is unknown now
+            self._invalidate_output_caches()
             error = error_from_code(msg.error_code, msg.error_message)
             if self._on_error:
                 result = self._on_error(error)
@@ -337,7 +746,12 @@ class ButtplugClient:
                     await result
 
     async def _handle_device_list(self, device_list: DeviceList) -> None:
-        """Process device list and emit add/remove events."""
+        """Process device list and emit add/remove events.
+
+        Devices whose index and name are unchanged keep their ButtplugDevice
+        object and are re-bound to the new device info, so references held by
+        the application survive reconnects.
+        """
         import inspect
 
         from buttplug.device import ButtplugDevice
@@ -346,22 +760,39 @@ class ButtplugClient:
         current_indices = set(self._devices.keys())
         new_indices = set(device_list.devices.keys())
 
-        added_indices = new_indices - current_indices
-        removed_indices = current_indices - new_indices
+        # An index reused for a different device counts as remove + add
+        replaced_indices = {
+            index
+            for index in current_indices & new_indices
+            if self._devices[index].name != device_list.devices[index].device_name
+        }
+        added_indices = (new_indices - current_indices) | replaced_indices
+        removed_indices = (current_indices - new_indices) | replaced_indices
 
         # Process removals first
         for index in removed_indices:
             device = self._devices.pop(index)
+            self._capabilities.remove(index)
+            self._end_subscriptions(index)
+            self._forget_histories(index)
+            device._detach()
             if self._on_device_removed:
                 result = self._on_device_removed(device)
                 if inspect.isawaitable(result):
                     await result
 
+        # Re-bind survivors
+        for index in new_indices - added_indices:
+            device = self._devices[index]
+            device._rebind(device_list.devices[index])
+            self._capabilities.add(device)
+
         # Process additions
         for index in added_indices:
             device_info = device_list.devices[index]
             device = ButtplugDevice(self, device_info)
             self._devices[index] = device
+            self._capabilities.add(device)
             if self._on_device_added:
                 result = self._on_device_added(device)
                 if inspect.isawaitable(result):
@@ -369,18 +800,112 @@ class ButtplugClient:
 
     async def _handle_disconnect(self) -> None:
         """Handle unexpected disconnection from server."""
-        import inspect
+        if self._reconnect_task and not self._reconnect_task.done():
+            # Dropped again before the handshake - the running loop retries by itself
+            return
 
         self._connected = False
         self._stop_ping_timer()
-        self._devices.clear()
         self._scanning = False
+        self._invalidate_output_caches()
+
+        if self._reconnect_policy and self._connector:
+            # Keep devices around so they can be re-bound once we're back
+            self._reconnect_task = asyncio.create_task(self._reconnect_loop(self._reconnect_policy))
+            return
+
+        await self._give_up_connection()
+
+    async def _give_up_connection(self) -> None:
+        """Drop all connection state and notify the application."""
+        import inspect
+
+        for device in self._devices.values():
+            device._detach()
+        self._devices.clear()
+        self._capabilities.clear()
+        self._end_subscriptions()
+        self._histories.clear()
+        self._server_name = None
 
         if self._on_server_disconnect:
             result = self._on_server_disconnect()
             if inspect.isawaitable(result):
                 await result
 
+    async def _reconnect_loop(self, policy: ReconnectPolicy) -> None:
+        """Background task re-establishing a dropped connection."""
+        import inspect
+
+        attempt = 0
+        while self._connector and (policy.max_attempts is None or attempt < policy.max_attempts):
+            await asyncio.sleep(policy.delay(attempt))
+            attempt += 1
+
+            try:
+                await self._connector.connect()
+                await self._handshake()
+                break
+            except Exception:
+                self._connected = False
+                self._stop_ping_timer()
+                await self._connector.disconnect()
+        else:
+            self._connector = None
+            await self._give_up_connection()
+            return
+
+        # Back online - a drop from here on starts a fresh reconnect
+        self._reconnect_task = None
+
+        if policy.restore_outputs:
+            await self._restore_outputs()
+        await self._restore_subscriptions()
+
+        if not (self._connector and self._connector.connected):
+            return  # Dropped again while restoring
+
+        if self._on_reconnected:
+            result = self._on_reconnected()
+            if inspect.isawaitable(result):
+                await result
+
+    async def _restore_outputs(self) -> None:
+        """Re-send the last output command of every feature."""
+        for device in list(self._devices.values()):
+            for feature in device.features.values():
+                for command in list(feature._last_outputs.values()):
+                    try:
+                        await feature.run_output(command)
+                    except Exception:
+                        pass  # Best effort - the device may have changed
+
+    async def _restore_subscriptions(self) -> None:
+        """Re-subscribe to every sensor that still has subscribers.
+
+        Subscriptions the server no longer accepts are ended, so their
+        consumers don't wait for readings that never come.
+        """
+        for key, subscribers in list(self._subscriptions.items()):
+            subscription = subscribers[0]
+            try:
+                await subscription.feature._send_input_cmd(
+                    subscription.input_type, InputCommandType.SUBSCRIBE
+                )
+            except Exception:
+                if not (self._connector and self._connector.connected):
+                    return  # Dropped again - the next reconnect restores them
+                if self._subscriptions.get(key) is subscribers:
+                    del self._subscriptions[key]
+                    for subscriber in subscribers:
+                        subscriber._finish()
+
+    def _cancel_reconnect(self) -> None:
+        """Stop a reconnect in progress."""
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
     def _start_ping_timer(self) -> None:
         """Start the ping timer task."""
         if self._ping_task:
@@ -424,6 +949,149 @@ class ButtplugClient:
         except asyncio.CancelledError:
             pass
 
+    def _invalidate_output_caches(self) -> None:
+        """Forget acknowledged output state of every feature."""
+        for device in self._devices.values():
+            for feature in device.features.values():
+                feature._acked_outputs.clear()
+
+    def _record_read(self, outcome: str) -> None:
+        """Count a cached sensor read by outcome (a ReadCacheStats field).
+
+        Internal method used by DeviceFeature.
+        """
+        self._read_counts[outcome] += 1
+
+    def _record_suppressed_output(self) -> None:
+        """Count an output command skipped as redundant.
+
+        Internal method used by DeviceFeature.
+        """
+        self._outputs_suppressed += 1
+
+    async def _add_subscription(self, subscription: InputSubscription) -> None:
+        """Register a subscription, subscribing on the server if it's the first.
+
+        Internal method used by InputSubscription.
+        """
+        feature = subscription.feature
+        key = (feature._device_index, feature.index, subscription.input_type.value)
+        subscribers = self._subscriptions.setdefault(key, [])
+        subscribers.append(subscription)
+
+        pending = self._subscribing.get(key)
+        if pending is not None:
+            # Someone else's Subscribe is in flight - share its outcome
+            error = await asyncio.shield(pending)
+            if error is not None:
+                self._discard_subscription(key, subscription)
+                raise error
+            return
+        if len(subscribers) > 1:
+            return
+
+        outcome: asyncio.Future[Exception | None] = asyncio.get_running_loop().create_future()
+        self._subscribing[key] = outcome
+        try:
+            await feature._send_input_cmd(subscription.input_type, InputCommandType.SUBSCRIBE)
+        except BaseException as e:
+            self._discard_subscription(key, subscription)
+            if isinstance(e, Exception):
+                outcome.set_result(e)
+            else:
+                outcome.set_result(ButtplugConnectorError("Subscribe was cancelled"))
+            raise
+        else:
+            outcome.set_result(None)
+        finally:
+            del self._subscribing[key]
+
+    async def _remove_subscription(self, subscription: InputSubscription) -> None:
+        """Unregister a subscription, unsubscribing on the server if it was the last.
+
+        Internal method used by InputSubscription.
+        """
+        feature = subscription.feature
+        key = (feature._device_index, feature.index, subscription.input_type.value)
+        if not self._discard_subscription(key, subscription) or key in self._subscriptions:
+            return
+        if not self._connected:
+            return
+        try:
+            await feature._send_input_cmd(subscription.input_type, InputCommandType.UNSUBSCRIBE)
+        except Exception:
+            pass  # Best effort - the device may be gone already
+
+    def _discard_subscription(
+        self, key: tuple[int, int, str], subscription: InputSubscription
+    ) -> bool:
+        """Drop a subscription from the routing table, returning whether it was there."""
+        subscribers = self._subscriptions.get(key)
+        if subscribers is None or subscription not in subscribers:
+            return False
+        subscribers.remove(subscription)
+        if not subscribers:
+            del self._subscriptions[key]
+        return True
+
+    def _route_reading(self, msg: InputReading) -> None:
+        """Hand an unsolicited sensor reading to its subscriptions."""
+        timestamp = time.monotonic()
+        for input_name, reading in msg.reading.items():
+            key = (msg.device_index, msg.feature_index, input_name)
+            if self._history_size:
+                self._record_history(key, timestamp, reading.value)
+            subscribers = self._subscriptions.get(key)
+            if subscribers:
+                sensor_reading = SensorReading(timestamp, reading.value)
+                for subscription in subscribers:
+                    subscription._push(sensor_reading)
+
+    def _record_reading(self, msg: InputReading) -> None:
+        """Record the answer to a sensor read in the history.
+
+        Internal method used by DeviceFeature.
+        """
+        if not self._history_size:
+            return
+        timestamp = time.monotonic()
+        for input_name, reading in msg.reading.items():
+            self._record_history(
+                (msg.device_index, msg.feature_index, input_name), timestamp, reading.value
+            )
+
+    def _record_history(self, key: tuple[int, int, str], timestamp: float, value: int) -> None:
+        history = self._histories.get(key)
+        if history is None:
+            history = self._histories[key] = SensorHistory(self._history_size)
+        history.append(timestamp, value)
+
+    def _forget_histories(self, device_index: int) -> None:
+        """Drop the recorded readings of a removed device."""
+        for key in [key for key in self._histories if key[0] == device_index]:
+            del self._histories[key]
+
+    def _end_subscriptions(self, device_index: int | None = None) -> None:
+        """End the subscriptions of a removed device, or of all devices."""
+        for key in list(self._subscriptions):
+            if device_index is not None and key[0] != device_index:
+                continue
+            for subscription in self._subscriptions.pop(key):
+                subscription._finish()
+
+    def _output_scheduler(self, device_index: int) -> OutputScheduler:
+        """Get the output scheduler of a device.
+
+        Internal method used by DeviceFeature.
+
+        Raises:
+            ButtplugDeviceError: If the device is no longer connected.
+        """
+        device = self._devices.get(device_index)
+        if device is None:
+            raise ButtplugDeviceError(f"Device {device_index} is no longer connected")
+        return device.output_scheduler
+
     async def _send_device_message(self, msg: ButtplugMessage) -> ButtplugMessage:
         """Send a device message and return response.
 
@@ -436,3 +1104,23 @@ class ButtplugClient:
             raise ButtplugConnectorError("Not connected")
 
         return await self._connector.send(msg)
+
+    async def _send_device_output(self, msg: ButtplugMessage) -> ButtplugMessage | None:
+        """Send an output command, honoring pipeline_outputs.
+
+        Internal method used by DeviceFeature.
+
+        Returns:
+            The response, or None if the command was pipelined.
+
+        Raises:
+            ButtplugConnectorError: If not connected.
+        """
+        if not self._connector or not self._connected:
+            raise ButtplugConnectorError("Not connected")
+
+        self._outputs_sent += 1
+        if self._pipeline_outputs:
+            await self._connector.send_pipelined(msg)
+            return None
+        return await self._connector.send(msg)
@@ -0,0 +1,114 @@
+"""JSON codecs used by connectors to encode and decode protocol frames."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Protocol
+
+
+class JsonCodec(Protocol):
+    """Encodes protocol frames to UTF-8 JSON and decodes them back.
+
+    Implementations must raise ValueError when decoding malformed input.
+    """
+
+    name: str
+
+    def encode(self, data: Any) -> bytes:
+        """Encode a protocol frame (list of message dicts) to UTF-8 JSON."""
+        ...
+
+    def decode(self, data: bytes | str) -> Any:
+        """Decode a UTF-8 JSON frame.
+
+        Raises:
+            ValueError: If data is not valid JSON.
+        """
+        ...
+
+
+class StdlibJsonCodec:
+    """Codec backed by the standard library json module."""
+
+    name = "json"
+
+    def __init__(self) -> None:
+        self._encoder = json.JSONEncoder(separators=(",", ":"))
+        self._decoder = json.JSONDecoder()
+
+    def encode(self, data: Any) -> bytes:
+        """Encode a protocol frame to UTF-8 JSON."""
+        return self._encoder.encode(data).encode()
+
+    def decode(self, data: bytes | str) -> Any:
+        """Decode a UTF-8 JSON frame."""
+        if isinstance(data, bytes):
+            data = data.decode()
+        return self._decoder.decode(data)
+
+
+class OrjsonCodec:
+    """Codec backed by orjson.
+
+    Raises:
+        ImportError: If orjson is not installed.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def encode(self, data: Any) -> bytes:
+        """Encode a protocol frame to UTF-8 JSON."""
+        return self._dumps(data)
+
+    def decode(self, data: bytes | str) -> Any:
+        """Decode a UTF-8 JSON frame."""
+        # orjson.JSONDecodeError is a ValueError subclass
+        return self._loads(data)
+
+
+class MsgspecCodec:
+    """Codec backed by msgspec.
+
+    Raises:
+        ImportError: If msgspec is not installed.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def encode(self, data: Any) -> bytes:
+        """Encode a protocol frame to UTF-8 JSON."""
+        frame: bytes = self._encoder.encode(data)
+        return frame
+
+    def decode(self, data: bytes | str) -> Any:
+        """Decode a UTF-8 JSON frame."""
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            raise ValueError(str(e)) from e
+
+
+def default_codec() -> JsonCodec:
+    """Get the fastest available codec.
+
+    Prefers msgspec, then orjson, falling back to the standard library.
+    """
+    for codec_type in (MsgspecCodec, OrjsonCodec):
+        try:
+            return codec_type()
+        except ImportError:
+            continue
+    return StdlibJsonCodec()
@@ -1,52 +1,233 @@
-"""WebSocket connector for Buttplug server communication."""
+"""Connectors for Buttplug server communication."""
 
 from __future__ import annotations
 
 import asyncio
-import json
-from collections.abc import Callable
-from typing import TYPE_CHECKING
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Any
 
 import websockets
 from websockets.asyncio.client import ClientConnection
 
 from buttplug._messages.base import ButtplugMessage, parse_messages
-from buttplug._utils.message_sorter import MessageSorter
+from buttplug._messages.commands import OutputCmd
+from buttplug._messages.handshake import Error
+from buttplug._utils.message_sorter import LatencyLabel, MessageSorter
+from buttplug.codec import JsonCodec, default_codec
 from buttplug.errors import ButtplugConnectorError
+from buttplug.flow import FlowControl, OverflowPolicy
+from buttplug.stats import (
+    ConnectionStats,
+    DispatchStats,
+    PipelineStats,
+    SendQueueStats,
+    SorterStats,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable
+    from collections.abc import Awaitable, Sequence
 
+# Message types subject to flow control
+_FLOW_CONTROLLED = frozenset({"OutputCmd", "InputCmd"})
+
+
+class _QueuedSend:
+    """A device command waiting for a slot in the in-flight window."""
+
+    __slots__ = ("message", "key", "granted", "result", "enqueued_at")
+
+    def __init__(
+        self,
+        message: ButtplugMessage,
+        key: Hashable | None,
+        granted: asyncio.Future[None],
+        enqueued_at: float,
+    ) -> None:
+        self.message = message
+        self.key = key
+        self.granted = granted
+        # Shared response for callers whose command was coalesced into this one
+        self.result: asyncio.Future[ButtplugMessage] | None = None
+        self.enqueued_at = enqueued_at
+
+
+def _coalesce_key(message: ButtplugMessage, pipelined: bool) -> Hashable | None:
+    """Key identifying commands that may replace each other in the send queue."""
+    if isinstance(message, OutputCmd):
+        return (pipelined, message.device_index, message.feature_index, tuple(message.command))
+    return None
+
+
+def _latency_label(message: ButtplugMessage) -> LatencyLabel:
+    """Message type and device index a request's round-trip time is filed under."""
+    return message.get_message_type(), getattr(message, "device_index", None)
 
-class WebSocketConnector:
-    """WebSocket connector for Buttplug server communication.
 
-    Handles WebSocket connection, message serialization/deserialization,
-    and request/response correlation.
+class ButtplugConnector(ABC):
+    """Base class for transports between ButtplugClient and a server.
 
-    Not intended for direct use - ButtplugClient handles this internally.
+    Handles everything above the wire: message Ids, request/response
+    correlation, outbound batching, pipelined sends, frame encoding and
+    dispatch of incoming messages. Subclasses only open and close the
+    transport and move encoded frames by implementing _open(), _close(),
+    _write_frame() and _read_frame().
     """
 
-    def __init__(self, url: str) -> None:
+    def __init__(
+        self,
+        batch_window: float | None = None,
+        codec: JsonCodec | None = None,
+        strict: bool = False,
+        flow_control: FlowControl | None = None,
+        dispatch_queue_size: int = 1024,
+    ) -> None:
         """Initialize connector.
 
         Args:
-            url: WebSocket URL (e.g., "ws://127.0.0.1:12345")
+            batch_window: Opt-in outbound batching. When set, messages sent within
+                this many seconds of each other (0.0 = the same event-loop tick) are
+                coalesced into a single JSON-array frame. None sends one frame per
+                message.
+            codec: JSON codec for frames. Defaults to the fastest installed codec
+                (msgspec, then orjson, then the standard library).
+            strict: Fully validate every incoming message. By default Ok, Error
+                and InputReading take an unvalidated fast path.
+            flow_control: Opt-in bound on device commands in flight, with a send
+                queue applying backpressure beyond it. None leaves it unbounded.
+            dispatch_queue_size: Unsolicited messages buffered for the message
+                callback. Callbacks run on their own task, so a slow one never
+                delays responses; once this many messages are waiting, the receive
+                loop waits for the callback to catch up.
         """
-        self._url = url
-        self._ws: ClientConnection | None = None
-        self._message_sorter = MessageSorter()
+        self._codec = codec or default_codec()
+        self._strict = strict
+        self._message_sorter = MessageSorter(on_settled=self._settle_pipelined)
         self._receive_task: asyncio.Task[None] | None = None
         self._connected = False
 
+        # Wire traffic counters
+        self._frames_in = 0
+        self._frames_out = 0
+        self._bytes_in = 0
+        self._bytes_out = 0
+        self._malformed_frames = 0
+
+        # Outbound batching state
+        self._batch_window = batch_window
+        self._outbox: list[tuple[int | None, dict[str, Any]]] = []
+        self._flush_handle: asyncio.Handle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+        # Flow control state
+        self._flow_control = flow_control
+        self._in_flight = 0
+        self._send_queue: deque[_QueuedSend] = deque()
+        self._queued_by_key: dict[Hashable, _QueuedSend] = {}
+        self._pipelined_slots: set[int] = set()
+        self._queue_high_water = 0
+        self._queue_waited = 0
+        self._queue_rejected = 0
+        self._queue_dropped = 0
+        self._queue_replaced = 0
+        self._queue_total_wait = 0.0
+        self._queue_max_wait = 0.0
+
         # Callbacks for unsolicited messages
         self._on_message: Callable[[ButtplugMessage], Awaitable[None]] | None = None
         self._on_disconnect: Callable[[], Awaitable[None]] | None = None
 
+        # Unsolicited message dispatch
+        self._dispatch_queue: asyncio.Queue[ButtplugMessage] = asyncio.Queue(dispatch_queue_size)
+        self._dispatch_task: asyncio.Task[None] | None = None
+        self._dispatch_high_water = 0
+        self._dispatched = 0
+        self._dispatch_stalls = 0
+        self._dispatch_errors = 0
+
     @property
     def connected(self) -> bool:
         """True if currently connected."""
-        return self._connected and self._ws is not None
+        return self._connected
+
+    @property
+    def codec(self) -> JsonCodec:
+        """JSON codec used for frames."""
+        return self._codec
+
+    @property
+    def request_stats(self) -> SorterStats:
+        """In-flight, resolved and expired request counters."""
+        return self._message_sorter.stats
+
+    @property
+    def pipeline_stats(self) -> PipelineStats:
+        """Counters for messages sent with send_pipelined()."""
+        return self._message_sorter.pipeline_stats
+
+    @property
+    def batch_window(self) -> float | None:
+        """Outbound batching window in seconds, or None if batching is disabled."""
+        return self._batch_window
+
+    @property
+    def flow_control(self) -> FlowControl | None:
+        """In-flight window settings, or None if flow control is disabled."""
+        return self._flow_control
+
+    @property
+    def dispatch_stats(self) -> DispatchStats:
+        """Backlog and throughput counters for unsolicited message dispatch."""
+        return DispatchStats(
+            backlog=self._dispatch_queue.qsize(),
+            high_water=self._dispatch_high_water,
+            dispatched=self._dispatched,
+            stalls=self._dispatch_stalls,
+            errors=self._dispatch_errors,
+        )
+
+    @property
+    def send_queue_stats(self) -> SendQueueStats:
+        """Queue depth, window occupancy and wait-time counters."""
+        return SendQueueStats(
+            in_flight=self._in_flight,
+            queued=len(self._send_queue),
+            high_water=self._queue_high_water,
+            waited=self._queue_waited,
+            rejected=self._queue_rejected,
+            dropped=self._queue_dropped,
+            replaced=self._queue_replaced,
+            total_wait=self._queue_total_wait,
+            max_wait=self._queue_max_wait,
+        )
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """Traffic counters, in-flight gauges and round-trip time histograms.
+
+        Cheap enough to poll: counters are copied and histograms are small
+        bucket lists.
+        """
+        sorter = self._message_sorter
+        pipelined = sorter.pipeline_stats
+        requests = sorter.stats
+        return ConnectionStats(
+            frames_in=self._frames_in,
+            frames_out=self._frames_out,
+            bytes_in=self._bytes_in,
+            bytes_out=self._bytes_out,
+            malformed_frames=self._malformed_frames,
+            timeouts=requests.expired + pipelined.expired,
+            late_responses=sorter.late_count,
+            unknown_responses=sorter.unknown_count,
+            in_flight=requests.in_flight,
+            pipelined=pipelined.outstanding,
+            queued=len(self._send_queue),
+            dispatch_backlog=self._dispatch_queue.qsize(),
+            latency_by_type=sorter.latency_by_type,
+            latency_by_device=sorter.latency_by_device,
+        )
 
     def set_message_callback(self, callback: Callable[[ButtplugMessage], Awaitable[None]]) -> None:
         """Set callback for unsolicited server messages (Id=0)."""
@@ -59,23 +240,28 @@ class WebSocketConnector:
     async def connect(self) -> None:
         """Connect to the Buttplug server.
 
+        Safe to call again after the connection dropped.
+
         Raises:
             ButtplugConnectorError: If connection fails.
         """
         if self._connected:
             return
 
-        try:
-            self._ws = await websockets.connect(self._url)
-            self._connected = True
-            self._receive_task = asyncio.create_task(self._receive_loop())
-        except Exception as e:
-            raise ButtplugConnectorError(f"Failed to connect to {self._url}: {e}") from e
+        await self._open()
+        self._connected = True
+        self._receive_task = asyncio.create_task(self._receive_loop())
 
     async def disconnect(self) -> None:
         """Disconnect from the server."""
         self._connected = False
 
+        # Drop anything still waiting for a batch flush
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._outbox.clear()
+
         if self._receive_task:
             self._receive_task.cancel()
             try:
@@ -84,15 +270,18 @@ class WebSocketConnector:
                 pass
             self._receive_task = None
 
-        if self._ws:
-            try:
-                await self._ws.close()
-            except Exception:
-                pass
-            self._ws = None
+        # Undelivered unsolicited messages belong to the closed connection
+        await self._stop_dispatch()
+
+        try:
+            await self._close()
+        except Exception:
+            pass
 
-        # Reject any pending requests
-        await self._message_sorter.reject_all(ButtplugConnectorError("Connection closed"))
+        # Reject any queued and pending requests
+        error = ButtplugConnectorError("Connection closed")
+        self._fail_queued(error)
+        self._message_sorter.reject_all(error)
 
     async def send(self, message: ButtplugMessage, timeout: float = 30.0) -> ButtplugMessage:
         """Send message and wait for response.
@@ -105,27 +294,93 @@ class WebSocketConnector:
             Response message from server.
 
         Raises:
-            ButtplugConnectorError: If not connected or send fails.
+            ButtplugConnectorError: If not connected, send fails or the send queue
+                is full.
             asyncio.TimeoutError: If response timeout expires.
         """
-        if not self._ws or not self._connected:
+        if not self._connected:
             raise ButtplugConnectorError("Not connected")
 
+        if self._flow_control is not None and message.get_message_type() in _FLOW_CONTROLLED:
+            response = await self._send_windowed(message, timeout, pipelined=False)
+            assert response is not None
+            return response
+        return await self._send_request(message, timeout)
+
+    async def _send_request(self, message: ButtplugMessage, timeout: float) -> ButtplugMessage:
+        """Write a request and wait for the response with its Id."""
         # Assign message ID if not set
         msg_id = self._message_sorter.get_next_id()
         message.id = msg_id
 
-        # Serialize and send
-        protocol_data = message.to_protocol()
-        json_str = json.dumps(protocol_data)
+        # Register before writing so the response can never beat us to it
+        response = self._message_sorter.register(msg_id, timeout, _latency_label(message))
+        try:
+            if self._batch_window is None:
+                await self._write(message.to_protocol())
+            else:
+                self._enqueue(msg_id, message.to_protocol())
+
+            # Wait for response with matching ID
+            return await response
+        finally:
+            self._message_sorter.discard(msg_id)
+
+    async def send_batch(
+        self, messages: Sequence[ButtplugMessage], timeout: float = 30.0
+    ) -> list[ButtplugMessage | Exception]:
+        """Send several requests in one frame and wait for all their responses.
+
+        The whole batch goes out as a single JSON-array frame (or, with a batch
+        window, through the same outbox flush). Batches are written as a unit
+        and don't pass through flow control's in-flight window.
+
+        Args:
+            messages: Messages to send.
+            timeout: Maximum seconds to wait for each response.
+
+        Returns:
+            One entry per message, in order: the server's response, or the
+            exception (e.g. asyncio.TimeoutError) that ended the wait for it.
+
+        Raises:
+            ButtplugConnectorError: If not connected or the frame can't be written.
+        """
+        if not self._connected:
+            raise ButtplugConnectorError("Not connected")
+        if not messages:
+            return []
+
+        ids: list[int] = []
+        responses: list[asyncio.Future[ButtplugMessage]] = []
+        protocol_data: list[dict[str, Any]] = []
+        for message in messages:
+            msg_id = self._message_sorter.get_next_id()
+            message.id = msg_id
+            ids.append(msg_id)
+            responses.append(
+                self._message_sorter.register(msg_id, timeout, _latency_label(message))
+            )
+            protocol_data.extend(message.to_protocol())
 
         try:
-            await self._ws.send(json_str)
-        except Exception as e:
-            raise ButtplugConnectorError(f"Failed to send message: {e}") from e
+            if self._batch_window is None:
+                await self._write(protocol_data)
+            else:
+                for msg_id, data in zip(ids, protocol_data):
+                    self._enqueue(msg_id, [data])
+            results = await asyncio.gather(*responses, return_exceptions=True)
+        finally:
+            for msg_id in ids:
+                self._message_sorter.discard(msg_id)
 
-        # Wait for response with matching ID
-        return await self._message_sorter.wait_for_response(msg_id, timeout)
+        batch: list[ButtplugMessage | Exception] = []
+        for result in results:
+            if isinstance(result, Exception) or not isinstance(result, BaseException):
+                batch.append(result)
+            else:
+                raise result  # Cancelled while waiting
+        return batch
 
     async def send_no_response(self, message: ButtplugMessage) -> None:
         """Send message without waiting for response.
@@ -138,54 +393,442 @@ class WebSocketConnector:
         Raises:
             ButtplugConnectorError: If not connected or send fails.
         """
-        if not self._ws or not self._connected:
+        if not self._connected:
             raise ButtplugConnectorError("Not connected")
 
         # Assign message ID if not set
         if message.id == 0:
             message.id = self._message_sorter.get_next_id()
 
-        protocol_data = message.to_protocol()
-        json_str = json.dumps(protocol_data)
+        if self._batch_window is None:
+            await self._write(message.to_protocol())
+        else:
+            # Still goes through the outbox so ordering with batched sends is kept.
+            # The Id comes along so a failed write can untrack a pipelined send.
+            self._enqueue(message.id, message.to_protocol())
+
+    async def send_pipelined(self, message: ButtplugMessage) -> None:
+        """Send message and return without waiting for its response.
+
+        The response is still matched by Id when it arrives and counted in
+        pipeline_stats. Error responses are forwarded to the message callback,
+        the same way unsolicited errors are.
+
+        Args:
+            message: Message to send.
+
+        Raises:
+            ButtplugConnectorError: If not connected, send fails or the send queue
+                is full.
+        """
+        if not self._connected:
+            raise ButtplugConnectorError("Not connected")
+
+        if self._flow_control is not None and message.get_message_type() in _FLOW_CONTROLLED:
+            await self._send_windowed(message, 30.0, pipelined=True)
+        else:
+            await self._send_tracked(message, hold_slot=False)
+
+    async def _send_tracked(self, message: ButtplugMessage, hold_slot: bool) -> None:
+        """Write a pipelined request and track its acknowledgement."""
+        msg_id = self._message_sorter.get_next_id()
+        message.id = msg_id
+        if hold_slot:
+            # Released by _settle_pipelined() once the request settles
+            self._pipelined_slots.add(msg_id)
+        self._message_sorter.track(msg_id, label=_latency_label(message))
+
+        try:
+            await self.send_no_response(message)
+        except ButtplugConnectorError:
+            self._message_sorter.untrack(msg_id)
+            raise
+
+    # ============ Flow Control ============
+
+    async def _send_windowed(
+        self, message: ButtplugMessage, timeout: float, pipelined: bool
+    ) -> ButtplugMessage | None:
+        """Send a device command through the in-flight window and send queue."""
+        flow = self._flow_control
+        assert flow is not None
+
+        if self._in_flight < flow.max_in_flight and not self._send_queue:
+            self._in_flight += 1
+            return await self._send_granted(message, timeout, pipelined)
+
+        loop = asyncio.get_running_loop()
+        key = None
+        if flow.overflow is OverflowPolicy.REPLACE:
+            key = _coalesce_key(message, pipelined)
+            queued = self._queued_by_key.get(key) if key is not None else None
+            if queued is not None:
+                # The queued caller will send this command in place of its own
+                queued.message = message
+                self._queue_replaced += 1
+                if pipelined:
+                    return None
+                if queued.result is None:
+                    queued.result = loop.create_future()
+                return await asyncio.shield(queued.result)
+
+        if len(self._send_queue) >= flow.max_queued:
+            if flow.overflow is OverflowPolicy.DROP_OLDEST and self._send_queue:
+                dropped = self._dequeue()
+                dropped.granted.set_exception(
+                    ButtplugConnectorError("Dropped from full send queue")
+                )
+                self._queue_dropped += 1
+            else:
+                self._queue_rejected += 1
+                raise ButtplugConnectorError("Send queue full")
+
+        entry = _QueuedSend(message, key, loop.create_future(), loop.time())
+        self._send_queue.append(entry)
+        if key is not None:
+            self._queued_by_key[key] = entry
+        self._queue_high_water = max(self._queue_high_water, len(self._send_queue))
+
+        try:
+            await entry.granted
+        except BaseException as e:
+            granted = entry.granted
+            if granted.done() and not granted.cancelled() and granted.exception() is None:
+                # Cancelled just after being granted a slot - hand it back
+                self._release_slot()
+            elif entry in self._send_queue:
+                self._send_queue.remove(entry)
+                if self._queued_by_key.get(entry.key) is entry:
+                    del self._queued_by_key[entry.key]
+            self._settle_followers(entry, e)
+            raise
+
+        try:
+            response = await self._send_granted(entry.message, timeout, pipelined)
+        except BaseException as e:
+            self._settle_followers(entry, e)
+            raise
+        if entry.result is not None and response is not None:
+            entry.result.set_result(response)
+        return response
+
+    async def _send_granted(
+        self, message: ButtplugMessage, timeout: float, pipelined: bool
+    ) -> ButtplugMessage | None:
+        """Send a command that holds a window slot."""
+        if pipelined:
+            # The slot is released through _settle_pipelined(), including when the
+            # write fails and the request is untracked again
+            await self._send_tracked(message, hold_slot=True)
+            return None
 
         try:
-            await self._ws.send(json_str)
+            return await self._send_request(message, timeout)
+        finally:
+            self._release_slot()
+
+    def _settle_pipelined(self, msg_id: int) -> None:
+        """Free the window slot of a pipelined command once it settles."""
+        if msg_id in self._pipelined_slots:
+            self._pipelined_slots.discard(msg_id)
+            self._release_slot()
+
+    def _release_slot(self) -> None:
+        """Free a window slot and grant it to the next queued command."""
+        self._in_flight -= 1
+        flow = self._flow_control
+        if flow is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        while self._send_queue and self._in_flight < flow.max_in_flight:
+            entry = self._dequeue()
+            if entry.granted.done():
+                continue  # Caller went away while queued
+            self._in_flight += 1
+            wait = loop.time() - entry.enqueued_at
+            self._queue_waited += 1
+            self._queue_total_wait += wait
+            self._queue_max_wait = max(self._queue_max_wait, wait)
+            entry.granted.set_result(None)
+
+    def _dequeue(self) -> _QueuedSend:
+        """Pop the oldest queued command."""
+        entry = self._send_queue.popleft()
+        if entry.key is not None and self._queued_by_key.get(entry.key) is entry:
+            del self._queued_by_key[entry.key]
+        return entry
+
+    def _fail_queued(self, error: Exception) -> None:
+        """Fail every queued command, e.g. on disconnect."""
+        while self._send_queue:
+            entry = self._dequeue()
+            if not entry.granted.done():
+                entry.granted.set_exception(error)
+
+    @staticmethod
+    def _settle_followers(entry: _QueuedSend, error: BaseException) -> None:
+        """Pass a failure on to callers coalesced into a queued command."""
+        if entry.result is None or entry.result.done():
+            return
+        if isinstance(error, asyncio.CancelledError):
+            entry.result.set_exception(ButtplugConnectorError("Queued command was cancelled"))
+        else:
+            entry.result.set_exception(error)
+
+    # ============ Transport ============
+
+    @abstractmethod
+    async def _open(self) -> None:
+        """Open the underlying transport.
+
+        Raises:
+            ButtplugConnectorError: If the transport can't be opened.
+        """
+
+    @abstractmethod
+    async def _close(self) -> None:
+        """Close the underlying transport."""
+
+    @abstractmethod
+    async def _write_frame(self, frame: bytes) -> None:
+        """Write one encoded frame (a JSON array of messages)."""
+
+    @abstractmethod
+    async def _read_frame(self) -> bytes | str | None:
+        """Read the next encoded frame, or None once the transport is closed."""
+
+    async def _write(self, protocol_data: list[dict[str, Any]]) -> None:
+        """Serialize a list of messages and write it as a single frame."""
+        if not self._connected:
+            raise ButtplugConnectorError("Not connected")
+
+        frame = self._codec.encode(protocol_data)
+
+        try:
+            await self._write_frame(frame)
         except Exception as e:
             raise ButtplugConnectorError(f"Failed to send message: {e}") from e
+        self._frames_out += 1
+        self._bytes_out += len(frame)
+
+    def _enqueue(self, msg_id: int | None, protocol_data: list[dict[str, Any]]) -> None:
+        """Queue messages for the next batch flush, scheduling one if needed."""
+        for data in protocol_data:
+            self._outbox.append((msg_id, data))
+
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            if self._batch_window:
+                self._flush_handle = loop.call_later(self._batch_window, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+
+    def _flush(self) -> None:
+        """Write everything in the outbox as one array frame."""
+        self._flush_handle = None
+        if not self._outbox:
+            return
+
+        batch, self._outbox = self._outbox, []
+        task = asyncio.create_task(self._write_batch(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _write_batch(self, batch: list[tuple[int | None, dict[str, Any]]]) -> None:
+        """Write a batch frame, failing each waiting caller if the write fails.
+
+        Pipelined requests in the batch are untracked, releasing their window
+        slots instead of holding them until they expire.
+        """
+        try:
+            await self._write([data for _, data in batch])
+        except ButtplugConnectorError as e:
+            self._fail_batch(batch, e)
+        except Exception as e:
+            # e.g. the codec couldn't encode a payload - nobody awaits the flush
+            error = ButtplugConnectorError(f"Failed to send message: {e}")
+            error.__cause__ = e
+            self._fail_batch(batch, error)
+
+    def _fail_batch(
+        self, batch: list[tuple[int | None, dict[str, Any]]], error: ButtplugConnectorError
+    ) -> None:
+        """Reject the waiting callers and untrack the pipelined requests of a batch."""
+        sorter = self._message_sorter
+        for msg_id, _ in batch:
+            if msg_id is not None and not sorter.reject(msg_id, error):
+                sorter.untrack(msg_id)
 
     async def _receive_loop(self) -> None:
         """Background task to receive and dispatch messages."""
         try:
-            while self._connected and self._ws:
-                try:
-                    raw = await self._ws.recv()
-                except websockets.exceptions.ConnectionClosed:
+            while self._connected:
+                raw = await self._read_frame()
+                if raw is None:
                     break
+                self._frames_in += 1
+                self._bytes_in += len(raw.encode() if isinstance(raw, str) else raw)
 
                 try:
-                    data = json.loads(raw)
-                    messages = parse_messages(data)
-                except (json.JSONDecodeError, ValueError):
-                    # Log but don't crash on parse errors
+                    data = self._codec.decode(raw)
+                    messages = parse_messages(data, self._strict)
+                except ValueError:
+                    # Count but don't crash on parse errors
+                    self._malformed_frames += 1
                     continue
 
                 for msg in messages:
                     if msg.id == 0:
-                        # Unsolicited message - dispatch to callback
+                        # Unsolicited message - hand off to the dispatch task
                         if self._on_message:
-                            try:
-                                await self._on_message(msg)
-                            except Exception:
-                                pass  # Don't let callback errors crash loop
+                            await self._dispatch(msg)
+                    elif self._message_sorter.acknowledge(msg.id, msg):
+                        # Response to a pipelined request - only errors need attention
+                        if isinstance(msg, Error) and self._on_message:
+                            await self._dispatch(msg)
                     else:
                         # Response to a request - resolve pending future
-                        await self._message_sorter.resolve(msg.id, msg)
+                        self._message_sorter.resolve(msg.id, msg)
 
         finally:
             if self._connected:
                 self._connected = False
+                error = ButtplugConnectorError("Connection lost")
+                self._fail_queued(error)
+                self._message_sorter.reject_all(error)
+
+                # Deliver what arrived before the connection dropped first
+                dispatch_task = self._dispatch_task
+                if dispatch_task and not dispatch_task.done():
+                    drained = asyncio.ensure_future(self._dispatch_queue.join())
+                    await asyncio.wait(
+                        (drained, dispatch_task), return_when=asyncio.FIRST_COMPLETED
+                    )
+                    drained.cancel()
+                await self._stop_dispatch()
+
                 if self._on_disconnect:
                     try:
                         await self._on_disconnect()
                     except Exception:
                         pass
+
+    # ============ Dispatch ============
+
+    async def _dispatch(self, msg: ButtplugMessage) -> None:
+        """Queue an unsolicited message for the message callback."""
+        if self._dispatch_task is None:
+            self._dispatch_task = asyncio.create_task(self._dispatch_loop())
+
+        queue = self._dispatch_queue
+        if queue.full():
+            # Backpressure: stop reading until the callback catches up
+            self._dispatch_stalls += 1
+            await queue.put(msg)
+        else:
+            queue.put_nowait(msg)
+        self._dispatch_high_water = max(self._dispatch_high_water, queue.qsize())
+
+    async def _dispatch_loop(self) -> None:
+        """Background task delivering unsolicited messages in arrival order."""
+        queue = self._dispatch_queue
+        # Exits once _stop_dispatch() has let go of this task
+        while self._dispatch_task is asyncio.current_task():
+            msg = await queue.get()
+            try:
+                if self._on_message:
+                    await self._on_message(msg)
+            except Exception:
+                self._dispatch_errors += 1  # Don't let callback errors crash loop
+            finally:
+                self._dispatched += 1
+                queue.task_done()
+
+    async def _stop_dispatch(self) -> None:
+        """Stop the dispatch task and drop anything it hasn't delivered."""
+        task, self._dispatch_task = self._dispatch_task, None
+        # A callback may be the one disconnecting us - that task finishes the
+        # callback and then exits on its own
+        if task and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        while not self._dispatch_queue.empty():
+            self._dispatch_queue.get_nowait()
+            self._dispatch_queue.task_done()
+
+
+class WebSocketConnector(ButtplugConnector):
+    """WebSocket connector for Buttplug server communication.
+
+    ButtplugClient creates one of these when connect() is given a URL. Create
+    it directly to tune batching, codec or validation options.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        batch_window: float | None = None,
+        codec: JsonCodec | None = None,
+        strict: bool = False,
+        flow_control: FlowControl | None = None,
+        dispatch_queue_size: int = 1024,
+    ) -> None:
+        """Initialize connector.
+
+        Args:
+            url: WebSocket URL (e.g., "ws://127.0.0.1:12345")
+            batch_window: Opt-in outbound batching window in seconds.
+            codec: JSON codec for frames. Defaults to the fastest installed codec.
+            strict: Fully validate every incoming message.
+            flow_control: Opt-in bound on device commands in flight.
+            dispatch_queue_size: Unsolicited messages buffered for the message
+                callback before the receive loop waits.
+        """
+        super().__init__(
+            batch_window=batch_window,
+            codec=codec,
+            strict=strict,
+            flow_control=flow_control,
+            dispatch_queue_size=dispatch_queue_size,
+        )
+        self._url = url
+        self._ws: ClientConnection | None = None
+
+    @property
+    def url(self) -> str:
+        """WebSocket URL of the server."""
+        return self._url
+
+    async def _open(self) -> None:
+        """Open the WebSocket connection."""
+        try:
+            self._ws = await websockets.connect(self._url)
+        except Exception as e:
+            raise ButtplugConnectorError(f"Failed to connect to {self._url}: {e}") from e
+
+    async def _close(self) -> None:
+        """Close the WebSocket connection."""
+        if self._ws:
+            ws, self._ws = self._ws, None
+            await ws.close()
+
+    async def _write_frame(self, frame: bytes) -> None:
+        """Write a frame as a WebSocket text frame."""
+        if not self._ws:
+            raise ButtplugConnectorError("Not connected")
+        # Decode to str so the frame goes out as a text frame
+        await self._ws.send(frame.decode())
+
+    async def _read_frame(self) -> bytes | str | None:
+        """Read the next WebSocket frame."""
+        if not self._ws:
+            return None
+        try:
+            return await self._ws.recv()
+        except websockets.exceptions.ConnectionClosed:
+            return None
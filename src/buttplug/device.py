@@ -16,6 +16,7 @@ from buttplug.command import DeviceOutputCommand
 from buttplug.enums import InputType, OutputType
 from buttplug.errors import ButtplugDeviceError, error_from_code
 from buttplug.feature import DeviceFeature
+from buttplug.scheduler import OutputScheduler
 
 if TYPE_CHECKING:
     from buttplug.client import ButtplugClient
@@ -52,6 +53,8 @@ class ButtplugDevice:
             idx: DeviceFeature(client, device_info.device_index, defn)
             for idx, defn in device_info.device_features.items()
         }
+        self._scheduler: OutputScheduler | None = None
+        self._index_features()
 
     @property
     def index(self) -> int:
@@ -82,21 +85,38 @@ class ButtplugDevice:
         """
         return self._features
 
+    @property
+    def output_scheduler(self) -> OutputScheduler:
+        """Latest-value-wins scheduler pacing outputs to message_timing_gap."""
+        if self._scheduler is None:
+            self._scheduler = OutputScheduler(self)
+        return self._scheduler
+
+    @property
+    def output_types(self) -> frozenset[str]:
+        """Output types supported by at least one feature."""
+        return frozenset(self._features_by_output)
+
+    @property
+    def input_types(self) -> frozenset[str]:
+        """Input types supported by at least one feature."""
+        return frozenset(self._features_by_input)
+
     def has_output(self, output_type: OutputType | str) -> bool:
         """Check if device has any feature with the specified output type."""
-        return any(f.has_output(output_type) for f in self._features.values())
+        return output_type in self._features_by_output
 
     def has_input(self, input_type: InputType | str) -> bool:
         """Check if device has any feature with the specified input type."""
-        return any(f.has_input(input_type) for f in self._features.values())
+        return input_type in self._features_by_input
 
     def get_features_with_output(self, output_type: OutputType | str) -> list[DeviceFeature]:
         """Get all features that support a specific output type."""
-        return [f for f in self._features.values() if f.has_output(output_type)]
+        return list(self._features_by_output.get(output_type, ()))
 
     def get_features_with_input(self, input_type: InputType | str) -> list[DeviceFeature]:
         """Get all features that support a specific input type."""
-        return [f for f in self._features.values() if f.has_input(input_type)]
+        return list(self._features_by_input.get(input_type, ()))
 
     # ============ Device-Level Command Methods ============
 
@@ -109,11 +129,33 @@ class ButtplugDevice:
         Raises:
             ButtplugDeviceError: If device has no features matching the output type.
         """
-        features = self.get_features_with_output(command.output_type)
+        features = self._features_by_output.get(command.output_type)
         if not features:
             raise ButtplugDeviceError(f"Device has no {command.output_type.value} features")
+        if len(features) == 1:
+            await features[0].run_output(command)
+            return
         await asyncio.gather(*[f.run_output(command) for f in features])
 
+    def submit_output(self, command: DeviceOutputCommand) -> None:
+        """Schedule an output update for all matching features without waiting.
+
+        Updates are coalesced per feature and output type and sent at most once
+        per message_timing_gap; only the newest value is sent. See
+        OutputScheduler.
+
+        Args:
+            command: The output command specifying type, value, and optional duration.
+
+        Raises:
+            ButtplugDeviceError: If device has no features matching the output type.
+        """
+        features = self._features_by_output.get(command.output_type)
+        if not features:
+            raise ButtplugDeviceError(f"Device has no {command.output_type.value} features")
+        for feature in features:
+            self.output_scheduler.submit(feature, command)
+
     async def stop(self, inputs: bool = True, outputs: bool = True) -> None:
         """Stop device outputs and/or unsubscribe from inputs.
 
@@ -121,9 +163,16 @@ class ButtplugDevice:
             inputs: If True, unsubscribe from all input subscriptions.
             outputs: If True, stop all outputs.
         """
+        if outputs:
+            # Pending updates must not restart the device after it stopped
+            self._discard_scheduled()
+            for feature in self._features.values():
+                feature._acked_outputs.clear()
         msg = StopCmd(id=0, device_index=self.index, inputs=inputs, outputs=outputs)
         response = await self._client._send_device_message(msg)
         self._check_response(response)
+        if outputs:
+            self._forget_outputs()
 
     # ============ Sensor Convenience Methods ============
 
@@ -140,7 +189,7 @@ class ButtplugDevice:
         Raises:
             ButtplugDeviceError: If device has no battery sensor.
         """
-        features = self.get_features_with_input(InputType.BATTERY)
+        features = self._features_by_input.get(InputType.BATTERY)
         if not features:
             raise ButtplugDeviceError("Device has no battery sensor")
         return await features[0].battery()
@@ -158,13 +207,60 @@ class ButtplugDevice:
         Raises:
             ButtplugDeviceError: If device has no RSSI sensor.
         """
-        features = self.get_features_with_input(InputType.RSSI)
+        features = self._features_by_input.get(InputType.RSSI)
         if not features:
             raise ButtplugDeviceError("Device has no RSSI sensor")
         return await features[0].rssi()
 
     # ============ Internal Methods ============
 
+    def _rebind(self, device_info: DeviceInfo) -> None:
+        """Re-bind to fresh device info for the same device (e.g. after a reconnect).
+
+        Feature objects are kept where the feature index still exists.
+        """
+        self._info = device_info
+        features: dict[int, DeviceFeature] = {}
+        for idx, defn in device_info.device_features.items():
+            feature = self._features.get(idx)
+            if feature is None:
+                feature = DeviceFeature(self._client, device_info.device_index, defn)
+            else:
+                feature._rebind(defn)
+            features[idx] = feature
+        self._features = features
+        self._index_features()
+
+    def _index_features(self) -> None:
+        """Build the output/input type to feature lookup tables."""
+        by_output: dict[str, list[DeviceFeature]] = {}
+        by_input: dict[str, list[DeviceFeature]] = {}
+        for feature in self._features.values():
+            for output_name in feature._step_ranges:
+                by_output.setdefault(output_name, []).append(feature)
+            for input_name in feature._input_commands:
+                by_input.setdefault(input_name, []).append(feature)
+        self._features_by_output = by_output
+        self._features_by_input = by_input
+
+    def _forget_outputs(self) -> None:
+        """Clear remembered output state after the device was stopped."""
+        for feature in self._features.values():
+            feature._last_outputs.clear()
+            feature._acked_outputs.clear()
+
+    def _discard_scheduled(
+        self, feature_index: int | None = None, output_type: OutputType | None = None
+    ) -> None:
+        """Drop scheduled output updates that haven't been sent yet."""
+        if self._scheduler is not None:
+            self._scheduler.discard(feature_index, output_type)
+
+    def _detach(self) -> None:
+        """Release background state once the device is gone."""
+        if self._scheduler is not None:
+            self._scheduler.close()
+
     def _check_response(self, response: ButtplugMessage) -> None:
         """Check response and raise if error."""
         if isinstance(response, Error):
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import math
+import time
+from collections.abc import AsyncIterable, Sequence
 from typing import TYPE_CHECKING
 
 from buttplug._messages.device_info import (
@@ -12,8 +15,15 @@ from buttplug._messages.device_info import (
 )
 from buttplug.enums import InputCommandType, InputType, OutputType
 from buttplug.errors import ButtplugDeviceError
+from buttplug.history import SensorHistory
+from buttplug.subscription import InputSubscription, SensorOverflow
 
 if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike, NDArray
+
+    from buttplug._messages import OutputCmd
+    from buttplug._messages.base import ButtplugMessage
     from buttplug.client import ButtplugClient
     from buttplug.command import DeviceOutputCommand
 
@@ -22,6 +32,17 @@ if TYPE_CHECKING:
 CommandValue = float | int
 
 
+class _CachedInput:
+    """Last value read from a sensor, and the read refreshing it."""
+
+    __slots__ = ("value", "timestamp", "pending")
+
+    def __init__(self) -> None:
+        self.value = 0
+        self.timestamp: float | None = None
+        self.pending: asyncio.Task[int] | None = None
+
+
 class DeviceFeature:
     """Represents a single feature of a device.
 
@@ -51,6 +72,17 @@ class DeviceFeature:
         self._client = client
         self._device_index = device_index
         self._definition = definition
+        self._index_definition()
+
+        # Last output command per output type, for restoring after a reconnect
+        self._last_outputs: dict[str, DeviceOutputCommand] = {}
+
+        # Last acknowledged (step, duration) per output type, for skipping
+        # redundant commands when the client caches outputs
+        self._acked_outputs: dict[str, tuple[int, int | None]] = {}
+
+        # Cached sensor reads per input type, used under a ReadCachePolicy
+        self._input_cache: dict[str, _CachedInput] = {}
 
     @property
     def index(self) -> int:
@@ -74,28 +106,17 @@ class DeviceFeature:
 
     def has_output(self, output_type: OutputType | str) -> bool:
         """Check if this feature supports a specific output type."""
-        if self._definition.output is None:
-            return False
-        output_name = output_type.value if isinstance(output_type, OutputType) else output_type
-        return output_name in self._definition.output
+        return output_type in self._step_ranges
 
     def has_input(self, input_type: InputType | str) -> bool:
         """Check if this feature supports a specific input type."""
-        if self._definition.input is None:
-            return False
-        input_name = input_type.value if isinstance(input_type, InputType) else input_type
-        return input_name in self._definition.input
+        return input_type in self._input_commands
 
     def supports_input_command(
         self, input_type: InputType | str, command: InputCommandType
     ) -> bool:
         """Check if this feature supports a specific input command."""
-        if self._definition.input is None:
-            return False
-        input_name = input_type.value if isinstance(input_type, InputType) else input_type
-        if input_name not in self._definition.input:
-            return False
-        return command.value in self._definition.input[input_name].command
+        return command in self._input_commands.get(input_type, ())
 
     def step_range(self, output_type: OutputType | str) -> tuple[int, int] | None:
         """Get the step value range for an output type.
@@ -106,12 +127,7 @@ class DeviceFeature:
         Returns:
             Tuple of (min_step, max_step), or None if output not supported.
         """
-        if self._definition.output is None:
-            return None
-        output_name = output_type.value if isinstance(output_type, OutputType) else output_type
-        if output_name not in self._definition.output:
-            return None
-        return self._definition.output[output_name].value
+        return self._step_ranges.get(output_type)
 
     def step_count(self, output_type: OutputType | str) -> int | None:
         """Get the number of steps for an output type.
@@ -124,7 +140,7 @@ class DeviceFeature:
         Returns:
             Maximum step value, or None if output not supported.
         """
-        step_range = self.step_range(output_type)
+        step_range = self._step_ranges.get(output_type)
         if step_range is None:
             return None
         return step_range[1]
@@ -138,12 +154,7 @@ class DeviceFeature:
         Returns:
             Tuple of (min_ms, max_ms) duration, or None if not supported.
         """
-        if self._definition.output is None:
-            return None
-        output_name = output_type.value if isinstance(output_type, OutputType) else output_type
-        if output_name not in self._definition.output:
-            return None
-        return self._definition.output[output_name].duration
+        return self._duration_ranges.get(output_type)
 
     def convert_to_step(self, output_type: OutputType | str, value: CommandValue) -> int:
         """Convert a command value (float or int) to a step value.
@@ -158,7 +169,7 @@ class DeviceFeature:
         Raises:
             ButtplugDeviceError: If value is out of range or output not supported.
         """
-        step_range = self.step_range(output_type)
+        step_range = self._step_ranges.get(output_type)
         if step_range is None:
             output_name = output_type.value if isinstance(output_type, OutputType) else output_type
             raise ButtplugDeviceError(f"Feature does not support {output_name}")
@@ -185,6 +196,35 @@ class DeviceFeature:
 
         return step
 
+    def convert_to_steps(
+        self, output_type: OutputType | str, values: ArrayLike
+    ) -> NDArray[np.int64]:
+        """Convert a whole array of command values to step values at once.
+
+        Vectorized counterpart of convert_to_step() with identical rounding and
+        validation, for precomputing patterns. Requires NumPy (the "numpy"
+        extra), which is only imported on first use.
+
+        Args:
+            output_type: The output type to convert for.
+            values: Array-like of values. A floating dtype means percentages
+                (-1.0 to 1.0), an integer dtype means step values.
+
+        Returns:
+            Integer array of step values with the same shape.
+
+        Raises:
+            ButtplugDeviceError: If any value is out of range or output not supported.
+            ImportError: If NumPy is not installed.
+        """
+        from buttplug._utils.steps import convert_to_steps
+
+        step_range = self._step_ranges.get(output_type)
+        if step_range is None:
+            output_name = output_type.value if isinstance(output_type, OutputType) else output_type
+            raise ButtplugDeviceError(f"Feature does not support {output_name}")
+        return convert_to_steps(values, step_range)
+
     # ============ Feature-Level Command Methods ============
 
     async def run_output(self, command: DeviceOutputCommand) -> None:
@@ -196,15 +236,55 @@ class DeviceFeature:
         Raises:
             ButtplugDeviceError: If this feature doesn't support the output type.
         """
-        if command.output_type == OutputType.POSITION_WITH_DURATION:
-            await self._send_position_with_duration(command.value, command.duration or 0)
-        else:
-            await self._send_output(command.output_type, command.value)
+        msg, step, duration = self._build_output(command)
+        output_name = command.output_type.value
+        if not self._is_redundant(output_name, step, duration):
+            await self._send_output_cmd(msg, output_name, step, duration)
+        self._last_outputs[output_name] = command
+
+    def submit_output(self, command: DeviceOutputCommand) -> None:
+        """Schedule an output update without waiting for it to be sent.
+
+        Updates are coalesced per output type and sent at most once per the
+        device's message timing gap; only the newest value is sent. See
+        OutputScheduler.
+
+        Args:
+            command: The output command specifying type, value, and optional duration.
+
+        Raises:
+            ButtplugDeviceError: If this feature doesn't support the output type, the
+                value is out of range, or the device is gone.
+        """
+        self._client._output_scheduler(self._device_index).submit(self, command)
+
+    async def stream_output(self, source: AsyncIterable[DeviceOutputCommand]) -> None:
+        """Drive this feature from an async iterable of output commands.
+
+        Each command replaces whatever is still waiting to be sent, so a source
+        producing faster than the device accepts never builds a queue. Returns
+        once the source is exhausted and its last command has been sent.
+
+        Args:
+            source: Async iterable yielding output commands, e.g. an async generator
+                sampling a pattern or a sensor.
+
+        Raises:
+            ButtplugDeviceError: If a command isn't supported by this feature or the
+                device is gone.
+        """
+        async for command in source:
+            self.submit_output(command)
+        await self._client._output_scheduler(self._device_index).drain()
 
     async def stop(self) -> None:
         """Stop this feature's outputs."""
         from buttplug._messages import StopCmd
 
+        device = self._client.devices.get(self._device_index)
+        if device is not None:
+            device._discard_scheduled(self.index)
+
         msg = StopCmd(
             id=0,
             device_index=self._device_index,
@@ -212,8 +292,10 @@ class DeviceFeature:
             outputs=True,
             inputs=False,
         )
+        self._acked_outputs.clear()
         response = await self._client._send_device_message(msg)
         self._check_response(response)
+        self._last_outputs.clear()
 
     async def battery(self) -> float:
         """Read battery level (0.0-1.0)."""
@@ -224,59 +306,220 @@ class DeviceFeature:
         """Read RSSI signal strength (dBm)."""
         return await self._read_input(InputType.RSSI)
 
+    def history(self, input_type: InputType) -> SensorHistory | None:
+        """Get the recorded readings of one of this feature's sensors.
+
+        Readings are only recorded while ButtplugClient.history_size is set.
+
+        Returns:
+            The sensor's history, or None if nothing was recorded for it.
+        """
+        return self._client.sensor_history(self._device_index, self.index, input_type)
+
+    def subscribe(
+        self,
+        input_type: InputType,
+        buffer_size: int = 64,
+        overflow: SensorOverflow = SensorOverflow.KEEP_LATEST,
+    ) -> InputSubscription:
+        """Stream a sensor's readings as the device reports them.
+
+        Readings are pushed by the server at the sensor's native rate, so no
+        read round trips are needed. Use the result as an async context manager
+        so the subscription is released on exit.
+
+        Args:
+            input_type: Sensor to subscribe to (e.g., InputType.PRESSURE).
+            buffer_size: Readings buffered while the consumer is busy.
+            overflow: Policy for new readings once the buffer is full.
+
+        Returns:
+            An async iterator of SensorReading.
+
+        Raises:
+            ButtplugDeviceError: If the sensor can't be subscribed to.
+
+        Example:
+            async with feature.subscribe(InputType.PRESSURE) as readings:
+                async for reading in readings:
+                    print(reading.value)
+        """
+        if not self.supports_input_command(input_type, InputCommandType.SUBSCRIBE):
+            raise ButtplugDeviceError(f"Feature does not support subscribing to {input_type.value}")
+        return InputSubscription(self, input_type, buffer_size, overflow)
+
     # ============ Internal Methods ============
 
-    async def _send_output(self, output_type: OutputType, value: CommandValue) -> None:
-        """Send an output command to this feature."""
-        from buttplug._messages import OutputCmd
+    def _rebind(self, definition: DeviceFeatureDefinition) -> None:
+        """Update the feature definition after the device list was re-sent."""
+        self._definition = definition
+        self._index_definition()
 
-        output_name = output_type.value
-        step = self.convert_to_step(output_type, value)
+    def _index_definition(self) -> None:
+        """Build the capability lookup tables from the definition.
 
-        msg = OutputCmd(
-            id=0,
-            device_index=self._device_index,
-            feature_index=self.index,
-            command={output_name: {"Value": step}},
-        )
-        response = await self._client._send_device_message(msg)
-        self._check_response(response)
+        Keys are the protocol names. OutputType and InputType are str enums that
+        hash and compare like their values, so they can be looked up directly.
+        """
+        outputs = self._definition.output or {}
+        self._step_ranges: dict[str, tuple[int, int]] = {
+            name: defn.value for name, defn in outputs.items()
+        }
+        self._duration_ranges: dict[str, tuple[int, int]] = {
+            name: defn.duration for name, defn in outputs.items() if defn.duration is not None
+        }
+        self._input_commands: dict[str, frozenset[str]] = {
+            name: frozenset(defn.command) for name, defn in (self._definition.input or {}).items()
+        }
+
+    def _build_output(self, command: DeviceOutputCommand) -> tuple[OutputCmd, int, int | None]:
+        """Validate an output command and build its protocol message.
 
-    async def _send_position_with_duration(self, value: CommandValue, duration_ms: int) -> None:
-        """Send position with duration command."""
+        Returns:
+            The message, the step value and the (clamped) duration, if any.
+
+        Raises:
+            ButtplugDeviceError: If the output isn't supported or the value is out
+                of range.
+        """
         from buttplug._messages import OutputCmd
 
-        step = self.convert_to_step(OutputType.POSITION_WITH_DURATION, value)
+        output_name = command.output_type.value
+        step = self.convert_to_step(command.output_type, command.value)
+        duration: int | None = None
+        fields: dict[str, int] = {"Value": step}
 
-        # Clamp duration to allowed range
-        duration_range = self.duration_range(OutputType.POSITION_WITH_DURATION)
-        if duration_range:
-            min_dur, max_dur = duration_range
-            duration_ms = max(min_dur, min(max_dur, duration_ms))
+        if command.output_type == OutputType.POSITION_WITH_DURATION:
+            # Clamp duration to allowed range
+            duration = command.duration or 0
+            duration_range = self._duration_ranges.get(output_name)
+            if duration_range:
+                min_dur, max_dur = duration_range
+                duration = max(min_dur, min(max_dur, duration))
+            fields["Duration"] = duration
 
         msg = OutputCmd(
             id=0,
             device_index=self._device_index,
             feature_index=self.index,
-            command={"HwPositionWithDuration": {"Value": step, "Duration": duration_ms}},
+            command={output_name: fields},
         )
-        response = await self._client._send_device_message(msg)
-        self._check_response(response)
+        return msg, step, duration
+
+    def _is_redundant(self, output_name: str, step: int, duration: int | None) -> bool:
+        """Check the output cache, counting the command if it can be skipped."""
+        if not self._client.cache_outputs:
+            return False
+        if self._acked_outputs.get(output_name) != (step, duration):
+            return False
+        self._client._record_suppressed_output()
+        return True
+
+    def _quantize(self, output_type: OutputType, values: Sequence[CommandValue]) -> list[int]:
+        """Convert a series of values to steps, vectorized for NumPy arrays.
+
+        Internal method used by PatternPlayer and MotionPlanner.
+        """
+        if hasattr(values, "dtype"):
+            # The array's dtype decides between percent and steps, as it would
+            # for the scalar types
+            return [int(step) for step in self.convert_to_steps(output_type, values).tolist()]
+        return [self.convert_to_step(output_type, value) for value in values]
+
+    def _record_output(self, command: DeviceOutputCommand, step: int, duration: int | None) -> None:
+        """Remember an output command the server accepted."""
+        output_name = command.output_type.value
+        self._last_outputs[output_name] = command
+        if self._client.cache_outputs:
+            self._acked_outputs[output_name] = (step, duration)
+
+    async def _send_output_cmd(
+        self, msg: OutputCmd, output_name: str, step: int, duration: int | None
+    ) -> None:
+        """Send an output command and record the step the device is now at."""
+        # Unknown until acknowledged, and stays unknown if the send fails
+        self._acked_outputs.pop(output_name, None)
+        response = await self._client._send_device_output(msg)
+        if response is not None:
+            self._check_response(response)
+        if self._client.cache_outputs:
+            self._acked_outputs[output_name] = (step, duration)
 
     async def _read_input(self, input_type: InputType) -> int:
-        """Read raw input value."""
-        from buttplug._messages import Error, InputCmd, InputReading
+        """Read raw input value, from cache if the client's read_cache allows."""
+        policy = self._client.read_cache
+        if policy is None:
+            return await self._fetch_input(input_type)
+
+        entry = self._input_cache.get(input_type.value)
+        if entry is None:
+            entry = self._input_cache[input_type.value] = _CachedInput()
+        if entry.timestamp is not None:
+            age = time.monotonic() - entry.timestamp
+            if age <= policy.ttl:
+                self._client._record_read("hits")
+                return entry.value
+            if policy.max_stale is None or age <= policy.ttl + policy.max_stale:
+                self._client._record_read("stale_hits")
+                if entry.pending is None:
+                    self._client._record_read("refreshes")
+                    self._refresh_input(input_type, entry)
+                return entry.value
+
+        self._client._record_read("misses")
+        if entry.pending is None:
+            pending = self._refresh_input(input_type, entry)
+        else:
+            self._client._record_read("collapsed")
+            pending = entry.pending
+        # Shielded so one caller giving up doesn't fail the others
+        return await asyncio.shield(pending)
+
+    def _refresh_input(self, input_type: InputType, entry: _CachedInput) -> asyncio.Task[int]:
+        """Start the one read shared by everyone waiting on a sensor."""
+        task = asyncio.get_running_loop().create_task(self._fetch_input(input_type))
+        entry.pending = task
+
+        def done(task: asyncio.Task[int]) -> None:
+            entry.pending = None
+            if not task.cancelled() and task.exception() is None:
+                entry.value = task.result()
+                entry.timestamp = time.monotonic()
+
+        task.add_done_callback(done)
+        return task
+
+    async def _fetch_input(self, input_type: InputType) -> int:
+        """Read raw input value from the server."""
+        from buttplug._messages import InputReading
 
         input_name = input_type.value
         if not self.has_input(input_type):
             raise ButtplugDeviceError(f"Feature does not support {input_name} input")
 
+        response = await self._send_input_cmd(input_type, InputCommandType.READ)
+
+        if not isinstance(response, InputReading):
+            raise ButtplugDeviceError(f"Unexpected response: {type(response).__name__}")
+        self._client._record_reading(response)
+
+        if input_name not in response.reading:
+            raise ButtplugDeviceError(f"Invalid {input_name} reading response")
+
+        return response.reading[input_name].value
+
+    async def _send_input_cmd(
+        self, input_type: InputType, command: InputCommandType
+    ) -> ButtplugMessage:
+        """Send an InputCmd, raising if the server answers with an error."""
+        from buttplug._messages import Error, InputCmd
+
         msg = InputCmd(
             id=0,
             device_index=self._device_index,
             feature_index=self.index,
-            input_type=input_name,
-            command=InputCommandType.READ.value,
+            input_type=input_type.value,
+            command=command.value,
         )
         response = await self._client._send_device_message(msg)
 
@@ -284,14 +527,7 @@ class DeviceFeature:
             from buttplug.errors import error_from_code
 
             raise error_from_code(response.error_code, response.error_message)
-
-        if not isinstance(response, InputReading):
-            raise ButtplugDeviceError(f"Unexpected response: {type(response).__name__}")
-
-        if input_name not in response.reading:
-            raise ButtplugDeviceError(f"Invalid {input_name} reading response")
-
-        return response.reading[input_name].value
+        return response
 
     def _check_response(self, response: object) -> None:
         """Check response and raise if error."""
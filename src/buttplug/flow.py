@@ -0,0 +1,53 @@
+"""Flow control for outgoing device commands."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from buttplug.enums import StrEnum
+
+
+class OverflowPolicy(StrEnum):
+    """What to do with a new command when the send queue is full."""
+
+    REJECT = "reject"
+    """Fail the new command with ButtplugConnectorError."""
+
+    DROP_OLDEST = "drop_oldest"
+    """Fail the oldest queued command and queue the new one."""
+
+    REPLACE = "replace"
+    """Replace a queued command for the same feature and output type.
+
+    Coalescing happens whenever a matching command is queued, not only once
+    the queue is full, so a feature never has more than one stale command
+    waiting. The replaced command's caller gets the newer command's response.
+    Without a match, a full queue rejects the new command.
+    """
+
+
+@dataclass(frozen=True)
+class FlowControl:
+    """Bounded in-flight window for OutputCmd and InputCmd messages.
+
+    At most max_in_flight device commands wait for a response at any time.
+    Further commands wait in a send queue, which applies backpressure by
+    suspending their callers until a slot frees up. Pipelined commands hold a
+    slot until the server acknowledges them. StopCmd and control messages
+    (handshake, ping, scanning) always bypass the queue.
+
+    Args:
+        max_in_flight: Device commands allowed on the wire at once.
+        max_queued: Commands allowed to wait for a slot.
+        overflow: Policy for new commands once max_queued is reached.
+    """
+
+    max_in_flight: int = 32
+    max_queued: int = 256
+    overflow: OverflowPolicy = OverflowPolicy.REJECT
+
+    def __post_init__(self) -> None:
+        if self.max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        if self.max_queued < 0:
+            raise ValueError("max_queued must not be negative")
@@ -0,0 +1,156 @@
+"""Fixed-size sensor reading history with decimation for plotting."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+
+@dataclass(frozen=True)
+class DecimatedHistory:
+    """A history reduced to per-bucket statistics.
+
+    Args:
+        timestamps: Time of the first reading in each bucket.
+        minimums: Smallest value in each bucket.
+        maximums: Largest value in each bucket.
+        means: Average value in each bucket.
+    """
+
+    timestamps: list[float]
+    minimums: list[float]
+    maximums: list[float]
+    means: list[float]
+
+
+class SensorHistory:
+    """Ring buffer of the most recent (timestamp, value) readings of a sensor.
+
+    Storage is two preallocated array('d') buffers of twice the capacity.
+    Every reading is written at its slot and at the slot plus the capacity,
+    so the newest readings are always one contiguous slice and snapshots are
+    views rather than copies. Memory stays constant however long readings
+    keep arriving.
+
+    The views share the buffer: copy them if you keep them while more
+    readings arrive.
+    """
+
+    __slots__ = ("_capacity", "_timestamps", "_values", "_next", "_count", "_total")
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """Initialize history.
+
+        Args:
+            capacity: Readings kept; older ones are overwritten.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._timestamps = array("d", bytes(16 * capacity))
+        self._values = array("d", bytes(16 * capacity))
+        self._next = 0
+        self._count = 0
+        self._total = 0
+
+    @property
+    def capacity(self) -> int:
+        """Readings kept."""
+        return self._capacity
+
+    @property
+    def total(self) -> int:
+        """Readings appended since creation or the last clear()."""
+        return self._total
+
+    @property
+    def timestamps(self) -> memoryview:
+        """Timestamps of the kept readings, oldest first (a zero-copy view)."""
+        start, stop = self._window()
+        return memoryview(self._timestamps)[start:stop]
+
+    @property
+    def values(self) -> memoryview:
+        """Values of the kept readings, oldest first (a zero-copy view)."""
+        start, stop = self._window()
+        return memoryview(self._values)[start:stop]
+
+    @property
+    def latest(self) -> tuple[float, float] | None:
+        """(timestamp, value) of the newest reading, or None if empty."""
+        if not self._count:
+            return None
+        index = self._next - 1 + self._capacity
+        return self._timestamps[index], self._values[index]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Record a reading, overwriting the oldest one once full."""
+        index = self._next
+        self._timestamps[index] = self._timestamps[index + self._capacity] = timestamp
+        self._values[index] = self._values[index + self._capacity] = value
+        self._next = index + 1 if index + 1 < self._capacity else 0
+        if self._count < self._capacity:
+            self._count += 1
+        self._total += 1
+
+    def clear(self) -> None:
+        """Forget all readings."""
+        self._next = 0
+        self._count = 0
+        self._total = 0
+
+    def arrays(self) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Timestamps and values as NumPy arrays sharing the buffer. Requires NumPy."""
+        import numpy as np
+
+        start, stop = self._window()
+        timestamps = np.frombuffer(self._timestamps, dtype=np.float64)[start:stop]
+        values = np.frombuffer(self._values, dtype=np.float64)[start:stop]
+        return timestamps, values
+
+    def decimate(self, buckets: int) -> DecimatedHistory:
+        """Reduce the kept readings to at most buckets points for plotting.
+
+        Readings are split into buckets of (nearly) equal count. Keeping the
+        minimum and maximum of each preserves spikes a plain subsample would
+        miss.
+
+        Args:
+            buckets: Maximum number of points to return.
+
+        Raises:
+            ValueError: If buckets is not positive.
+        """
+        if buckets < 1:
+            raise ValueError("buckets must be at least 1")
+        timestamps, values = self.timestamps, self.values
+        count = len(values)
+        buckets = min(buckets, count)
+        result = DecimatedHistory([], [], [], [])
+        for bucket in range(buckets):
+            start = bucket * count // buckets
+            stop = (bucket + 1) * count // buckets
+            chunk = values[start:stop]
+            result.timestamps.append(timestamps[start])
+            result.minimums.append(min(chunk))
+            result.maximums.append(max(chunk))
+            result.means.append(sum(chunk) / len(chunk))
+        return result
+
+    # ============ Internal Methods ============
+
+    def _window(self) -> tuple[int, int]:
+        """Slice of the doubled buffers holding the kept readings."""
+        stop = self._next + self._capacity
+        return stop - self._count, stop
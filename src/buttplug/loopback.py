@@ -0,0 +1,301 @@
+"""In-process loopback transport and server stand-in.
+
+LoopbackConnector speaks the full Buttplug wire format (encoded JSON-array
+frames) to a LoopbackServer living in the same event loop, passing frames
+through memory queues instead of a socket. Useful for tests, for measuring
+pure client overhead without network noise, and for embedding the client
+next to a Python-side server.
+
+Example:
+    server = LoopbackServer(devices={"0": {...}})
+    client = ButtplugClient("My App")
+    await client.connect(LoopbackConnector(server))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from typing import Any
+
+from buttplug.codec import JsonCodec, StdlibJsonCodec
+from buttplug.connector import ButtplugConnector
+from buttplug.enums import ErrorCode
+from buttplug.errors import ButtplugConnectorError
+from buttplug.flow import FlowControl
+
+
+class _LoopbackSession:
+    """One client connection to a LoopbackServer."""
+
+    __slots__ = ("outgoing", "closed")
+
+    def __init__(self) -> None:
+        self.outgoing: asyncio.Queue[bytes | None] = asyncio.Queue()
+        self.closed = False
+
+
+class LoopbackServer:
+    """Minimal Buttplug server that lives in the client's event loop.
+
+    Answers the handshake, device list, ping and scanning requests, acks
+    output and stop commands for known devices, answers sensor reads and
+    records every message it receives. Devices are given in protocol format,
+    i.e. the value of a DeviceList message's "Devices" field.
+    """
+
+    def __init__(
+        self,
+        devices: dict[str, dict[str, Any]] | None = None,
+        server_name: str = "Loopback Server",
+        max_ping_time: int = 0,
+        codec: JsonCodec | None = None,
+    ) -> None:
+        """Initialize server.
+
+        Args:
+            devices: Devices by index string, in protocol format.
+            server_name: Name reported in ServerInfo.
+            max_ping_time: MaxPingTime reported in ServerInfo (0 disables pings).
+            codec: JSON codec for frames. Defaults to the standard library codec.
+        """
+        self._devices: dict[str, dict[str, Any]] = copy.deepcopy(devices or {})
+        self._server_name = server_name
+        self._max_ping_time = max_ping_time
+        self._codec = codec or StdlibJsonCodec()
+        self._sessions: list[_LoopbackSession] = []
+
+        self.received: list[tuple[str, dict[str, Any]]] = []
+        """Every message received, as (message type, fields) pairs."""
+
+        self.outputs: dict[tuple[int, int], dict[str, Any]] = {}
+        """Last output command per (device index, feature index)."""
+
+        self.readings: dict[tuple[int, int, str], int] = {}
+        """Values returned for sensor reads per (device, feature, input type)."""
+
+    @property
+    def devices(self) -> dict[str, dict[str, Any]]:
+        """Devices currently exposed by the server, in protocol format."""
+        return self._devices
+
+    @property
+    def connection_count(self) -> int:
+        """Number of open client connections."""
+        return len(self._sessions)
+
+    def count(self, message_type: str) -> int:
+        """Get how many messages of the given type were received."""
+        return sum(1 for name, _ in self.received if name == message_type)
+
+    def set_reading(
+        self, device_index: int, feature_index: int, input_type: str, value: int
+    ) -> None:
+        """Set the value returned when a sensor is read."""
+        self.readings[(device_index, feature_index, input_type)] = value
+
+    def add_device(self, device: dict[str, Any]) -> None:
+        """Expose a new device and announce it to connected clients."""
+        self._devices[str(device["DeviceIndex"])] = copy.deepcopy(device)
+        self._broadcast(self._device_list(0))
+
+    def remove_device(self, device_index: int) -> None:
+        """Remove a device and announce it to connected clients."""
+        self._devices.pop(str(device_index), None)
+        self._broadcast(self._device_list(0))
+
+    def push_reading(
+        self, device_index: int, feature_index: int, input_type: str, value: int
+    ) -> None:
+        """Send an unsolicited InputReading, as for a subscribed sensor."""
+        self._broadcast(self._reading(0, device_index, feature_index, input_type, value))
+
+    def drop_connections(self) -> None:
+        """Close every client connection, as if the link failed."""
+        sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.closed = True
+            session.outgoing.put_nowait(None)
+
+    # ============ Connector Side ============
+
+    def _open(self) -> _LoopbackSession:
+        """Accept a new client connection."""
+        session = _LoopbackSession()
+        self._sessions.append(session)
+        return session
+
+    def _close(self, session: _LoopbackSession) -> None:
+        """Close a client connection from the client side."""
+        session.closed = True
+        if session in self._sessions:
+            self._sessions.remove(session)
+
+    def _receive(self, session: _LoopbackSession, frame: bytes) -> None:
+        """Handle a frame from a client and queue the reply frame."""
+        replies = []
+        for message in self._codec.decode(frame):
+            ((name, fields),) = message.items()
+            self.received.append((name, fields))
+            replies.append(self._reply(name, fields))
+        session.outgoing.put_nowait(self._codec.encode(replies))
+
+    def _broadcast(self, message: dict[str, Any]) -> None:
+        """Queue a single-message frame for every connected client."""
+        frame = self._codec.encode([message])
+        for session in self._sessions:
+            session.outgoing.put_nowait(frame)
+
+    # ============ Protocol ============
+
+    def _reply(self, name: str, fields: dict[str, Any]) -> dict[str, Any]:
+        """Build the reply to a single message."""
+        msg_id = fields.get("Id", 0)
+        if name == "RequestServerInfo":
+            return {
+                "ServerInfo": {
+                    "Id": msg_id,
+                    "ServerName": self._server_name,
+                    "MaxPingTime": self._max_ping_time,
+                    "ProtocolVersionMajor": 4,
+                    "ProtocolVersionMinor": 0,
+                }
+            }
+        if name == "RequestDeviceList":
+            return self._device_list(msg_id)
+        if name in ("Ping", "StartScanning", "StopScanning", "Disconnect"):
+            return {"Ok": {"Id": msg_id}}
+        if name == "OutputCmd":
+            return self._output(msg_id, fields)
+        if name == "InputCmd":
+            return self._input(msg_id, fields)
+        if name == "StopCmd":
+            return self._stop(msg_id, fields)
+        return self._error(msg_id, ErrorCode.MSG, f"Unsupported message type: {name}")
+
+    def _output(self, msg_id: int, fields: dict[str, Any]) -> dict[str, Any]:
+        """Record an output command for a known feature."""
+        device_index, feature_index = fields["DeviceIndex"], fields["FeatureIndex"]
+        feature = self._feature(device_index, feature_index)
+        command = fields["Command"]
+        supported = feature.get("Output") or {} if feature is not None else {}
+        if not all(output_type in supported for output_type in command):
+            return self._error(msg_id, ErrorCode.DEVICE, "Output not supported")
+        self.outputs[(device_index, feature_index)] = command
+        return {"Ok": {"Id": msg_id}}
+
+    def _input(self, msg_id: int, fields: dict[str, Any]) -> dict[str, Any]:
+        """Answer a sensor read, or ack a subscribe/unsubscribe."""
+        device_index, feature_index = fields["DeviceIndex"], fields["FeatureIndex"]
+        input_type = fields["Type"]
+        feature = self._feature(device_index, feature_index)
+        if feature is None or input_type not in (feature.get("Input") or {}):
+            return self._error(msg_id, ErrorCode.DEVICE, "Input not supported")
+        if fields["Command"] != "Read":
+            return {"Ok": {"Id": msg_id}}
+        value = self.readings.get((device_index, feature_index, input_type), 0)
+        return self._reading(msg_id, device_index, feature_index, input_type, value)
+
+    def _stop(self, msg_id: int, fields: dict[str, Any]) -> dict[str, Any]:
+        """Forget output state for the stopped devices and features."""
+        device_index = fields.get("DeviceIndex")
+        feature_index = fields.get("FeatureIndex")
+        if fields.get("Outputs", True):
+            for key in list(self.outputs):
+                if device_index is not None and key[0] != device_index:
+                    continue
+                if feature_index is not None and key[1] != feature_index:
+                    continue
+                del self.outputs[key]
+        return {"Ok": {"Id": msg_id}}
+
+    def _feature(self, device_index: int, feature_index: int) -> dict[str, Any] | None:
+        """Look up a feature definition, or None if it doesn't exist."""
+        device = self._devices.get(str(device_index))
+        if device is None:
+            return None
+        feature: dict[str, Any] | None = device.get("DeviceFeatures", {}).get(str(feature_index))
+        return feature
+
+    def _device_list(self, msg_id: int) -> dict[str, Any]:
+        return {"DeviceList": {"Id": msg_id, "Devices": self._devices}}
+
+    def _reading(
+        self, msg_id: int, device_index: int, feature_index: int, input_type: str, value: int
+    ) -> dict[str, Any]:
+        return {
+            "InputReading": {
+                "Id": msg_id,
+                "DeviceIndex": device_index,
+                "FeatureIndex": feature_index,
+                "Reading": {input_type: {"Value": value}},
+            }
+        }
+
+    def _error(self, msg_id: int, code: ErrorCode, message: str) -> dict[str, Any]:
+        return {"Error": {"Id": msg_id, "ErrorCode": int(code), "ErrorMessage": message}}
+
+
+class LoopbackConnector(ButtplugConnector):
+    """Connector talking to a LoopbackServer through memory queues.
+
+    Frames are encoded and decoded exactly as on a WebSocket, so everything
+    but the socket itself is exercised.
+    """
+
+    def __init__(
+        self,
+        server: LoopbackServer,
+        batch_window: float | None = None,
+        codec: JsonCodec | None = None,
+        strict: bool = False,
+        flow_control: FlowControl | None = None,
+        dispatch_queue_size: int = 1024,
+    ) -> None:
+        """Initialize connector.
+
+        Args:
+            server: Server to connect to.
+            batch_window: Opt-in outbound batching window in seconds.
+            codec: JSON codec for frames. Defaults to the fastest installed codec.
+            strict: Fully validate every incoming message.
+            flow_control: Opt-in bound on device commands in flight.
+            dispatch_queue_size: Unsolicited messages buffered for the message
+                callback before the receive loop waits.
+        """
+        super().__init__(
+            batch_window=batch_window,
+            codec=codec,
+            strict=strict,
+            flow_control=flow_control,
+            dispatch_queue_size=dispatch_queue_size,
+        )
+        self._server = server
+        self._session: _LoopbackSession | None = None
+
+    @property
+    def server(self) -> LoopbackServer:
+        """Server this connector talks to."""
+        return self._server
+
+    async def _open(self) -> None:
+        """Open a session on the server."""
+        self._session = self._server._open()
+
+    async def _close(self) -> None:
+        """Close the session."""
+        if self._session:
+            session, self._session = self._session, None
+            self._server._close(session)
+
+    async def _write_frame(self, frame: bytes) -> None:
+        """Hand a frame to the server."""
+        if not self._session or self._session.closed:
+            raise ButtplugConnectorError("Connection closed")
+        self._server._receive(self._session, frame)
+
+    async def _read_frame(self) -> bytes | str | None:
+        """Wait for the next frame from the server."""
+        if not self._session:
+            return None
+        return await self._session.outgoing.get()
@@ -0,0 +1,295 @@
+"""Trajectory simplification and velocity-limited planning for position outputs."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from buttplug.enums import OutputType
+from buttplug.errors import ButtplugDeviceError
+from buttplug.playback import Pattern
+from buttplug.stats import MotionPlanStats
+from buttplug.trajectory import Trajectory
+
+if TYPE_CHECKING:
+    from buttplug.feature import DeviceFeature
+
+_POSITION_OUTPUTS = (OutputType.POSITION, OutputType.POSITION_WITH_DURATION)
+
+
+@dataclass(frozen=True)
+class Move:
+    """One position command of a plan: reach a step by a time.
+
+    Args:
+        start: Seconds from the start of the media when the move begins.
+        end: Seconds from the start of the media when the step is reached.
+        step: Target position step.
+    """
+
+    start: float
+    end: float
+    step: int
+
+    @property
+    def duration(self) -> float:
+        """Length of the move in seconds."""
+        return self.end - self.start
+
+
+@dataclass(frozen=True)
+class MotionPlan:
+    """Moves planned for one feature, and how much the input was compressed.
+
+    Args:
+        moves: Moves in time order. The first one runs from 0 to the first
+            point, bringing the device into position.
+        stats: Point and move counts, and how often the limits applied.
+    """
+
+    moves: tuple[Move, ...]
+    stats: MotionPlanStats
+
+
+class MotionPlanner:
+    """Turns dense position streams into fewer, longer moves a device can follow.
+
+    Planning happens in the feature's step space:
+
+    1. Points are quantized to steps, so jitter below one step disappears.
+    2. The path is simplified with Ramer-Douglas-Peucker, dropping every point
+       within tolerance steps of the line between the points kept around it.
+       Error is measured vertically (in steps at the point's time) rather than
+       perpendicularly, since time and steps have unrelated units.
+    3. Each segment's velocity is clamped to max_velocity, and its change from
+       the previous segment's velocity to max_acceleration times its duration.
+       Limited segments fall short of their target instead of running late,
+       so the motion stays in sync with the media.
+    4. Runs of segments that are collinear within tolerance are merged into a
+       single move, up to the feature's maximum move duration. Segments still
+       longer than that are split.
+
+    Example:
+        planner = MotionPlanner(tolerance=2, max_velocity=400)
+        plan = planner.plan(stroker, Trajectory.from_funscript(text))
+        print(plan.stats.compression_ratio)
+    """
+
+    def __init__(
+        self,
+        tolerance: float = 1.0,
+        max_velocity: float | None = None,
+        max_acceleration: float | None = None,
+        output_type: OutputType = OutputType.POSITION_WITH_DURATION,
+    ) -> None:
+        """Configure the planner.
+
+        Args:
+            tolerance: Largest deviation from the input path, in steps, that
+                simplification and merging may introduce.
+            max_velocity: Fastest the device can move, in steps per second.
+            max_acceleration: Fastest the device can change velocity, in steps
+                per second squared.
+            output_type: Position output whose step and duration ranges to plan
+                for: OutputType.POSITION_WITH_DURATION or OutputType.POSITION.
+
+        Raises:
+            ValueError: If an option is out of range.
+        """
+        if tolerance < 0:
+            raise ValueError("tolerance must be >= 0")
+        if max_velocity is not None and max_velocity <= 0:
+            raise ValueError("max_velocity must be positive")
+        if max_acceleration is not None and max_acceleration <= 0:
+            raise ValueError("max_acceleration must be positive")
+        if output_type not in _POSITION_OUTPUTS:
+            raise ValueError("output_type must be a position output")
+
+        self._tolerance = tolerance
+        self._max_velocity = max_velocity
+        self._max_acceleration = max_acceleration
+        self._output_type = output_type
+
+    @property
+    def tolerance(self) -> float:
+        """Largest deviation from the input path, in steps."""
+        return self._tolerance
+
+    @property
+    def max_velocity(self) -> float | None:
+        """Velocity limit in steps per second, or None."""
+        return self._max_velocity
+
+    @property
+    def max_acceleration(self) -> float | None:
+        """Acceleration limit in steps per second squared, or None."""
+        return self._max_acceleration
+
+    @property
+    def output_type(self) -> OutputType:
+        """Position output planned for."""
+        return self._output_type
+
+    def plan(self, feature: DeviceFeature, source: Trajectory | Pattern) -> MotionPlan:
+        """Plan moves for a feature.
+
+        Args:
+            feature: Feature with the planner's position output.
+            source: Positions to follow. Trajectory positions are 0-100; Pattern
+                values are command values, and are treated as points on a path
+                rather than held levels.
+
+        Returns:
+            The planned moves and compression stats.
+
+        Raises:
+            ButtplugDeviceError: If the feature lacks the output, or a position
+                is out of range.
+        """
+        output_type = self._output_type
+        step_range = feature.step_range(output_type)
+        if step_range is None:
+            raise ButtplugDeviceError(f"Feature does not support {output_type.value}")
+        duration_range = feature.duration_range(output_type)
+        max_duration = duration_range[1] / 1000.0 if duration_range else math.inf
+
+        if isinstance(source, Trajectory):
+            times = [action.at / 1000.0 for action in source.actions]
+            steps = [
+                feature.convert_to_step(output_type, action.pos / 100.0)
+                for action in source.actions
+            ]
+        else:
+            times = [float(t) for t in source.timestamps]
+            steps = feature._quantize(output_type, source.values)
+
+        kept = _simplify(times, [float(step) for step in steps], self._tolerance)
+        times = [times[i] for i in kept]
+        positions, velocity_limited, acceleration_limited = self._limit(
+            times, [float(steps[i]) for i in kept]
+        )
+        min_step, max_step = step_range
+        quantized = [min(max(round(position), min_step), max_step) for position in positions]
+        kept = _merge(times, quantized, self._tolerance, max_duration)
+
+        moves = [Move(0.0, times[0], quantized[0])]
+        for previous, index in zip(kept, kept[1:]):
+            moves.extend(
+                _split(
+                    times[previous],
+                    times[index],
+                    quantized[previous],
+                    quantized[index],
+                    max_duration,
+                )
+            )
+
+        stats = MotionPlanStats(
+            points=len(steps),
+            moves=len(moves),
+            velocity_limited=velocity_limited,
+            acceleration_limited=acceleration_limited,
+        )
+        return MotionPlan(tuple(moves), stats)
+
+    # ============ Internal Methods ============
+
+    def _limit(self, times: list[float], positions: list[float]) -> tuple[list[float], int, int]:
+        """Clamp segment velocities and accelerations, returning positions reached."""
+        max_velocity = self._max_velocity
+        max_acceleration = self._max_acceleration
+        reached = [positions[0]]
+        velocity = 0.0
+        velocity_limited = acceleration_limited = 0
+
+        for i in range(1, len(times)):
+            dt = times[i] - times[i - 1]
+            if dt <= 0:
+                # An instantaneous jump can only be followed without limits
+                limited = max_velocity is not None or max_acceleration is not None
+                reached.append(reached[-1] if limited else positions[i])
+                continue
+
+            wanted = (positions[i] - reached[-1]) / dt
+            new_velocity = wanted
+            if max_velocity is not None and abs(new_velocity) > max_velocity:
+                new_velocity = math.copysign(max_velocity, new_velocity)
+                velocity_limited += 1
+            if max_acceleration is not None:
+                change = max_acceleration * dt
+                clamped = min(max(new_velocity, velocity - change), velocity + change)
+                if clamped != new_velocity:
+                    new_velocity = clamped
+                    acceleration_limited += 1
+
+            velocity = new_velocity
+            reached.append(reached[-1] + velocity * dt)
+
+        return reached, velocity_limited, acceleration_limited
+
+
+def _deviation(
+    times: list[float], positions: list[float] | list[int], first: int, last: int, index: int
+) -> float:
+    """Vertical distance of a point from the line between two others."""
+    t0, t1 = times[first], times[last]
+    y0, y1 = positions[first], positions[last]
+    expected = y1 if t1 <= t0 else y0 + (y1 - y0) * (times[index] - t0) / (t1 - t0)
+    return abs(positions[index] - expected)
+
+
+def _simplify(times: list[float], positions: list[float], tolerance: float) -> list[int]:
+    """Ramer-Douglas-Peucker: indices of the points that must be kept."""
+    count = len(times)
+    keep = [False] * count
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        worst, split = tolerance, -1
+        for index in range(first + 1, last):
+            deviation = _deviation(times, positions, first, last, index)
+            if deviation > worst:
+                worst, split = deviation, index
+        if split >= 0:
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return [index for index in range(count) if keep[index]]
+
+
+def _merge(
+    times: list[float], steps: list[int], tolerance: float, max_duration: float
+) -> list[int]:
+    """Greedily extend each move over collinear points, up to max_duration."""
+    kept = [0]
+    anchor = 0
+    for end in range(2, len(times)):
+        fits = times[end] - times[anchor] <= max_duration and all(
+            _deviation(times, steps, anchor, end, index) <= tolerance
+            for index in range(anchor + 1, end)
+        )
+        if not fits:
+            anchor = end - 1
+            kept.append(anchor)
+    if len(times) > 1:
+        kept.append(len(times) - 1)
+    return kept
+
+
+def _split(
+    start: float, end: float, from_step: int, to_step: int, max_duration: float
+) -> list[Move]:
+    """A segment as moves no longer than max_duration."""
+    pieces = 1
+    if end - start > max_duration:
+        pieces = int((end - start) // max_duration) + 1
+    return [
+        Move(
+            start + (end - start) * (piece - 1) / pieces,
+            start + (end - start) * piece / pieces,
+            round(from_step + (to_step - from_step) * piece / pieces),
+        )
+        for piece in range(1, pieces + 1)
+    ]
@@ -0,0 +1,426 @@
+"""Time-series pattern playback on device features."""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from buttplug._utils.clock import Alarm, PlaybackClock
+from buttplug.command import DeviceOutputCommand
+from buttplug.enums import OutputType
+from buttplug.stats import PlaybackStats
+
+if TYPE_CHECKING:
+    from buttplug.feature import CommandValue, DeviceFeature
+
+# Timer callbacks may fire up to a clock tick early; positions are evaluated
+# this many seconds ahead so a wakeup at a deadline always sees its event
+_TIMER_SLACK = 1e-6
+
+
+@dataclass(frozen=True)
+class Pattern:
+    """A waveform for one output: values at points in time.
+
+    Each value holds from its timestamp until the next one. Build smooth
+    patterns with sampled() or keyframes().
+
+    Args:
+        timestamps: Seconds from the start of the pattern, non-decreasing.
+        values: Command values, one per timestamp. Floats are percentages,
+            ints are steps (as for DeviceOutputCommand). NumPy arrays are
+            quantized in one vectorized pass.
+        duration: Length of the pattern in seconds, i.e. when a loop restarts.
+            Defaults to the last timestamp.
+    """
+
+    timestamps: Sequence[float]
+    values: Sequence[CommandValue]
+    duration: float | None = None
+
+    def __post_init__(self) -> None:
+        if len(self.timestamps) == 0:
+            raise ValueError("Pattern must have at least one value")
+        if len(self.timestamps) != len(self.values):
+            raise ValueError("Pattern needs exactly one value per timestamp")
+        if self.timestamps[0] < 0:
+            raise ValueError("Pattern timestamps must not be negative")
+        if any(b < a for a, b in zip(self.timestamps, self.timestamps[1:])):
+            raise ValueError("Pattern timestamps must be non-decreasing")
+        if self.duration is not None and self.duration < self.timestamps[-1]:
+            raise ValueError("Pattern duration must not end before its last timestamp")
+
+    @property
+    def length(self) -> float:
+        """Length of the pattern in seconds."""
+        return self.duration if self.duration is not None else float(self.timestamps[-1])
+
+    @classmethod
+    def sampled(cls, values: Sequence[CommandValue], rate: float) -> Pattern:
+        """Create a pattern from evenly spaced samples.
+
+        Args:
+            values: Samples, the first one at time 0.
+            rate: Samples per second.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        return cls([i / rate for i in range(len(values))], values, len(values) / rate)
+
+    @classmethod
+    def keyframes(cls, keyframes: Iterable[tuple[float, float]], rate: float) -> Pattern:
+        """Create a pattern by linearly interpolating (time, percent) keyframes.
+
+        Args:
+            keyframes: (seconds, value) pairs, sorted by time.
+            rate: Samples per second to interpolate at.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        # Keyframe values are percents even when given as ints, never raw steps
+        points = [(t, float(v)) for t, v in keyframes]
+        if not points:
+            raise ValueError("Pattern must have at least one keyframe")
+        end = points[-1][0]
+        times = [i / rate for i in range(int(end * rate) + 1)]
+        if times[-1] < end:
+            times.append(end)
+
+        values = []
+        segment = 0
+        for t in times:
+            while segment < len(points) - 1 and points[segment + 1][0] <= t:
+                segment += 1
+            t0, v0 = points[segment]
+            if segment == len(points) - 1 or t <= t0:
+                values.append(v0)
+                continue
+            t1, v1 = points[segment + 1]
+            values.append(v0 + (v1 - v0) * (t - t0) / (t1 - t0))
+        return cls(times, values)
+
+
+class _Track:
+    """A pattern pre-quantized for one feature output."""
+
+    __slots__ = ("feature", "output_type", "times", "steps", "sent", "last_step")
+
+    def __init__(self, feature: DeviceFeature, output_type: OutputType, pattern: Pattern) -> None:
+        self.feature = feature
+        self.output_type = output_type
+        steps = feature._quantize(output_type, pattern.values)
+
+        # Drop events that don't change the step
+        self.times: list[float] = []
+        self.steps: list[int] = []
+        for t, step in zip(pattern.timestamps, steps):
+            if self.steps and self.steps[-1] == step:
+                continue
+            self.times.append(float(t))
+            self.steps.append(step)
+
+        # (cycle, event index) last sent, and the step the feature is at
+        self.sent: tuple[int, int] = (-1, -1)
+        self.last_step: int | None = None
+
+
+class PatternPlayer:
+    """Plays patterns on one or more features against the monotonic clock.
+
+    Patterns are quantized to steps up front, and only events that change a
+    feature's step are sent. The position is always derived from the event
+    loop clock rather than accumulated sleeps, so playback never drifts: if a
+    send is late, the player catches up by skipping to the current value
+    instead of replaying the missed ones.
+
+    Example:
+        pattern = Pattern.keyframes([(0.0, 0.0), (1.0, 1.0), (2.0, 0.0)], rate=20)
+        player = PatternPlayer([(feature, OutputType.VIBRATE, pattern)], loop=True)
+        player.start()
+        ...
+        player.speed = 2.0
+        ...
+        await player.stop()
+    """
+
+    def __init__(
+        self,
+        tracks: Iterable[tuple[DeviceFeature, OutputType | str, Pattern]],
+        loop: bool = False,
+        speed: float = 1.0,
+        stop_outputs: bool = True,
+    ) -> None:
+        """Quantize the patterns for their features.
+
+        Args:
+            tracks: (feature, output type, pattern) for every output to drive.
+            loop: Restart from the beginning after the longest pattern ends.
+            speed: Playback rate multiplier.
+            stop_outputs: Stop the features' outputs while paused and once
+                playback ends.
+
+        Raises:
+            ButtplugDeviceError: If a feature doesn't support its output type or a
+                value is out of range.
+            ValueError: If there are no tracks, speed isn't positive, or a looping
+                pattern has zero length.
+        """
+        tracks = list(tracks)
+        if not tracks:
+            raise ValueError("PatternPlayer needs at least one track")
+        self._tracks = [
+            _Track(feature, OutputType(output_type), pattern)
+            for feature, output_type, pattern in tracks
+        ]
+        self._length = max(pattern.length for _, _, pattern in tracks)
+        if loop and self._length <= 0:
+            raise ValueError("A looping pattern must have a positive length")
+
+        self._loop = loop
+        self._stop_outputs = stop_outputs
+        self._clock = PlaybackClock(speed)
+        self._alarm = Alarm()
+        self._resync = True
+
+        self._task: asyncio.Task[None] | None = None
+        self._outputs_stopped = True
+        self._last_error: Exception | None = None
+
+        self._sent = 0
+        self._skipped = 0
+        self._errors = 0
+        self._timed = 0
+        self._total_jitter = 0.0
+        self._max_jitter = 0.0
+
+    @property
+    def length(self) -> float:
+        """Length of playback (the longest pattern) in seconds."""
+        return self._length
+
+    @property
+    def loop(self) -> bool:
+        """True if playback restarts after reaching the end."""
+        return self._loop
+
+    @loop.setter
+    def loop(self, enabled: bool) -> None:
+        if enabled and self._length <= 0:
+            raise ValueError("A looping pattern must have a positive length")
+        self._loop = enabled
+        self._alarm.wake()
+
+    @property
+    def speed(self) -> float:
+        """Playback rate multiplier. Takes effect immediately."""
+        return self._clock.speed
+
+    @speed.setter
+    def speed(self, speed: float) -> None:
+        self._clock.set_speed(speed, self._now())
+        self._alarm.wake()
+
+    @property
+    def position(self) -> float:
+        """Current position within the pattern in seconds."""
+        if self._task is None:
+            return 0.0
+        position = self._clock.position(self._now())
+        if self._loop:
+            return position % self._length
+        return min(position, self._length)
+
+    @property
+    def playing(self) -> bool:
+        """True from start() until playback ends or is stopped, even while paused."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def paused(self) -> bool:
+        """True while paused."""
+        return self._clock.paused
+
+    @property
+    def last_error(self) -> Exception | None:
+        """Most recent error raised while sending a value."""
+        return self._last_error
+
+    @property
+    def stats(self) -> PlaybackStats:
+        """Snapshot of playback counters and timing jitter."""
+        return PlaybackStats(
+            sent=self._sent,
+            skipped=self._skipped,
+            errors=self._errors,
+            timed=self._timed,
+            total_jitter=self._total_jitter,
+            max_jitter=self._max_jitter,
+        )
+
+    def start(self, position: float = 0.0) -> None:
+        """Start playback in the background.
+
+        Args:
+            position: Seconds into the pattern to start at.
+
+        Raises:
+            RuntimeError: If already playing.
+        """
+        if self.playing:
+            raise RuntimeError("Playback is already running")
+        self._clock = PlaybackClock(self._clock.speed)
+        self._clock.set(self._clamp(position), self._now())
+        self._resync = True
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop playback and wait until it has wound down."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def wait(self) -> None:
+        """Wait until playback reaches the end (never returns while looping)."""
+        if self._task is not None:
+            await asyncio.shield(self._task)
+
+    def pause(self) -> None:
+        """Freeze the position; outputs are stopped if stop_outputs is set."""
+        if self._clock.paused:
+            return
+        self._clock.pause(self._now())
+        self._alarm.wake()
+
+    def resume(self) -> None:
+        """Continue from the paused position, restoring the current values."""
+        if not self._clock.paused:
+            return
+        self._clock.resume(self._now())
+        self._resync = True
+        self._alarm.wake()
+
+    def seek(self, position: float) -> None:
+        """Jump to a position, sending the values current there right away.
+
+        Args:
+            position: Seconds into the pattern.
+        """
+        self._clock.set(self._clamp(position), self._now())
+        self._resync = True
+        self._alarm.wake()
+
+    # ============ Internal Methods ============
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_running_loop().time()
+
+    def _clamp(self, position: float) -> float:
+        if self._loop:
+            return position % self._length
+        return max(0.0, min(position, self._length))
+
+    async def _run(self) -> None:
+        """Send due values, then sleep until the next one, until the end."""
+        try:
+            while True:
+                if self._clock.paused:
+                    if self._stop_outputs and not self._outputs_stopped:
+                        await self._stop_features()
+                    await self._alarm.sleep_until(None)
+                    continue
+
+                now = self._now()
+                raw = self._clock.position(now + _TIMER_SLACK)
+                finished = not self._loop and raw >= self._length
+                if self._loop:
+                    cycle, position = divmod(raw, self._length)
+                else:
+                    cycle, position = 0.0, min(raw, self._length)
+
+                await self._send_due(int(cycle), position, now)
+                if finished:
+                    break
+                await self._alarm.sleep_until(self._next_deadline(int(cycle), position))
+        finally:
+            if self._stop_outputs and not self._outputs_stopped:
+                await self._stop_features()
+
+    async def _send_due(self, cycle: int, position: float, now: float) -> None:
+        """Send every track whose current step changed."""
+        resync, self._resync = self._resync, False
+        sends = []
+        for track in self._tracks:
+            index = bisect.bisect_right(track.times, position) - 1
+            if index < 0 or (not resync and track.sent == (cycle, index)):
+                continue
+
+            # Lateness is measured from the first event not sent yet, so values
+            # skipped while catching up still count against the timing
+            due = index
+            sent_cycle, sent_index = track.sent
+            if not resync and sent_cycle == cycle and index > sent_index + 1:
+                self._skipped += index - sent_index - 1
+                due = sent_index + 1
+            track.sent = (cycle, index)
+
+            step = track.steps[index]
+            if not resync and step == track.last_step:
+                continue
+            intended = None if resync else self._wall_time(cycle, track.times[due])
+            sends.append(self._send(track, step, now, intended))
+
+        if sends:
+            self._outputs_stopped = False
+            await asyncio.gather(*sends)
+
+    async def _send(self, track: _Track, step: int, now: float, intended: float | None) -> None:
+        if intended is not None:
+            jitter = max(0.0, now - intended)
+            self._timed += 1
+            self._total_jitter += jitter
+            self._max_jitter = max(self._max_jitter, jitter)
+        try:
+            await track.feature.run_output(DeviceOutputCommand(track.output_type, step))
+        except Exception as e:
+            self._errors += 1
+            self._last_error = e
+            track.last_step = None
+        else:
+            self._sent += 1
+            track.last_step = step
+
+    def _next_deadline(self, cycle: int, position: float) -> float:
+        """Loop time of the next event on any track, or of the end of the cycle."""
+        next_time = self._length
+        for track in self._tracks:
+            index = bisect.bisect_right(track.times, position)
+            if index < len(track.times):
+                next_time = min(next_time, track.times[index])
+        return self._wall_time(cycle, next_time)
+
+    def _wall_time(self, cycle: int, time: float) -> float:
+        """Loop time at which the given pattern time of a cycle is reached."""
+        return self._clock.loop_time(cycle * self._length + time)
+
+    async def _stop_features(self) -> None:
+        """Stop every feature's outputs, e.g. when pausing."""
+        self._outputs_stopped = True
+        features = {id(track.feature): track.feature for track in self._tracks}
+        for track in self._tracks:
+            track.last_step = None
+        results = await asyncio.gather(
+            *(feature.stop() for feature in features.values()), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self._errors += 1
+                self._last_error = result
@@ -0,0 +1,31 @@
+"""Caching policy for sensor reads such as battery and RSSI."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ReadCachePolicy:
+    """How long sensor reads are answered from cache.
+
+    A reading younger than ttl is returned without contacting the server. An
+    older one, up to ttl + max_stale, is still returned immediately while a
+    single background read refreshes it (stale-while-revalidate). Past that,
+    callers wait for a fresh read. Concurrent callers needing the same sensor
+    share one request.
+
+    Args:
+        ttl: Seconds a reading is fresh.
+        max_stale: Seconds after ttl a stale reading may still be served while
+            it's refreshed, or None to always serve the last reading.
+    """
+
+    ttl: float = 1.0
+    max_stale: float | None = 60.0
+
+    def __post_init__(self) -> None:
+        if self.ttl < 0:
+            raise ValueError("ttl must not be negative")
+        if self.max_stale is not None and self.max_stale < 0:
+            raise ValueError("max_stale must not be negative")
@@ -0,0 +1,45 @@
+"""Reconnect policy for recovering from dropped server connections."""
+
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ReconnectPolicy:
+    """How ButtplugClient recovers when the server connection drops.
+
+    After an unexpected disconnect the client retries with exponential backoff,
+    redoes the handshake and re-requests the device list. Devices that come
+    back with the same index and name keep their ButtplugDevice objects, so
+    references held by the application stay valid.
+
+    Args:
+        max_attempts: Attempts before giving up, or None to retry forever.
+        initial_delay: Seconds before the first attempt.
+        max_delay: Upper bound for the backoff delay in seconds.
+        multiplier: Backoff growth factor per attempt.
+        jitter: Fraction (0.0-1.0) of each delay that is randomized, so many
+            clients don't reconnect in lockstep.
+        restore_outputs: Re-send the last output command of every feature once
+            reconnected.
+    """
+
+    max_attempts: int | None = 10
+    initial_delay: float = 0.1
+    max_delay: float = 10.0
+    multiplier: float = 2.0
+    jitter: float = 0.5
+    restore_outputs: bool = False
+
+    def delay(self, attempt: int) -> float:
+        """Get the delay in seconds before the given attempt (0-based)."""
+        base = min(self.max_delay, self.initial_delay)
+        if base > 0 and self.multiplier != 1:
+            if self.multiplier > 1:
+                # Stop growing once max_delay is reached, so huge attempts can't overflow
+                attempt = min(attempt, math.ceil(math.log(self.max_delay / base, self.multiplier)))
+            base = min(self.max_delay, base * self.multiplier**attempt)
+        return base * (1.0 - self.jitter * random.random())
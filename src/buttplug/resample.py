@@ -0,0 +1,276 @@
+"""Aligning readings from several sensors onto a common timeline."""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import math
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from buttplug.enums import StrEnum
+from buttplug.history import SensorHistory
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    from buttplug.subscription import InputSubscription
+
+
+class Interpolation(StrEnum):
+    """How values between readings are filled in."""
+
+    HOLD = "hold"
+    """The last reading holds until the next one (right for buttons)."""
+
+    LINEAR = "linear"
+    """Interpolate linearly between the readings around each sample."""
+
+
+@dataclass(frozen=True)
+class ResampledFrame:
+    """All sources sampled at one point in time.
+
+    Args:
+        timestamp: time.monotonic() the frame was sampled at.
+        values: One value per source, NaN for sources without a reading yet.
+        staleness: Seconds since the newest reading used for each source,
+            inf for sources without a reading yet.
+    """
+
+    timestamp: float
+    values: tuple[float, ...]
+    staleness: tuple[float, ...]
+
+
+@dataclass(frozen=True)
+class ResampledBlock:
+    """Sources sampled on a regular grid, as dense matrices.
+
+    Args:
+        timestamps: Sample times, shape (samples,).
+        values: Shape (samples, sources), NaN before a source's first reading.
+        staleness: Shape (samples, sources), seconds since the newest reading
+            used, inf before a source's first reading.
+    """
+
+    timestamps: NDArray[np.float64]
+    values: NDArray[np.float64]
+    staleness: NDArray[np.float64]
+
+
+def resample(
+    histories: Sequence[SensorHistory],
+    rate: float,
+    start: float | None = None,
+    end: float | None = None,
+    method: Interpolation = Interpolation.HOLD,
+) -> ResampledBlock:
+    """Sample recorded sensor histories on a common grid. Requires NumPy.
+
+    Every source is sampled in one vectorized pass over its history.
+
+    Args:
+        histories: One history per source.
+        rate: Samples per second.
+        start: First sample time. Defaults to the earliest reading.
+        end: Last sample time (inclusive). Defaults to the latest reading.
+        method: How to fill in values between readings.
+
+    Returns:
+        The samples, one column per history.
+
+    Raises:
+        ValueError: If rate is not positive, or start/end can't be derived
+            because the histories are empty.
+    """
+    import numpy as np
+
+    if rate <= 0:
+        raise ValueError("rate must be positive")
+    sources = [history.arrays() for history in histories]
+    recorded = [timestamps for timestamps, _ in sources if len(timestamps)]
+    if start is None or end is None:
+        if not recorded:
+            raise ValueError("start and end are required when the histories are empty")
+        start = min(timestamps[0] for timestamps in recorded) if start is None else start
+        end = max(timestamps[-1] for timestamps in recorded) if end is None else end
+
+    count = max(0, math.floor((end - start) * rate + 1e-9) + 1)
+    grid = start + np.arange(count, dtype=np.float64) / rate
+    values = np.full((count, len(sources)), np.nan)
+    staleness = np.full((count, len(sources)), np.inf)
+
+    for column, (timestamps, readings) in enumerate(sources):
+        if not len(timestamps):
+            continue
+        # Index of the newest reading at or before each sample
+        previous = np.searchsorted(timestamps, grid, side="right") - 1
+        seen = previous >= 0
+        held = previous[seen]
+        staleness[seen, column] = grid[seen] - timestamps[held]
+        if method == Interpolation.LINEAR:
+            values[seen, column] = np.interp(grid[seen], timestamps, readings)
+        else:
+            values[seen, column] = readings[held]
+
+    return ResampledBlock(grid, values, staleness)
+
+
+class SensorResampler:
+    """Async iterator of frames sampling several subscriptions at a fixed rate.
+
+    Each subscription's readings are collected into a SensorHistory in the
+    background. Frames are emitted on a grid anchored to the start time, so
+    the rate doesn't drift; if the consumer falls behind, missed frames are
+    skipped rather than queued. Iteration ends once every subscription is
+    closed.
+
+    Linear interpolation needs the reading after a sample, so delay the
+    sampling by about the slowest source's reporting interval; without one,
+    the newest reading is held.
+
+    Example:
+        sources = [pressure.subscribe(InputType.PRESSURE), button.subscribe(InputType.BUTTON)]
+        async with SensorResampler(sources, rate=50) as frames:
+            async for frame in frames:
+                print(frame.values, frame.staleness)
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[InputSubscription],
+        rate: float,
+        method: Interpolation = Interpolation.HOLD,
+        delay: float = 0.0,
+        capacity: int = 256,
+    ) -> None:
+        """Initialize resampler.
+
+        Args:
+            sources: Subscriptions to sample, one frame column each. They are
+                started and closed with the resampler.
+            rate: Frames per second.
+            method: How to fill in values between readings.
+            delay: Seconds each frame lags behind the time it's emitted at.
+            capacity: Readings kept per source.
+
+        Raises:
+            ValueError: If an option is out of range.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if delay < 0:
+            raise ValueError("delay must not be negative")
+        self._sources = list(sources)
+        self._period = 1.0 / rate
+        self._method = method
+        self._delay = delay
+        self._histories = [SensorHistory(capacity) for _ in self._sources]
+        self._tasks: list[asyncio.Task[None]] = []
+        self._start: float | None = None
+        self._tick = 0
+        self._skipped = 0
+
+    @property
+    def histories(self) -> list[SensorHistory]:
+        """Readings collected per source, in source order."""
+        return list(self._histories)
+
+    @property
+    def skipped(self) -> int:
+        """Frames skipped because the consumer fell behind."""
+        return self._skipped
+
+    async def start(self) -> None:
+        """Start the subscriptions and begin collecting readings."""
+        if self._tasks:
+            return
+        for source in self._sources:
+            await source.start()
+        loop = asyncio.get_running_loop()
+        self._tasks = [
+            loop.create_task(self._collect(source, history))
+            for source, history in zip(self._sources, self._histories)
+        ]
+        self._start = time.monotonic()
+        self._tick = 0
+
+    async def close(self) -> None:
+        """Stop collecting and close the subscriptions."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for source in self._sources:
+            await source.close()
+
+    async def __aenter__(self) -> SensorResampler:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def __aiter__(self) -> SensorResampler:
+        return self
+
+    async def __anext__(self) -> ResampledFrame:
+        if self._start is None:
+            await self.start()
+        if all(source.closed for source in self._sources):
+            raise StopAsyncIteration
+        assert self._start is not None
+        self._tick += 1
+        now = time.monotonic()
+        due = math.floor((now - self._start) / self._period)
+        if due > self._tick:
+            self._skipped += due - self._tick
+            self._tick = due
+        await asyncio.sleep(self._start + self._tick * self._period - now)
+        return self.sample(self._start + self._tick * self._period - self._delay)
+
+    def sample(self, timestamp: float) -> ResampledFrame:
+        """Sample every source at a point in time.
+
+        Args:
+            timestamp: time.monotonic() to sample at.
+        """
+        values: list[float] = []
+        staleness: list[float] = []
+        for history in self._histories:
+            value, age = _sample(history, timestamp, self._method)
+            values.append(value)
+            staleness.append(age)
+        return ResampledFrame(timestamp, tuple(values), tuple(staleness))
+
+    # ============ Internal Methods ============
+
+    @staticmethod
+    async def _collect(source: InputSubscription, history: SensorHistory) -> None:
+        async for reading in source:
+            history.append(reading.timestamp, reading.value)
+
+
+def _sample(history: SensorHistory, timestamp: float, method: Interpolation) -> tuple[float, float]:
+    """(value, staleness) of one history at a point in time."""
+    timestamps = history.timestamps
+    index = bisect.bisect_right(timestamps, timestamp) - 1
+    if index < 0:
+        return math.nan, math.inf
+    values = history.values
+    value: float = values[index]
+    if method == Interpolation.LINEAR and index + 1 < len(timestamps):
+        t0, t1 = timestamps[index], timestamps[index + 1]
+        if t1 > t0:
+            value += (values[index + 1] - value) * (timestamp - t0) / (t1 - t0)
+    return value, timestamp - timestamps[index]
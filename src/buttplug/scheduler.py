@@ -0,0 +1,194 @@
+"""Latest-value-wins output scheduling per device."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from buttplug.stats import SchedulerStats
+
+if TYPE_CHECKING:
+    from buttplug.command import DeviceOutputCommand
+    from buttplug.device import ButtplugDevice
+    from buttplug.enums import OutputType
+    from buttplug.feature import DeviceFeature
+
+
+class OutputScheduler:
+    """Coalesces output updates for one device and paces them to its timing gap.
+
+    Updates are keyed by feature and output type; submitting a new value for a
+    key replaces any value still waiting for it, so only the newest value is
+    ever sent. Pending updates go out together at most once per
+    message_timing_gap, and never while the previous flush is still waiting
+    for the server, so a source producing faster than the device (or the
+    connection) can take never builds a backlog.
+
+    Obtain one through ButtplugDevice.output_scheduler, or use the
+    submit_output() and stream_output() helpers on devices and features.
+    """
+
+    def __init__(self, device: ButtplugDevice) -> None:
+        """Initialize scheduler.
+
+        Args:
+            device: Device whose outputs this scheduler paces.
+        """
+        self._device = device
+        self._pending: dict[tuple[int, str], tuple[DeviceFeature, DeviceOutputCommand]] = {}
+        self._timer: asyncio.Handle | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+        self._last_flush = float("-inf")
+        self._idle: asyncio.Event | None = None
+        self._last_error: Exception | None = None
+
+        self._submitted = 0
+        self._coalesced = 0
+        self._sent = 0
+        self._errors = 0
+        self._flushes = 0
+
+    @property
+    def gap(self) -> float:
+        """Minimum seconds between flushes (the device's message timing gap)."""
+        return self._device.message_timing_gap / 1000.0
+
+    @property
+    def pending_count(self) -> int:
+        """Updates waiting for the next flush."""
+        return len(self._pending)
+
+    @property
+    def last_error(self) -> Exception | None:
+        """Most recent error raised while sending a scheduled update."""
+        return self._last_error
+
+    @property
+    def stats(self) -> SchedulerStats:
+        """Snapshot of scheduling counters."""
+        return SchedulerStats(
+            submitted=self._submitted,
+            coalesced=self._coalesced,
+            sent=self._sent,
+            errors=self._errors,
+            flushes=self._flushes,
+            pending=len(self._pending),
+        )
+
+    def submit(self, feature: DeviceFeature, command: DeviceOutputCommand) -> None:
+        """Schedule an output update, replacing any pending one for the same output.
+
+        Args:
+            feature: Feature to send the command to.
+            command: The output command.
+
+        Raises:
+            ButtplugDeviceError: If the feature doesn't support the output type or
+                the value is out of range.
+        """
+        # Validate now - a bad value would otherwise only fail at flush time
+        feature.convert_to_step(command.output_type, command.value)
+
+        key = (feature.index, command.output_type.value)
+        if key in self._pending:
+            self._coalesced += 1
+        self._pending[key] = (feature, command)
+        self._submitted += 1
+        if self._idle is not None:
+            self._idle.clear()
+        self._schedule()
+
+    def discard(
+        self, feature_index: int | None = None, output_type: OutputType | None = None
+    ) -> None:
+        """Drop pending updates, e.g. because the outputs were stopped.
+
+        Args:
+            feature_index: Only drop updates for this feature, or None for all.
+            output_type: Only drop updates of this output type of the feature,
+                or None for every type. Ignored without feature_index.
+        """
+        if feature_index is None:
+            self._pending.clear()
+        elif output_type is not None:
+            self._pending.pop((feature_index, output_type.value), None)
+        else:
+            for key in [key for key in self._pending if key[0] == feature_index]:
+                del self._pending[key]
+        if not self._pending and self._timer:
+            self._timer.cancel()
+            self._timer = None
+        self._check_idle()
+
+    async def drain(self) -> None:
+        """Wait until every pending update has been sent."""
+        if self._is_idle():
+            return
+        if self._idle is None:
+            self._idle = asyncio.Event()
+        await self._idle.wait()
+
+    def close(self) -> None:
+        """Drop pending updates and stop scheduling (e.g. the device went away)."""
+        self.discard()
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._check_idle()
+
+    # ============ Internal Methods ============
+
+    def _schedule(self) -> None:
+        """Arrange for the next flush unless one is already due or running."""
+        if self._timer is not None or self._flush_task is not None:
+            return  # The running flush reschedules when it completes
+
+        loop = asyncio.get_running_loop()
+        due = self._last_flush + self.gap
+        if due <= loop.time():
+            # Next tick, so updates submitted together go out together
+            self._timer = loop.call_soon(self._flush)
+        else:
+            self._timer = loop.call_at(due, self._flush)
+
+    def _flush(self) -> None:
+        """Send everything pending as one round of commands."""
+        self._timer = None
+        if not self._pending:
+            self._check_idle()
+            return
+
+        batch, self._pending = self._pending, {}
+        loop = asyncio.get_running_loop()
+        self._last_flush = loop.time()
+        self._flushes += 1
+        self._flush_task = loop.create_task(self._send(list(batch.values())))
+        self._flush_task.add_done_callback(self._flush_done)
+
+    async def _send(self, batch: list[tuple[DeviceFeature, DeviceOutputCommand]]) -> None:
+        """Send a batch of updates concurrently, recording failures."""
+        results = await asyncio.gather(
+            *(feature.run_output(command) for feature, command in batch),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self._errors += 1
+                self._last_error = result
+            else:
+                self._sent += 1
+
+    def _flush_done(self, task: asyncio.Task[None]) -> None:
+        if self._flush_task is task:
+            self._flush_task = None
+        if self._pending:
+            self._schedule()
+        else:
+            self._check_idle()
+
+    def _is_idle(self) -> bool:
+        return not self._pending and self._timer is None and self._flush_task is None
+
+    def _check_idle(self) -> None:
+        if self._idle is not None and self._is_idle():
+            self._idle.set()
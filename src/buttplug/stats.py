@@ -0,0 +1,329 @@
+"""Statistics snapshots for client and connector internals."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from buttplug.latency import LatencyHistogram
+
+
+@dataclass(frozen=True)
+class PipelineStats:
+    """Counters for pipelined (unacknowledged) output commands.
+
+    Args:
+        sent: Commands sent without waiting for a response.
+        acknowledged: Commands the server answered with Ok.
+        errors: Commands the server answered with Error.
+        expired: Commands the server never answered within the timeout.
+        outstanding: Commands still waiting for an answer.
+    """
+
+    sent: int = 0
+    acknowledged: int = 0
+    errors: int = 0
+    expired: int = 0
+    outstanding: int = 0
+
+
+@dataclass(frozen=True)
+class SorterStats:
+    """Counters for request/response correlation.
+
+    Args:
+        in_flight: Requests currently waiting for a response.
+        resolved: Requests answered by the server.
+        expired: Requests that timed out.
+        rejected: Requests failed locally (write errors, disconnects).
+    """
+
+    in_flight: int = 0
+    resolved: int = 0
+    expired: int = 0
+    rejected: int = 0
+
+    @property
+    def expire_rate(self) -> float:
+        """Fraction of completed requests that timed out."""
+        completed = self.resolved + self.expired + self.rejected
+        return self.expired / completed if completed else 0.0
+
+
+@dataclass(frozen=True)
+class SendQueueStats:
+    """Counters for the flow-controlled send queue.
+
+    All counters stay at zero when flow control is disabled.
+
+    Args:
+        in_flight: Device commands currently holding a window slot.
+        queued: Commands waiting for a slot.
+        high_water: Largest queue depth seen.
+        waited: Commands that had to wait for a slot.
+        rejected: Commands refused because the queue was full.
+        dropped: Queued commands failed to make room (drop-oldest policy).
+        replaced: Queued commands superseded by a newer one (replace policy).
+        total_wait: Seconds spent waiting for a slot, summed over all commands.
+        max_wait: Longest single wait for a slot in seconds.
+    """
+
+    in_flight: int = 0
+    queued: int = 0
+    high_water: int = 0
+    waited: int = 0
+    rejected: int = 0
+    dropped: int = 0
+    replaced: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        """Average wait for a slot in seconds, over commands that waited."""
+        return self.total_wait / self.waited if self.waited else 0.0
+
+
+@dataclass(frozen=True)
+class DispatchStats:
+    """Counters for delivering unsolicited messages to the client.
+
+    Args:
+        backlog: Messages waiting for the message callback.
+        high_water: Largest backlog seen.
+        dispatched: Messages handed to the message callback.
+        stalls: Times the receive loop had to wait for a full backlog to drain.
+        errors: Messages whose callback raised.
+    """
+
+    backlog: int = 0
+    high_water: int = 0
+    dispatched: int = 0
+    stalls: int = 0
+    errors: int = 0
+
+
+@dataclass(frozen=True)
+class IngestionStats:
+    """Counters for commands submitted to SyncButtplugClient from other threads.
+
+    Args:
+        submitted: Calls picked up by the loop thread.
+        wakeups: Times the loop thread was woken to drain submissions.
+        max_batch: Most submissions drained in a single wakeup.
+        failed_posts: Fire-and-forget calls that raised.
+    """
+
+    submitted: int = 0
+    wakeups: int = 0
+    max_batch: int = 0
+    failed_posts: int = 0
+
+    @property
+    def mean_batch(self) -> float:
+        """Average submissions drained per wakeup."""
+        return self.submitted / self.wakeups if self.wakeups else 0.0
+
+
+@dataclass(frozen=True)
+class SchedulerStats:
+    """Counters for a device's latest-value-wins output scheduler.
+
+    Args:
+        submitted: Updates submitted.
+        coalesced: Updates replaced by a newer one before being sent.
+        sent: Updates the server acknowledged.
+        errors: Updates that failed to send.
+        flushes: Rounds of updates sent.
+        pending: Updates waiting for the next flush.
+    """
+
+    submitted: int = 0
+    coalesced: int = 0
+    sent: int = 0
+    errors: int = 0
+    flushes: int = 0
+    pending: int = 0
+
+
+@dataclass(frozen=True)
+class OutputCacheStats:
+    """Counters for redundant output suppression.
+
+    Args:
+        sent: Output commands sent to the server.
+        suppressed: Output commands skipped because the feature was already at
+            that step.
+    """
+
+    sent: int = 0
+    suppressed: int = 0
+
+    @property
+    def suppression_rate(self) -> float:
+        """Fraction of output commands that were suppressed."""
+        total = self.sent + self.suppressed
+        return self.suppressed / total if total else 0.0
+
+
+@dataclass(frozen=True)
+class PlaybackStats:
+    """Counters and timing jitter of a PatternPlayer.
+
+    Args:
+        sent: Values the server acknowledged.
+        skipped: Events passed over because playback was running late.
+        errors: Values (or stops) that failed to send.
+        timed: Sends measured for jitter (excludes sends after start, seek and
+            resume, which have no intended time).
+        total_jitter: Sum of the delays between each event's intended time and
+            its send, in seconds.
+        max_jitter: Largest of those delays, in seconds.
+    """
+
+    sent: int = 0
+    skipped: int = 0
+    errors: int = 0
+    timed: int = 0
+    total_jitter: float = 0.0
+    max_jitter: float = 0.0
+
+    @property
+    def mean_jitter(self) -> float:
+        """Average delay behind the intended send time, in seconds."""
+        return self.total_jitter / self.timed if self.timed else 0.0
+
+
+@dataclass(frozen=True)
+class TrajectoryStats:
+    """Counters and latency estimate of a TrajectoryPlayer.
+
+    Args:
+        sent: Moves the server acknowledged.
+        late: Moves issued more than max_lateness after they should have
+            taken effect (shortened to still end on time).
+        skipped: Moves passed over entirely because playback was running late.
+        errors: Moves that failed to send.
+        rtt: Moving average of the command round-trip time in seconds.
+        lead: Seconds moves are currently sent ahead of their start.
+    """
+
+    sent: int = 0
+    late: int = 0
+    skipped: int = 0
+    errors: int = 0
+    rtt: float = 0.0
+    lead: float = 0.0
+
+
+@dataclass(frozen=True)
+class MotionPlanStats:
+    """How much a MotionPlanner compressed a position stream.
+
+    Args:
+        points: Points in the input.
+        moves: Moves in the plan, including the initial positioning move.
+        velocity_limited: Segments slowed to the velocity limit.
+        acceleration_limited: Segments whose velocity change was limited.
+    """
+
+    points: int = 0
+    moves: int = 0
+    velocity_limited: int = 0
+    acceleration_limited: int = 0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Input points per planned move."""
+        return self.points / self.moves if self.moves else 0.0
+
+
+@dataclass(frozen=True)
+class ReadCacheStats:
+    """How sensor reads were answered under a ReadCachePolicy.
+
+    Args:
+        hits: Reads answered with a fresh cached value.
+        stale_hits: Reads answered with a stale value while it was refreshed.
+        misses: Reads that had to wait for the server.
+        collapsed: Misses that joined a read already in flight instead of
+            sending their own.
+        refreshes: Background reads started to refresh stale values.
+    """
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    collapsed: int = 0
+    refreshes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of reads answered from cache, fresh or stale."""
+        total = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / total if total else 0.0
+
+
+@dataclass(frozen=True)
+class SweeperStats:
+    """Counters of a SensorSweeper.
+
+    Args:
+        sensors: Sensors currently swept.
+        reads: Successful reads.
+        errors: Reads that failed.
+        changes: Reads whose value differed from the sensor's previous one.
+    """
+
+    sensors: int = 0
+    reads: int = 0
+    errors: int = 0
+    changes: int = 0
+
+
+@dataclass(frozen=True)
+class ConnectionStats:
+    """Wire traffic, response outcomes and round-trip times of a connection.
+
+    Args:
+        frames_in: Frames read from the server.
+        frames_out: Frames written to the server.
+        bytes_in: Encoded bytes of the frames read.
+        bytes_out: Encoded bytes of the frames written.
+        malformed_frames: Frames dropped because they couldn't be decoded or
+            parsed.
+        timeouts: Requests, including pipelined ones, the server didn't answer
+            in time.
+        late_responses: Responses that arrived after their request timed out
+            or its caller gave up.
+        unknown_responses: Responses whose Id matched no request.
+        in_flight: Requests waiting for a response.
+        pipelined: Pipelined requests waiting for a response.
+        queued: Device commands waiting for a flow-control window slot.
+        dispatch_backlog: Unsolicited messages waiting for the message callback.
+        latency_by_type: Round-trip times per request message type.
+        latency_by_device: Round-trip times per device index, for device
+            commands.
+    """
+
+    frames_in: int = 0
+    frames_out: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    malformed_frames: int = 0
+    timeouts: int = 0
+    late_responses: int = 0
+    unknown_responses: int = 0
+    in_flight: int = 0
+    pipelined: int = 0
+    queued: int = 0
+    dispatch_backlog: int = 0
+    latency_by_type: dict[str, LatencyHistogram] = field(default_factory=dict)
+    latency_by_device: dict[int, LatencyHistogram] = field(default_factory=dict)
+
+    @property
+    def latency(self) -> LatencyHistogram:
+        """Round-trip times of all requests."""
+        histogram = LatencyHistogram()
+        for by_type in self.latency_by_type.values():
+            histogram.merge(by_type)
+        return histogram
@@ -0,0 +1,192 @@
+"""Streaming sensor readings from subscribed device inputs."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from buttplug.enums import InputType, StrEnum
+
+if TYPE_CHECKING:
+    from buttplug.feature import DeviceFeature
+
+
+class SensorOverflow(StrEnum):
+    """What to do with a new reading when a subscription's buffer is full."""
+
+    DROP = "drop"
+    """Discard the new reading, keeping the backlog intact."""
+
+    KEEP_LATEST = "keep_latest"
+    """Discard the oldest buffered reading to make room for the new one."""
+
+
+@dataclass(frozen=True)
+class SensorReading:
+    """A value reported by a subscribed sensor.
+
+    Args:
+        timestamp: time.monotonic() when the reading was received.
+        value: Raw sensor value.
+    """
+
+    timestamp: float
+    value: int
+
+
+class InputSubscription:
+    """Async iterator over the readings of one subscribed sensor.
+
+    Created by DeviceFeature.subscribe(). The server subscription starts on
+    entering the context (or on first iteration) and ends on exit. Several
+    subscriptions to the same sensor share one server subscription, which is
+    released when the last of them closes. Iteration ends when the
+    subscription is closed or the device goes away.
+
+    Example:
+        async with feature.subscribe(InputType.PRESSURE) as readings:
+            async for reading in readings:
+                print(reading.value)
+    """
+
+    def __init__(
+        self,
+        feature: DeviceFeature,
+        input_type: InputType,
+        buffer_size: int = 64,
+        overflow: SensorOverflow = SensorOverflow.KEEP_LATEST,
+    ) -> None:
+        """Initialize subscription.
+
+        Args:
+            feature: Feature to read from.
+            input_type: Sensor to subscribe to.
+            buffer_size: Readings buffered while the consumer is busy.
+            overflow: Policy for new readings once the buffer is full.
+
+        Raises:
+            ValueError: If buffer_size is not positive.
+        """
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        self._feature = feature
+        self._input_type = input_type
+        self._buffer_size = buffer_size
+        self._overflow = overflow
+        self._buffer: deque[SensorReading] = deque()
+        self._waiter: asyncio.Future[None] | None = None
+        self._active = False
+        self._closed = False
+        self._received = 0
+        self._dropped = 0
+
+    @property
+    def feature(self) -> DeviceFeature:
+        """Feature the sensor belongs to."""
+        return self._feature
+
+    @property
+    def input_type(self) -> InputType:
+        """Sensor subscribed to."""
+        return self._input_type
+
+    @property
+    def active(self) -> bool:
+        """True while the subscription receives readings."""
+        return self._active and not self._closed
+
+    @property
+    def closed(self) -> bool:
+        """True once closed, by the application or because the device is gone."""
+        return self._closed
+
+    @property
+    def received(self) -> int:
+        """Readings received, including dropped ones."""
+        return self._received
+
+    @property
+    def dropped(self) -> int:
+        """Readings discarded because the buffer was full."""
+        return self._dropped
+
+    async def start(self) -> None:
+        """Subscribe on the server, unless already subscribed.
+
+        Raises:
+            RuntimeError: If the subscription was closed.
+            ButtplugError: If the server rejects the subscription.
+        """
+        if self._closed:
+            raise RuntimeError("Subscription is closed")
+        if self._active:
+            return
+        self._active = True
+        try:
+            await self._feature._client._add_subscription(self)
+        except BaseException:
+            self._active = False
+            raise
+
+    async def close(self) -> None:
+        """Stop receiving readings, unsubscribing on the server if no one else listens."""
+        if self._closed:
+            return
+        self._finish()
+        if self._active:
+            await self._feature._client._remove_subscription(self)
+
+    async def __aenter__(self) -> InputSubscription:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def __aiter__(self) -> InputSubscription:
+        return self
+
+    async def __anext__(self) -> SensorReading:
+        if not self._active and not self._closed:
+            await self.start()
+        while not self._buffer:
+            if self._closed:
+                raise StopAsyncIteration
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._buffer.popleft()
+
+    # ============ Internal Methods ============
+
+    def _push(self, reading: SensorReading) -> None:
+        """Buffer a reading routed here by the client."""
+        if self._closed:
+            return
+        self._received += 1
+        if len(self._buffer) >= self._buffer_size:
+            self._dropped += 1
+            if self._overflow == SensorOverflow.DROP:
+                return
+            self._buffer.popleft()
+        self._buffer.append(reading)
+        self._wake()
+
+    def _finish(self) -> None:
+        """End iteration once the buffer is drained."""
+        self._closed = True
+        self._wake()
+
+    def _wake(self) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
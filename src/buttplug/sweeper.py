@@ -0,0 +1,327 @@
+"""Periodic, adaptive sensor reads across every connected device."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from buttplug._utils.clock import Alarm
+from buttplug._utils.events import EventHandler
+from buttplug.enums import InputCommandType, InputType
+from buttplug.stats import SweeperStats
+
+if TYPE_CHECKING:
+    from buttplug.client import ButtplugClient
+    from buttplug.feature import DeviceFeature
+
+# (device index, feature index, input type)
+SensorKey = tuple[int, int, str]
+
+# Drop between two reads, in raw units, that counts as fast: battery percent
+# points, RSSI dBm
+_DEFAULT_ALERT_DROPS: dict[str, int] = {InputType.BATTERY: 2, InputType.RSSI: 5}
+
+
+@dataclass(frozen=True)
+class SweepReading:
+    """Latest value the sweeper read from a sensor.
+
+    Args:
+        device_index: Device the sensor belongs to.
+        feature_index: Feature the sensor belongs to.
+        input_type: Sensor input type.
+        value: Raw value read.
+        timestamp: time.monotonic() when the value was read.
+        interval: Seconds until the sensor is read again.
+    """
+
+    device_index: int
+    feature_index: int
+    input_type: str
+    value: int
+    timestamp: float
+    interval: float
+
+
+@dataclass(frozen=True)
+class SensorChange:
+    """A swept sensor reporting a different value.
+
+    Args:
+        reading: The new reading.
+        previous: The value before, or None for a sensor's first reading.
+    """
+
+    reading: SweepReading
+    previous: int | None
+
+
+class _Target:
+    """Poll state of one sensor."""
+
+    __slots__ = ("feature", "input_type", "interval", "due", "reading", "polling")
+
+    def __init__(
+        self, feature: DeviceFeature, input_type: InputType, interval: float, due: float
+    ) -> None:
+        self.feature = feature
+        self.input_type = input_type
+        self.interval = interval
+        # Heap entries with another due time are outdated
+        self.due = due
+        self.reading: SweepReading | None = None
+        self.polling = False
+
+
+class SensorSweeper:
+    """Reads chosen inputs of every device that has them, adapting the pace.
+
+    Sensors are found through each device's get_features_with_input(), and
+    the device list is rescanned as devices come and go. Each sensor is
+    polled on its own interval: it grows by backoff up to max_interval while
+    the value holds steady, and halves down to min_interval whenever the value
+    drops fast (a battery draining, RSSI degrading). Reads share a bounded
+    number of slots, so a large fleet doesn't flood the server.
+
+    The latest readings are available as one snapshot, and on_change fires
+    for every reading that differs from the previous one.
+
+    Example:
+        sweeper = SensorSweeper(client, [InputType.BATTERY, InputType.RSSI])
+        sweeper.on_change += lambda change: print(change.reading)
+        sweeper.start()
+        ...
+        levels = sweeper.snapshot
+    """
+
+    def __init__(
+        self,
+        client: ButtplugClient,
+        inputs: Iterable[InputType] = (InputType.BATTERY,),
+        min_interval: float = 10.0,
+        max_interval: float = 300.0,
+        backoff: float = 1.5,
+        max_concurrency: int = 8,
+        alert_drops: Mapping[InputType, int] | None = None,
+    ) -> None:
+        """Initialize sweeper.
+
+        Args:
+            client: Client whose devices to read.
+            inputs: Input types to read. Only sensors supporting Read are swept.
+            min_interval: Shortest seconds between reads of one sensor.
+            max_interval: Longest seconds between reads of one sensor.
+            backoff: Factor the interval grows by after a stable reading.
+            max_concurrency: Reads in flight at once.
+            alert_drops: Drop between two reads, in raw units, that speeds up
+                polling, per input type. Smaller changes count as stable.
+                Defaults to 2 for battery (percent) and 5 for RSSI (dBm), and
+                1 for other inputs.
+
+        Raises:
+            ValueError: If an option is out of range.
+        """
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval")
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self._client = client
+        self._inputs = tuple(inputs)
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._alert_drops = dict(_DEFAULT_ALERT_DROPS)
+        for input_type, drop in (alert_drops or {}).items():
+            self._alert_drops[input_type] = drop
+        self._slots = asyncio.Semaphore(max_concurrency)
+
+        self._targets: dict[SensorKey, _Target] = {}
+        self._due: list[tuple[float, SensorKey]] = []
+        self._snapshot: dict[SensorKey, SweepReading] = {}
+        self._alarm = Alarm()
+        self._task: asyncio.Task[None] | None = None
+        self._polls: set[asyncio.Task[None]] = set()
+
+        self._reads = 0
+        self._errors = 0
+        self._changes = 0
+        self._last_error: Exception | None = None
+
+        self.on_change: EventHandler[SensorChange] = EventHandler()
+        """Fires with every reading that differs from the sensor's previous one.
+
+        Exceptions raised by handlers are stored in last_error.
+        """
+
+    @property
+    def snapshot(self) -> dict[SensorKey, SweepReading]:
+        """Latest reading of every swept sensor, by (device, feature, input type)."""
+        return dict(self._snapshot)
+
+    @property
+    def running(self) -> bool:
+        """True between start() and stop()."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def last_error(self) -> Exception | None:
+        """Most recent error raised by a read or an on_change handler."""
+        return self._last_error
+
+    @property
+    def stats(self) -> SweeperStats:
+        """Snapshot of sweep counters."""
+        return SweeperStats(
+            sensors=len(self._targets),
+            reads=self._reads,
+            errors=self._errors,
+            changes=self._changes,
+        )
+
+    def interval(self, device_index: int, feature_index: int, input_type: InputType) -> float:
+        """Current poll interval of a sensor, in seconds.
+
+        Raises:
+            KeyError: If the sensor isn't being swept.
+        """
+        return self._targets[(device_index, feature_index, input_type.value)].interval
+
+    def start(self) -> None:
+        """Start sweeping in the background.
+
+        Raises:
+            RuntimeError: If already running.
+        """
+        if self.running:
+            raise RuntimeError("Sweeper is already running")
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sweeping, cancelling reads in flight."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def sweep(self) -> dict[SensorKey, SweepReading]:
+        """Read every sensor once now, regardless of its interval.
+
+        Returns:
+            The snapshot after the sweep.
+        """
+        self._discover()
+        await asyncio.gather(*(self._poll(key) for key in list(self._targets)))
+        return self.snapshot
+
+    # ============ Internal Methods ============
+
+    def _discover(self) -> None:
+        """Track new sensors (due right away) and forget ones that are gone."""
+        now = time.monotonic()
+        found: set[SensorKey] = set()
+        for device_index, device in list(self._client.devices.items()):
+            for input_type in self._inputs:
+                for feature in device.get_features_with_input(input_type):
+                    if not feature.supports_input_command(input_type, InputCommandType.READ):
+                        continue
+                    key = (device_index, feature.index, input_type.value)
+                    found.add(key)
+                    target = self._targets.get(key)
+                    if target is None or target.feature is not feature:
+                        self._targets[key] = _Target(feature, input_type, self._min_interval, now)
+                        heapq.heappush(self._due, (now, key))
+
+        for key in self._targets.keys() - found:
+            del self._targets[key]
+            self._snapshot.pop(key, None)
+
+    async def _run(self) -> None:
+        """Start the reads that are due, then sleep until the next one."""
+        try:
+            while True:
+                self._discover()
+                now = time.monotonic()
+                while self._due and self._due[0][0] <= now:
+                    due, key = heapq.heappop(self._due)
+                    target = self._targets.get(key)
+                    if target is None or target.due != due or target.polling:
+                        continue
+                    task = asyncio.get_running_loop().create_task(self._poll(key))
+                    self._polls.add(task)
+                    task.add_done_callback(self._polls.discard)
+
+                # Rescan for new devices at least every min_interval
+                wake = now + self._min_interval
+                if self._due:
+                    wake = min(wake, self._due[0][0])
+                loop = asyncio.get_running_loop()
+                await self._alarm.sleep_until(loop.time() + (wake - now))
+        finally:
+            polls = list(self._polls)
+            for poll in polls:
+                poll.cancel()
+            await asyncio.gather(*polls, return_exceptions=True)
+
+    async def _poll(self, key: SensorKey) -> None:
+        """Read one sensor, then publish the value and schedule the next read."""
+        target = self._targets.get(key)
+        if target is None or target.polling:
+            return
+        target.polling = True
+        try:
+            async with self._slots:
+                value = await target.feature._read_input(target.input_type)
+        except Exception as e:
+            self._errors += 1
+            self._last_error = e
+            self._reschedule(key, target)
+            return
+        finally:
+            target.polling = False
+        if self._targets.get(key) is not target:
+            return  # Device went away while reading
+
+        self._reads += 1
+        previous = target.reading.value if target.reading is not None else None
+        target.interval = self._adapt(target, previous, value)
+        reading = SweepReading(key[0], key[1], key[2], value, time.monotonic(), target.interval)
+        target.reading = reading
+        self._snapshot[key] = reading
+        self._reschedule(key, target)
+
+        if previous != value:
+            self._changes += 1
+            if self.on_change:
+                try:
+                    await self.on_change.emit(SensorChange(reading, previous))
+                except Exception as e:
+                    # Polls run as background tasks - don't lose handler errors
+                    self._last_error = e
+
+    def _adapt(self, target: _Target, previous: int | None, value: int) -> float:
+        """Next poll interval: shorter on fast drops, longer while stable."""
+        if previous is None:
+            return target.interval
+        alert = self._alert_drops.get(target.input_type, 1)
+        change = value - previous
+        if change <= -alert:
+            return max(self._min_interval, target.interval / 2)
+        if abs(change) < alert:
+            return min(self._max_interval, target.interval * self._backoff)
+        return target.interval
+
+    def _reschedule(self, key: SensorKey, target: _Target) -> None:
+        target.due = time.monotonic() + target.interval
+        heapq.heappush(self._due, (target.due, key))
+        self._alarm.wake()
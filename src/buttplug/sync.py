@@ -0,0 +1,375 @@
+"""Synchronous, thread-safe facade over ButtplugClient.
+
+For applications whose control code runs on plain threads (render loops,
+game threads, GUIs). The async client runs on an event loop in a background
+thread; commands submitted from any thread go through a lock-free ingestion
+channel that the loop drains in batches, so a burst of submissions costs one
+loop wakeup rather than one cross-thread round trip each.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from collections import deque
+from collections.abc import Callable, Coroutine
+from concurrent.futures import CancelledError, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from buttplug.client import ButtplugClient
+from buttplug.errors import ButtplugDeviceError
+from buttplug.stats import IngestionStats
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from buttplug.command import DeviceOutputCommand
+    from buttplug.connector import ButtplugConnector
+    from buttplug.device import ButtplugDevice
+
+T = TypeVar("T")
+
+# A submitted call: coroutine function, its arguments, and the future to
+# complete (None for fire-and-forget posts)
+_Job = tuple[Callable[..., Coroutine[Any, Any, Any]], tuple[Any, ...], "Future[Any] | None"]
+
+
+class SyncButtplugClient:
+    """Blocking ButtplugClient usable from any thread.
+
+    Every method can be called from any thread except the client's own loop
+    thread. Most commands come in three flavors:
+
+    - blocking (run_output): waits for the server's response and returns or
+      raises like the async method would.
+    - future-returning (submit_output): returns a concurrent.futures.Future
+      right away.
+    - fire-and-forget (post_output): returns immediately; failures are only
+      counted in ingestion_stats.
+
+    Example:
+        with SyncButtplugClient("My App") as client:
+            client.connect("ws://127.0.0.1:12345")
+            client.start_scanning()
+            ...
+            client.post_output(0, DeviceOutputCommand(OutputType.VIBRATE, 0.5))
+    """
+
+    def __init__(self, name: str) -> None:
+        """Create the client and start its event loop thread.
+
+        Args:
+            name: Client application name (sent to server during handshake).
+        """
+        self._loop = asyncio.new_event_loop()
+        self._client = ButtplugClient(name)
+
+        # Ingestion channel: deque appends and pops are atomic, and the flag
+        # makes sure at most one drain is scheduled per batch of submissions
+        self._jobs: deque[_Job] = deque()
+        self._wakeup_pending = False
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self._closed = False
+
+        self._submitted = 0
+        self._wakeups = 0
+        self._max_batch = 0
+        self._failed_posts = 0
+
+        self._thread = threading.Thread(target=self._run_loop, name=f"buttplug-{name}", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> SyncButtplugClient:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def client(self) -> ButtplugClient:
+        """Underlying async client. Only touch it from the loop thread."""
+        return self._client
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop running the client."""
+        return self._loop
+
+    @property
+    def connected(self) -> bool:
+        """True if connected to a server."""
+        return self._client.connected
+
+    @property
+    def devices(self) -> dict[int, ButtplugDevice]:
+        """Snapshot of connected devices by device index, taken on the loop thread.
+
+        Raises:
+            RuntimeError: If read from the client's own loop thread.
+        """
+        return self.call(self._snapshot_devices)
+
+    @property
+    def ingestion_stats(self) -> IngestionStats:
+        """Counters for the cross-thread submission channel."""
+        return IngestionStats(
+            submitted=self._submitted,
+            wakeups=self._wakeups,
+            max_batch=self._max_batch,
+            failed_posts=self._failed_posts,
+        )
+
+    # ============ Client Methods ============
+
+    def connect(self, url: str | ButtplugConnector, timeout: float | None = None) -> None:
+        """Connect to a Buttplug server, blocking until the handshake is done.
+
+        Raises:
+            ButtplugConnectorError: If connection fails.
+            ButtplugHandshakeError: If handshake fails or version mismatch.
+        """
+        self.call(self._client.connect, url, timeout=timeout)
+
+    def disconnect(self, timeout: float | None = None) -> None:
+        """Disconnect from the server."""
+        self.call(self._client.disconnect, timeout=timeout)
+
+    def start_scanning(self, timeout: float | None = None) -> None:
+        """Start scanning for devices."""
+        self.call(self._client.start_scanning, timeout=timeout)
+
+    def stop_scanning(self, timeout: float | None = None) -> None:
+        """Stop scanning for devices."""
+        self.call(self._client.stop_scanning, timeout=timeout)
+
+    def stop_all_devices(self, timeout: float | None = None) -> None:
+        """Stop all devices."""
+        self.call(self._client.stop_all_devices, timeout=timeout)
+
+    def run_output(
+        self,
+        device_index: int,
+        command: DeviceOutputCommand,
+        feature_index: int | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """Send an output command and wait for the server's response.
+
+        Args:
+            device_index: Index of the target device.
+            command: The output command to send.
+            feature_index: Target a single feature, or None for every feature
+                of the device supporting the output type.
+            timeout: Seconds to wait, or None to wait indefinitely.
+
+        Raises:
+            ButtplugDeviceError: If the device or feature doesn't exist or the
+                command fails.
+        """
+        self.call(self._run_output, device_index, command, feature_index, timeout=timeout)
+
+    def submit_output(
+        self,
+        device_index: int,
+        command: DeviceOutputCommand,
+        feature_index: int | None = None,
+    ) -> Future[None]:
+        """Queue an output command, returning a future for its completion."""
+        return self.submit(self._run_output, device_index, command, feature_index)
+
+    def post_output(
+        self,
+        device_index: int,
+        command: DeviceOutputCommand,
+        feature_index: int | None = None,
+    ) -> None:
+        """Queue an output command without waiting for or tracking its result."""
+        self.post(self._run_output, device_index, command, feature_index)
+
+    # ============ Generic Submission ============
+
+    def call(
+        self,
+        fn: Callable[..., Coroutine[Any, Any, T]],
+        *args: Any,
+        timeout: float | None = None,
+    ) -> T:
+        """Run a coroutine function on the client's loop and wait for its result.
+
+        Args:
+            fn: Coroutine function, e.g. an async method of a device or feature.
+            *args: Positional arguments for fn.
+            timeout: Seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            Whatever fn returns.
+
+        Raises:
+            RuntimeError: If called from the client's own loop thread.
+            TimeoutError: If the timeout expires (the call keeps running). Always
+                the builtin class, which concurrent.futures.TimeoutError is not
+                on Python 3.10.
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Blocking calls can't be made from the client's loop thread")
+        future = self.submit(fn, *args)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            if future.done():
+                raise  # Raised by fn itself
+            raise TimeoutError(f"No result within {timeout} seconds") from None
+
+    def submit(self, fn: Callable[..., Coroutine[Any, Any, T]], *args: Any) -> Future[T]:
+        """Run a coroutine function on the client's loop.
+
+        Returns:
+            Future completed with fn's result or exception. Cancelling it before
+            the loop picks it up skips the call.
+        """
+        future: Future[T] = Future()
+        self._enqueue((fn, args, future))
+        return future
+
+    def post(self, fn: Callable[..., Coroutine[Any, Any, Any]], *args: Any) -> None:
+        """Run a coroutine function on the client's loop, fire-and-forget."""
+        self._enqueue((fn, args, None))
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Disconnect, then stop the loop thread.
+
+        Calls still waiting to be picked up by the loop fail with RuntimeError.
+        Safe to call more than once.
+
+        Raises:
+            RuntimeError: If called from the client's own loop thread.
+        """
+        if self._closed:
+            return
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("close() can't be called from the client's loop thread")
+        if self._client.connected:
+            try:
+                self.disconnect(timeout=timeout)
+            except Exception:
+                pass  # Closing anyway
+        self._closed = True
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+
+    # ============ Loop Side ============
+
+    def _run_loop(self) -> None:
+        """Thread target running the event loop until close()."""
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            if self._tasks:
+                self._loop.run_until_complete(asyncio.gather(*self._tasks, return_exceptions=True))
+            self._loop.close()
+            self._fail_pending()
+
+    def _enqueue(self, job: _Job) -> None:
+        """Hand a job to the loop thread, waking it only if no drain is pending."""
+        if self._closed:
+            raise RuntimeError("Client is closed")
+        self._jobs.append(job)
+        if not self._wakeup_pending:
+            self._wakeup_pending = True
+            try:
+                self._loop.call_soon_threadsafe(self._drain)
+            except RuntimeError:
+                pass  # Loop already closed - failed below
+        if self._closed:
+            # Closed while appending: the loop's final sweep may have missed it
+            self._fail_pending()
+
+    def _fail_pending(self) -> None:
+        """Fail every job the loop will never start.
+
+        Both the loop thread (after it stops) and a racing _enqueue() may call
+        this; popleft() is atomic, so each job is failed exactly once.
+        """
+        while True:
+            try:
+                _, _, future = self._jobs.popleft()
+            except IndexError:
+                return
+            if future is None:
+                self._failed_posts += 1
+            elif future.set_running_or_notify_cancel():
+                future.set_exception(RuntimeError("Client is closed"))
+
+    def _drain(self) -> None:
+        """Start every job submitted since the last wakeup."""
+        # Clear the flag first: anything appended from here on either gets
+        # popped below or schedules a fresh drain
+        self._wakeup_pending = False
+        self._wakeups += 1
+
+        jobs = self._jobs
+        batch = 0
+        while jobs:
+            fn, args, future = jobs.popleft()
+            batch += 1
+            if future is not None and not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                task = self._loop.create_task(fn(*args))
+            except Exception as e:
+                if future is not None:
+                    future.set_exception(e)
+                else:
+                    self._failed_posts += 1
+                continue
+
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            if future is not None:
+                task.add_done_callback(functools.partial(_copy_result, future=future))
+            else:
+                task.add_done_callback(self._count_failed_post)
+        self._submitted += batch
+        self._max_batch = max(self._max_batch, batch)
+
+    def _count_failed_post(self, task: asyncio.Task[Any]) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            self._failed_posts += 1
+
+    async def _snapshot_devices(self) -> dict[int, ButtplugDevice]:
+        return dict(self._client.devices)
+
+    async def _run_output(
+        self, device_index: int, command: DeviceOutputCommand, feature_index: int | None
+    ) -> None:
+        device = self._client.devices.get(device_index)
+        if device is None:
+            raise ButtplugDeviceError(f"No device with index {device_index}")
+        if feature_index is None:
+            await device.run_output(command)
+            return
+        feature = device.features.get(feature_index)
+        if feature is None:
+            raise ButtplugDeviceError(f"Device {device_index} has no feature {feature_index}")
+        await feature.run_output(command)
+
+
+def _copy_result(task: asyncio.Task[Any], future: Future[Any]) -> None:
+    """Complete a concurrent future from a finished task."""
+    if task.cancelled():
+        future.set_exception(CancelledError())
+    elif (error := task.exception()) is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(task.result())
@@ -0,0 +1,443 @@
+"""Funscript-style position trajectory playback for strokers."""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import json
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from buttplug._utils.clock import Alarm, PlaybackClock
+from buttplug.command import DeviceOutputCommand
+from buttplug.enums import OutputType
+from buttplug.stats import TrajectoryStats
+
+if TYPE_CHECKING:
+    from buttplug.feature import DeviceFeature
+    from buttplug.motion import MotionPlan, MotionPlanner
+
+# Timer callbacks may fire up to a clock tick early; positions are evaluated
+# this many seconds ahead so a wakeup at a deadline always sees its move
+_TIMER_SLACK = 1e-6
+
+
+@dataclass(frozen=True)
+class Action:
+    """A point of a trajectory: be at a position at a time.
+
+    Args:
+        at: Milliseconds from the start of the media.
+        pos: Position from 0 (bottom) to 100 (top).
+    """
+
+    at: int
+    pos: float
+
+
+@dataclass(frozen=True)
+class Trajectory:
+    """A sequence of actions, as found in a funscript.
+
+    Args:
+        actions: Actions sorted by time.
+    """
+
+    actions: tuple[Action, ...]
+
+    def __post_init__(self) -> None:
+        if not self.actions:
+            raise ValueError("Trajectory must have at least one action")
+        if any(b.at < a.at for a, b in zip(self.actions, self.actions[1:])):
+            raise ValueError("Trajectory actions must be sorted by time")
+        if self.actions[0].at < 0:
+            raise ValueError("Trajectory action times must not be negative")
+        if any(not 0 <= action.pos <= 100 for action in self.actions):
+            raise ValueError("Trajectory positions must be between 0 and 100")
+
+    @property
+    def duration(self) -> float:
+        """Time of the last action in seconds."""
+        return self.actions[-1].at / 1000.0
+
+    @classmethod
+    def from_actions(cls, actions: Iterable[tuple[int, float]]) -> Trajectory:
+        """Create a trajectory from (time_ms, position) pairs."""
+        return cls(tuple(Action(at, pos) for at, pos in actions))
+
+    @classmethod
+    def from_funscript(cls, script: str | bytes | Mapping[str, Any]) -> Trajectory:
+        """Load a funscript.
+
+        Args:
+            script: Funscript JSON text, or the already decoded object. Actions
+                are read from "actions" ({"at": ms, "pos": 0-100} objects) and
+                flipped if "inverted" is true.
+
+        Raises:
+            ValueError: If the script is malformed.
+        """
+        data = json.loads(script) if isinstance(script, (str, bytes)) else script
+        try:
+            inverted = bool(data.get("inverted", False))
+            actions = [
+                Action(int(action["at"]), float(action["pos"])) for action in data["actions"]
+            ]
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid funscript: {e}") from e
+        if inverted:
+            actions = [Action(action.at, 100.0 - action.pos) for action in actions]
+        actions.sort(key=lambda action: action.at)
+        return cls(tuple(actions))
+
+
+class TrajectoryPlayer:
+    """Plays a trajectory on a HwPositionWithDuration feature, synced to media.
+
+    Every segment between two actions becomes one move command, issued when
+    the segment starts (segments longer than the feature's maximum duration
+    are split). Moves are sent ahead of time by a lead of the configured
+    lookahead plus a fraction of the measured command round-trip time, so they
+    reach the device when the media gets there. The round-trip time is an
+    exponentially weighted moving average over every move sent.
+
+    The media position runs on the event loop's monotonic clock. Drive it with
+    start(), pause(), resume(), seek() and speed, or keep it locked to an
+    external player by calling sync() with that player's position whenever it
+    reports one.
+
+    Example:
+        player = TrajectoryPlayer(stroker, Trajectory.from_funscript(text))
+        player.start()
+        ...
+        player.sync(video.position, paused=video.paused)
+    """
+
+    def __init__(
+        self,
+        feature: DeviceFeature,
+        trajectory: Trajectory,
+        lookahead: float = 0.0,
+        latency_compensation: float = 0.5,
+        rtt_smoothing: float = 0.2,
+        sync_tolerance: float = 0.05,
+        planner: MotionPlanner | None = None,
+        max_lateness: float = 0.05,
+    ) -> None:
+        """Convert the trajectory into moves for the feature.
+
+        Args:
+            feature: Feature with a HwPositionWithDuration output.
+            trajectory: Actions to play.
+            lookahead: Fixed seconds to send moves ahead of their start.
+            latency_compensation: Fraction of the measured round-trip time added to
+                the lookahead (0.5 assumes the device acts halfway through it).
+            rtt_smoothing: Weight (0-1] of each new round-trip sample in the
+                moving average.
+            sync_tolerance: Seconds sync() lets the clock deviate from the media
+                position before jumping to it.
+            planner: Simplify and velocity-limit the trajectory with this
+                planner instead of sending one move per segment.
+            max_lateness: Seconds a move may be issued after its start and still
+                get its full duration. Later moves are shortened to end on time
+                and counted as late.
+
+        Raises:
+            ButtplugDeviceError: If the feature has no HwPositionWithDuration output.
+            ValueError: If an option is out of range.
+        """
+        if min(lookahead, latency_compensation, sync_tolerance, max_lateness) < 0:
+            raise ValueError(
+                "lookahead, latency_compensation, sync_tolerance and max_lateness must be >= 0"
+            )
+        if not 0 < rtt_smoothing <= 1:
+            raise ValueError("rtt_smoothing must be in (0, 1]")
+
+        self._feature = feature
+        self._trajectory = trajectory
+        self._lookahead = lookahead
+        self._latency_compensation = latency_compensation
+        self._rtt_smoothing = rtt_smoothing
+        self._sync_tolerance = sync_tolerance
+        self._max_lateness = max_lateness
+
+        # Moves as parallel lists: start and end times in seconds, target step
+        self._starts: list[float] = []
+        self._ends: list[float] = []
+        self._steps: list[int] = []
+        self._plan: MotionPlan | None = None
+        if planner is not None:
+            if planner.output_type is not OutputType.POSITION_WITH_DURATION:
+                raise ValueError("planner must plan for HwPositionWithDuration")
+            self._plan = planner.plan(feature, trajectory)
+            for move in self._plan.moves:
+                self._starts.append(move.start)
+                self._ends.append(move.end)
+                self._steps.append(move.step)
+        else:
+            self._build_moves()
+
+        self._clock = PlaybackClock()
+        self._alarm = Alarm()
+        self._task: asyncio.Task[None] | None = None
+        self._next = 0
+        self._resync = True
+        self._sends: set[asyncio.Task[None]] = set()
+        self._rtt: float | None = None
+        self._last_error: Exception | None = None
+
+        self._sent = 0
+        self._late = 0
+        self._skipped = 0
+        self._errors = 0
+
+    @property
+    def trajectory(self) -> Trajectory:
+        """Trajectory being played."""
+        return self._trajectory
+
+    @property
+    def move_count(self) -> int:
+        """Number of move commands the trajectory was converted into."""
+        return len(self._starts)
+
+    @property
+    def plan(self) -> MotionPlan | None:
+        """Plan the moves came from, if a planner was given."""
+        return self._plan
+
+    @property
+    def position(self) -> float:
+        """Current media position in seconds."""
+        if self._task is None:
+            return 0.0
+        return self._clock.position(self._now())
+
+    @property
+    def speed(self) -> float:
+        """Media playback rate. Takes effect immediately."""
+        return self._clock.speed
+
+    @speed.setter
+    def speed(self, speed: float) -> None:
+        self._clock.set_speed(speed, self._now())
+        self._resync = True
+        self._alarm.wake()
+
+    @property
+    def lead(self) -> float:
+        """Seconds moves are currently sent ahead of their start."""
+        return self._lookahead + self._latency_compensation * (self._rtt or 0.0)
+
+    @property
+    def playing(self) -> bool:
+        """True from start() until the last move is sent or playback is stopped."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def paused(self) -> bool:
+        """True while paused."""
+        return self._clock.paused
+
+    @property
+    def last_error(self) -> Exception | None:
+        """Most recent error raised while sending a move."""
+        return self._last_error
+
+    @property
+    def stats(self) -> TrajectoryStats:
+        """Snapshot of playback counters and the round-trip estimate."""
+        return TrajectoryStats(
+            sent=self._sent,
+            late=self._late,
+            skipped=self._skipped,
+            errors=self._errors,
+            rtt=self._rtt or 0.0,
+            lead=self.lead,
+        )
+
+    def start(self, position: float = 0.0) -> None:
+        """Start playback in the background.
+
+        Args:
+            position: Media position in seconds to start at.
+
+        Raises:
+            RuntimeError: If already playing.
+        """
+        if self.playing:
+            raise RuntimeError("Playback is already running")
+        self._clock = PlaybackClock(self._clock.speed)
+        self._clock.set(max(0.0, position), self._now())
+        self._resync = True
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop issuing moves and wait for those in flight."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def wait(self) -> None:
+        """Wait until the last move has been sent."""
+        if self._task is not None:
+            await asyncio.shield(self._task)
+
+    def pause(self) -> None:
+        """Freeze the media position. The current move still completes."""
+        if self._clock.paused:
+            return
+        self._clock.pause(self._now())
+        self._alarm.wake()
+
+    def resume(self) -> None:
+        """Continue from the paused position."""
+        if not self._clock.paused:
+            return
+        self._clock.resume(self._now())
+        self._resync = True
+        self._alarm.wake()
+
+    def seek(self, position: float) -> None:
+        """Jump to a media position, moving toward the target there right away.
+
+        Args:
+            position: Media position in seconds.
+        """
+        self._clock.set(max(0.0, position), self._now())
+        self._resync = True
+        self._alarm.wake()
+
+    def sync(self, position: float, paused: bool = False) -> None:
+        """Follow an external media clock.
+
+        Call whenever the media player reports its position. Small deviations
+        (within sync_tolerance) are ignored, so regular position reports don't
+        cause needless jumps.
+
+        Args:
+            position: The media player's position in seconds.
+            paused: Whether the media player is paused.
+        """
+        now = self._now()
+        if paused:
+            self.pause()
+            self._clock.set(max(0.0, position), now)
+            return
+        if self._clock.paused:
+            self._clock.set(max(0.0, position), now)
+            self.resume()
+            return
+        if abs(self._clock.position(now) - position) > self._sync_tolerance:
+            self.seek(position)
+
+    # ============ Internal Methods ============
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_running_loop().time()
+
+    def _build_moves(self) -> None:
+        """Turn each segment into a move, splitting ones too long for the device."""
+        output_type = OutputType.POSITION_WITH_DURATION
+        duration_range = self._feature.duration_range(output_type)
+        max_duration = duration_range[1] / 1000.0 if duration_range else None
+
+        previous: Action | None = None
+        for action in self._trajectory.actions:
+            start = previous.at / 1000.0 if previous is not None else 0.0
+            end = action.at / 1000.0
+            pieces = 1
+            if previous is not None and max_duration and end - start > max_duration:
+                pieces = int((end - start) // max_duration) + 1
+            for piece in range(1, pieces + 1):
+                fraction = piece / pieces
+                pos = action.pos
+                if previous is not None:
+                    pos = previous.pos + (action.pos - previous.pos) * fraction
+                self._starts.append(start + (end - start) * (piece - 1) / pieces)
+                self._ends.append(start + (end - start) * fraction)
+                self._steps.append(self._feature.convert_to_step(output_type, pos / 100.0))
+            previous = action
+
+    async def _run(self) -> None:
+        """Issue moves as the media position reaches them, until the last one."""
+        try:
+            while True:
+                if self._clock.paused:
+                    await self._alarm.sleep_until(None)
+                    continue
+
+                now = self._now()
+                lead = self.lead
+                # Where the media will be once a move sent now takes effect
+                position = self._clock.position(now + _TIMER_SLACK) + lead * self._clock.speed
+                if self._resync:
+                    self._resync = False
+                    self._issue_current(position)
+                else:
+                    self._issue_due(position)
+
+                if self._next >= len(self._starts):
+                    break
+                deadline = self._clock.loop_time(self._starts[self._next]) - lead
+                await self._alarm.sleep_until(deadline)
+        finally:
+            if self._sends:
+                await asyncio.gather(*self._sends, return_exceptions=True)
+
+    def _issue_current(self, position: float) -> None:
+        """After start, seek or resume: head for the target of the current move."""
+        index = bisect.bisect_right(self._starts, position) - 1
+        self._next = index + 1
+        if index >= 0 and position < self._ends[index]:
+            self._issue(index, position)
+
+    def _issue_due(self, position: float) -> None:
+        """Issue the next move if due, skipping any the player fell behind on."""
+        due = bisect.bisect_right(self._starts, position, lo=self._next)
+        if due <= self._next:
+            return
+        self._skipped += due - self._next - 1
+        self._next = due
+        index = due - 1
+        if position - self._starts[index] > self._max_lateness:
+            self._late += 1
+            self._issue(index, position)
+        else:
+            # On time (within timer precision): the move gets its full duration
+            self._issue(index, self._starts[index])
+
+    def _issue(self, index: int, position: float) -> None:
+        """Send move index so it ends on time, starting from the given position."""
+        remaining = max(0.0, self._ends[index] - max(position, self._starts[index]))
+        duration = round(remaining / self._clock.speed * 1000)
+        command = DeviceOutputCommand(
+            OutputType.POSITION_WITH_DURATION, self._steps[index], duration=duration
+        )
+        task = asyncio.get_running_loop().create_task(self._send(command))
+        self._sends.add(task)
+        task.add_done_callback(self._sends.discard)
+
+    async def _send(self, command: DeviceOutputCommand) -> None:
+        loop = asyncio.get_running_loop()
+        sent_at = loop.time()
+        try:
+            await self._feature.run_output(command)
+        except Exception as e:
+            self._errors += 1
+            self._last_error = e
+            return
+        self._sent += 1
+
+        sample = loop.time() - sent_at
+        if self._rtt is None:
+            self._rtt = sample
+        else:
+            self._rtt += self._rtt_smoothing * (sample - self._rtt)
@@ -54,3 +54,123 @@ def sample_device_list_data() -> dict:
 def sample_input_reading_data() -> dict:
     """Sample InputReading message data from protocol."""
     return {"Id": 5, "DeviceIndex": 0, "FeatureIndex": 2, "Reading": {"Battery": {"Value": 75}}}
+
+
+class FakeServer:
+    """Minimal in-process Buttplug server over a real WebSocket.
+
+    Answers the handshake, device list, ping and scanning requests, acks
+    output/stop commands and records every message it receives.
+    """
+
+    def __init__(self, devices: dict) -> None:
+        self.devices = devices
+        self.received: list[tuple[str, dict]] = []
+        self.connections: list = []
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        port = self._server.sockets[0].getsockname()[1]
+        return f"ws://127.0.0.1:{port}"
+
+    async def start(self) -> None:
+        from websockets.asyncio.server import serve
+
+        self._server = await serve(self._handle, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def drop_connections(self) -> None:
+        """Close every client connection, as if the link failed."""
+        for ws in self.connections:
+            await ws.close()
+        self.connections.clear()
+
+    def count(self, message_type: str) -> int:
+        return sum(1 for name, _ in self.received if name == message_type)
+
+    async def _handle(self, ws) -> None:
+        import json
+
+        self.connections.append(ws)
+        try:
+            async for raw in ws:
+                replies = []
+                for message in json.loads(raw):
+                    ((name, fields),) = message.items()
+                    self.received.append((name, fields))
+                    replies.append(self._reply(name, fields))
+                await ws.send(json.dumps(replies))
+        except Exception:
+            pass
+
+    def _reply(self, name: str, fields: dict) -> dict:
+        msg_id = fields["Id"]
+        if name == "RequestServerInfo":
+            return {
+                "ServerInfo": {
+                    "Id": msg_id,
+                    "ServerName": "Fake Server",
+                    "MaxPingTime": 0,
+                    "ProtocolVersionMajor": 4,
+                    "ProtocolVersionMinor": 0,
+                }
+            }
+        if name == "RequestDeviceList":
+            return {"DeviceList": {"Id": msg_id, "Devices": self.devices}}
+        return {"Ok": {"Id": msg_id}}
+
+
+@pytest.fixture
+async def fake_server(sample_device_list_data: dict):
+    """Running FakeServer serving the sample device list."""
+    server = FakeServer(sample_device_list_data["Devices"])
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+def loopback_server(sample_device_list_data: dict):
+    """LoopbackServer serving the sample device list."""
+    from buttplug import LoopbackServer
+
+    return LoopbackServer(sample_device_list_data["Devices"])
+
+
+@pytest.fixture
+async def loopback_client(loopback_server):
+    """ButtplugClient connected to the loopback server, disconnected afterwards.
+
+    Override loopback_server in a module or class to connect to other devices.
+    """
+    from buttplug import ButtplugClient, LoopbackConnector
+
+    client = ButtplugClient("Test")
+    await client.connect(LoopbackConnector(loopback_server))
+    yield client
+    await client.disconnect()
+
+
+@pytest.fixture
+def sensor_device() -> dict:
+    """Device 2: a readable, subscribable pressure sensor and a subscribe-only button."""
+    return {
+        "DeviceName": "Test Sensor",
+        "DeviceIndex": 2,
+        "DeviceFeatures": {
+            "0": {
+                "FeatureIndex": 0,
+                "FeatureDescription": "Pressure",
+                "Input": {"Pressure": {"Value": [[0, 1000]], "Command": ["Read", "Subscribe"]}},
+            },
+            "1": {
+                "FeatureIndex": 1,
+                "FeatureDescription": "Button",
+                "Input": {"Button": {"Value": [[0, 1]], "Command": ["Subscribe"]}},
+            },
+        },
+    }
@@ -1,8 +1,16 @@
 """Tests for ButtplugClient (unit tests without network)."""
 
+import asyncio
+
 import pytest
 
-from buttplug import ButtplugClient
+from buttplug import (
+    ButtplugClient,
+    DeviceOutputCommand,
+    OutputType,
+    PipelineStats,
+    ReconnectPolicy,
+)
 from buttplug.errors import ButtplugConnectorError
 
 
@@ -23,6 +31,16 @@ class TestButtplugClientInit:
         assert client.scanning is False
         assert len(client.devices) == 0
 
+    def test_pipeline_outputs_disabled_by_default(self):
+        """Output commands wait for acknowledgement unless pipelining is enabled."""
+        client = ButtplugClient("Test")
+
+        assert client.pipeline_outputs is False
+        assert client.pipeline_stats == PipelineStats()
+
+        client.pipeline_outputs = True
+        assert client.pipeline_outputs is True
+
     def test_event_callbacks_none_by_default(self):
         """Event callbacks are None by default."""
         client = ButtplugClient("Test")
@@ -87,3 +105,114 @@ class TestButtplugClientNotConnected:
         # Should not raise
         await client.disconnect()
         assert client.connected is False
+
+
+class TestButtplugClientReconnect:
+    """Tests for automatic reconnect against an in-process server."""
+
+    @pytest.mark.parametrize("attempt", [0, 10, 1100, 10**6])
+    def test_delay_capped_for_any_attempt(self, attempt):
+        """Backoff never exceeds max_delay, however many attempts were made."""
+        policy = ReconnectPolicy(max_attempts=None, initial_delay=0.1, jitter=0.0)
+
+        assert 0.1 <= policy.delay(attempt) <= policy.max_delay
+        if attempt >= 10:
+            assert policy.delay(attempt) == policy.max_delay
+        assert ReconnectPolicy(initial_delay=0.0).delay(attempt) == 0.0
+
+    async def test_connect_and_list_devices(self, fake_server):
+        """Client connects, handshakes and receives the device list."""
+        client = ButtplugClient("Test")
+        await client.connect(fake_server.url)
+
+        assert client.connected is True
+        assert client.server_name == "Fake Server"
+        assert set(client.devices) == {0, 1}
+
+        await client.disconnect()
+
+    async def test_reconnect_rebinds_devices(self, fake_server):
+        """Devices keep their identity across a dropped connection."""
+        client = ButtplugClient("Test")
+        client.reconnect_policy = ReconnectPolicy(initial_delay=0.01)
+        reconnected = asyncio.Event()
+        client.on_reconnected = reconnected.set
+        removed = []
+        client.on_device_removed = removed.append
+
+        await client.connect(fake_server.url)
+        device = client.devices[0]
+        feature = device.features[0]
+
+        await fake_server.drop_connections()
+        await asyncio.wait_for(reconnected.wait(), timeout=2)
+
+        assert client.connected is True
+        assert client.devices[0] is device
+        assert device.features[0] is feature
+        assert removed == []
+        assert fake_server.count("RequestServerInfo") == 2
+
+        await client.disconnect()
+
+    async def test_reconnect_restores_outputs(self, fake_server):
+        """restore_outputs re-sends the last output of every feature."""
+        client = ButtplugClient("Test")
+        client.reconnect_policy = ReconnectPolicy(initial_delay=0.01, restore_outputs=True)
+        reconnected = asyncio.Event()
+        client.on_reconnected = reconnected.set
+
+        await client.connect(fake_server.url)
+        await client.devices[0].features[0].run_output(DeviceOutputCommand(OutputType.VIBRATE, 0.5))
+        assert fake_server.count("OutputCmd") == 1
+
+        await fake_server.drop_connections()
+        await asyncio.wait_for(reconnected.wait(), timeout=2)
+
+        assert fake_server.count("OutputCmd") == 2
+        name, fields = fake_server.received[-1]
+        assert name == "OutputCmd"
+        assert fields["Command"] == {"Vibrate": {"Value": 10}}
+
+        await client.disconnect()
+
+    async def test_stop_forgets_outputs(self, fake_server):
+        """Stopped features have nothing to restore."""
+        client = ButtplugClient("Test")
+        await client.connect(fake_server.url)
+        feature = client.devices[0].features[0]
+
+        await feature.run_output(DeviceOutputCommand(OutputType.VIBRATE, 0.5))
+        assert feature._last_outputs
+        await client.devices[0].stop()
+        assert not feature._last_outputs
+
+        await client.disconnect()
+
+    async def test_reconnect_gives_up(self, fake_server):
+        """After max_attempts the client gives up and reports the disconnect."""
+        client = ButtplugClient("Test")
+        client.reconnect_policy = ReconnectPolicy(max_attempts=2, initial_delay=0.01)
+        disconnected = asyncio.Event()
+        client.on_server_disconnect = disconnected.set
+
+        await client.connect(fake_server.url)
+        await fake_server.stop()
+        await fake_server.drop_connections()
+        await asyncio.wait_for(disconnected.wait(), timeout=2)
+
+        assert client.connected is False
+        assert client.reconnecting is False
+        assert client.devices == {}
+
+    async def test_no_policy_clears_devices(self, fake_server):
+        """Without a policy a dropped connection clears devices immediately."""
+        client = ButtplugClient("Test")
+        disconnected = asyncio.Event()
+        client.on_server_disconnect = disconnected.set
+
+        await client.connect(fake_server.url)
+        await fake_server.drop_connections()
+        await asyncio.wait_for(disconnected.wait(), timeout=2)
+
+        assert client.devices == {}
@@ -1,11 +1,23 @@
 """Tests for connector and message sorter."""
 
 import asyncio
+import json
 
 import pytest
+import websockets
 
-from buttplug._messages import Ok
+from buttplug._messages import ButtplugMessage, Ok, OutputCmd, Ping
 from buttplug._utils.message_sorter import MessageSorter
+from buttplug.codec import (
+    JsonCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    default_codec,
+)
+from buttplug.connector import WebSocketConnector
+from buttplug.errors import ButtplugConnectorError
+from buttplug.flow import FlowControl, OverflowPolicy
 
 
 class TestMessageSorter:
@@ -35,7 +47,7 @@ class TestMessageSorter:
         await asyncio.sleep(0.01)
 
         # Resolve the request
-        resolved = await sorter.resolve(msg_id, response)
+        resolved = sorter.resolve(msg_id, response)
         assert resolved is True
 
         # Check the result
@@ -48,7 +60,7 @@ class TestMessageSorter:
         sorter = MessageSorter()
         response = Ok(id=999)
 
-        resolved = await sorter.resolve(999, response)
+        resolved = sorter.resolve(999, response)
         assert resolved is False
 
     async def test_timeout(self):
@@ -73,7 +85,7 @@ class TestMessageSorter:
 
         # Reject all
         error = RuntimeError("Test error")
-        await sorter.reject_all(error)
+        sorter.reject_all(error)
 
         # Both should raise the error
         with pytest.raises(RuntimeError, match="Test error"):
@@ -94,11 +106,77 @@ class TestMessageSorter:
 
         assert sorter.pending_count == 1
 
-        await sorter.resolve(msg_id, Ok(id=msg_id))
+        sorter.resolve(msg_id, Ok(id=msg_id))
         await task
 
         assert sorter.pending_count == 0
 
+    async def test_register_before_wait(self):
+        """A response that arrives before anyone awaits is not lost."""
+        sorter = MessageSorter()
+        msg_id = sorter.get_next_id()
+
+        future = sorter.register(msg_id)
+        assert sorter.resolve(msg_id, Ok(id=msg_id)) is True
+
+        result = await future
+        assert result.id == msg_id
+        assert sorter.pending_count == 0
+
+    async def test_timeout_expires_many_with_one_timer(self):
+        """Many requests share the timer wheel and all time out."""
+        sorter = MessageSorter(tick=0.01)
+        ids = [sorter.get_next_id() for _ in range(100)]
+        tasks = [asyncio.create_task(sorter.wait_for_response(i, timeout=0.02)) for i in ids]
+        await asyncio.sleep(0)
+
+        # Resolve half of them; the rest must expire
+        for msg_id in ids[::2]:
+            sorter.resolve(msg_id, Ok(id=msg_id))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        timeouts = [r for r in results if isinstance(r, asyncio.TimeoutError)]
+        assert len(timeouts) == 50
+
+        stats = sorter.stats
+        assert stats.in_flight == 0
+        assert stats.resolved == 50
+        assert stats.expired == 50
+        assert stats.expire_rate == 0.5
+
+    async def test_resolve_after_timeout_is_ignored(self):
+        """A late response for an expired request is not delivered."""
+        sorter = MessageSorter(tick=0.01)
+        msg_id = sorter.get_next_id()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await sorter.wait_for_response(msg_id, timeout=0.01)
+
+        assert sorter.resolve(msg_id, Ok(id=msg_id)) is False
+
+    async def test_cancelled_wait_is_unregistered(self):
+        """Cancelling a waiter removes its pending entry."""
+        sorter = MessageSorter()
+        msg_id = sorter.get_next_id()
+        task = asyncio.create_task(sorter.wait_for_response(msg_id))
+        await asyncio.sleep(0)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert sorter.pending_count == 0
+
+    async def test_pipelined_requests_expire(self):
+        """Pipelined requests nobody answers are counted as expired."""
+        sorter = MessageSorter(tick=0.01)
+        sorter.track(sorter.get_next_id(), timeout=0.01)
+
+        await asyncio.sleep(0.05)
+
+        stats = sorter.pipeline_stats
+        assert stats.expired == 1
+        assert stats.outstanding == 0
+
     async def test_id_wraps_at_max(self):
         """Message ID wraps around at protocol maximum."""
         sorter = MessageSorter()
@@ -109,3 +187,628 @@ class TestMessageSorter:
 
         assert id1 == 4294967295
         assert id2 == 1  # Wrapped back to 1 (not 0, which is reserved)
+
+    async def test_latency_recorded_per_type_and_device(self):
+        """Labelled requests file their round-trip time by type and device."""
+        sorter = MessageSorter()
+        sorter.register(1, label=("OutputCmd", 3))
+        sorter.register(2, label=("Ping", None))
+        sorter.register(3)
+        await asyncio.sleep(0.01)
+
+        for msg_id in (1, 2, 3):
+            sorter.resolve(msg_id, Ok(id=msg_id))
+
+        by_type = sorter.latency_by_type
+        assert set(by_type) == {"OutputCmd", "Ping"}
+        assert by_type["OutputCmd"].count == 1
+        assert by_type["OutputCmd"].min >= 0.005
+        assert set(sorter.latency_by_device) == {3}
+
+    async def test_late_and_unknown_responses(self):
+        """Responses to expired requests are late; unmatched Ids are unknown."""
+        sorter = MessageSorter(tick=0.01)
+        msg_id = sorter.get_next_id()
+        with pytest.raises(asyncio.TimeoutError):
+            await sorter.wait_for_response(msg_id, timeout=0.01)
+
+        sorter.resolve(msg_id, Ok(id=msg_id))
+        sorter.resolve(999, Ok(id=999))
+
+        assert sorter.late_count == 1
+        assert sorter.unknown_count == 1
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a websockets client connection."""
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+        self.incoming: asyncio.Queue[str] = asyncio.Queue()
+
+    async def send(self, data: str) -> None:
+        self.sent.append(data)
+
+    async def recv(self) -> str:
+        return await self.incoming.get()
+
+    async def close(self) -> None:
+        pass
+
+
+class BrokenCodec(StdlibJsonCodec):
+    """Codec that can't encode anything."""
+
+    def encode(self, data):
+        raise TypeError("payload is not serializable")
+
+
+def connected_connector(
+    batch_window: float | None = None,
+    flow_control: FlowControl | None = None,
+) -> tuple[WebSocketConnector, FakeWebSocket]:
+    """Connector wired to a fake socket, without a receive loop."""
+    connector = WebSocketConnector(
+        "ws://test", batch_window=batch_window, flow_control=flow_control
+    )
+    ws = FakeWebSocket()
+    connector._ws = ws  # type: ignore[assignment]
+    connector._connected = True
+    return connector, ws
+
+
+class TestWebSocketConnectorBatching:
+    """Tests for opt-in outbound batching."""
+
+    async def test_unbatched_sends_one_frame_per_message(self):
+        """Without a batch window every message gets its own frame."""
+        connector, ws = connected_connector()
+
+        tasks = [asyncio.create_task(connector.send(Ping(id=0), timeout=1)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        assert len(ws.sent) == 3
+        for msg_id in (1, 2, 3):
+            connector._message_sorter.resolve(msg_id, Ok(id=msg_id))
+        await asyncio.gather(*tasks)
+
+    async def test_same_tick_sends_share_one_frame(self):
+        """Messages sent in the same tick are coalesced into one array frame."""
+        connector, ws = connected_connector(batch_window=0.0)
+
+        tasks = [asyncio.create_task(connector.send(Ping(id=0), timeout=1)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        assert len(ws.sent) == 1
+        frame = json.loads(ws.sent[0])
+        assert [m["Ping"]["Id"] for m in frame] == [1, 2, 3]
+
+        # Each caller still gets its own response
+        for msg_id in (3, 1, 2):
+            connector._message_sorter.resolve(msg_id, Ok(id=msg_id))
+        results = await asyncio.gather(*tasks)
+        assert [r.id for r in results] == [1, 2, 3]
+
+    async def test_window_collects_later_sends(self):
+        """A non-zero window collects messages sent across ticks."""
+        connector, ws = connected_connector(batch_window=0.05)
+
+        first = asyncio.create_task(connector.send(Ping(id=0), timeout=1))
+        await asyncio.sleep(0)
+        await connector.send_no_response(Ping(id=0))
+        assert ws.sent == []
+
+        await asyncio.sleep(0.1)
+        assert len(ws.sent) == 1
+        assert len(json.loads(ws.sent[0])) == 2
+
+        connector._message_sorter.resolve(1, Ok(id=1))
+        await first
+
+    async def test_failed_batch_write_rejects_callers(self):
+        """A failed batch write fails every caller waiting on it."""
+        connector, ws = connected_connector(batch_window=0.0)
+
+        async def broken_send(data: str) -> None:
+            raise OSError("socket gone")
+
+        ws.send = broken_send  # type: ignore[method-assign]
+
+        with pytest.raises(ButtplugConnectorError, match="socket gone"):
+            await connector.send(Ping(id=0), timeout=1)
+        assert connector._message_sorter.pending_count == 0
+
+    async def test_failed_batch_encode_rejects_callers(self):
+        """Errors other than connector errors also fail every waiting caller."""
+        connector, ws = connected_connector(batch_window=0.0)
+        connector._codec = BrokenCodec()
+
+        with pytest.raises(ButtplugConnectorError, match="not serializable") as excinfo:
+            await connector.send(Ping(id=0), timeout=1)
+        assert isinstance(excinfo.value.__cause__, TypeError)
+        assert connector._message_sorter.pending_count == 0
+
+
+class TestWebSocketConnectorPipelined:
+    """Tests for pipelined sends that don't wait for their response."""
+
+    async def test_send_pipelined_counts_acks_and_errors(self):
+        """Responses to pipelined sends are matched and counted."""
+        connector, ws = connected_connector()
+        received: list[ButtplugMessage] = []
+
+        async def on_message(msg: ButtplugMessage) -> None:
+            received.append(msg)
+
+        connector.set_message_callback(on_message)
+        connector._receive_task = asyncio.create_task(connector._receive_loop())
+
+        for _ in range(3):
+            cmd = OutputCmd(
+                id=0, device_index=0, feature_index=0, command={"Vibrate": {"Value": 5}}
+            )
+            await connector.send_pipelined(cmd)
+
+        assert len(ws.sent) == 3
+        assert connector.pipeline_stats.outstanding == 3
+
+        ws.incoming.put_nowait(json.dumps([{"Ok": {"Id": 1}}, {"Ok": {"Id": 2}}]))
+        ws.incoming.put_nowait(
+            json.dumps([{"Error": {"Id": 3, "ErrorMessage": "Device gone", "ErrorCode": 4}}])
+        )
+        await asyncio.sleep(0.01)
+
+        stats = connector.pipeline_stats
+        assert stats.sent == 3
+        assert stats.acknowledged == 2
+        assert stats.errors == 1
+        assert stats.outstanding == 0
+
+        # Only the error is surfaced to the message callback
+        assert len(received) == 1
+        assert received[0].id == 3
+
+        await connector.disconnect()
+
+
+class TestConnectionStats:
+    """Tests for wire traffic counters and round-trip times."""
+
+    async def test_traffic_and_latency(self):
+        """Frames, bytes and round-trip times are counted in both directions."""
+        connector, ws = connected_connector()
+        connector._receive_task = asyncio.create_task(connector._receive_loop())
+
+        task = asyncio.create_task(connector.send(vibrate(5), timeout=1))
+        await asyncio.sleep(0.01)
+        assert connector.connection_stats.in_flight == 1
+
+        reply = json.dumps([{"Ok": {"Id": 1}}])
+        ws.incoming.put_nowait(reply)
+        await task
+        # Text frames are counted in encoded bytes, not characters
+        unicode_reply = json.dumps(
+            [{"Error": {"Id": 99, "ErrorMessage": "déjà vu", "ErrorCode": 1}}], ensure_ascii=False
+        )
+        ws.incoming.put_nowait(unicode_reply)
+        await asyncio.sleep(0.01)
+
+        stats = connector.connection_stats
+        assert stats.frames_out == 1
+        assert stats.bytes_out == len(ws.sent[0])
+        assert stats.frames_in == 2
+        assert stats.bytes_in == len(reply) + len(unicode_reply.encode())
+        assert len(unicode_reply.encode()) > len(unicode_reply)
+        assert stats.in_flight == 0
+        assert stats.latency_by_type["OutputCmd"].count == 1
+        assert stats.latency_by_device[0].min >= 0.005
+        assert stats.latency.count == 1
+
+        await connector.disconnect()
+
+    async def test_malformed_and_unknown_frames_counted(self):
+        """Undecodable frames and responses for no request are counted, not fatal."""
+        connector, ws = connected_connector()
+        connector._receive_task = asyncio.create_task(connector._receive_loop())
+
+        ws.incoming.put_nowait("[{not json")
+        ws.incoming.put_nowait(json.dumps([{"NoSuchMessage": {"Id": 1}}]))
+        ws.incoming.put_nowait(json.dumps([{"Ok": {"Id": 42}}]))
+        await asyncio.sleep(0.01)
+
+        stats = connector.connection_stats
+        assert stats.frames_in == 3
+        assert stats.malformed_frames == 2
+        assert stats.unknown_responses == 1
+        assert connector.connected
+
+        await connector.disconnect()
+
+    async def test_timeouts_and_late_responses(self):
+        """A response after its request timed out counts as late."""
+        connector, ws = connected_connector()
+        connector._message_sorter = MessageSorter(tick=0.01)
+        connector._receive_task = asyncio.create_task(connector._receive_loop())
+
+        with pytest.raises(asyncio.TimeoutError):
+            await connector.send(Ping(id=0), timeout=0.01)
+        ws.incoming.put_nowait(json.dumps([{"Ok": {"Id": 1}}]))
+        await asyncio.sleep(0.01)
+
+        stats = connector.connection_stats
+        assert stats.timeouts == 1
+        assert stats.late_responses == 1
+        assert stats.unknown_responses == 0
+        assert "Ping" not in stats.latency_by_type
+
+        await connector.disconnect()
+
+
+def vibrate(value: int, feature_index: int = 0) -> OutputCmd:
+    return OutputCmd(
+        id=0, device_index=0, feature_index=feature_index, command={"Vibrate": {"Value": value}}
+    )
+
+
+def sent_ids(ws: FakeWebSocket) -> list[int]:
+    """Message Ids of every message written so far, in order."""
+    ids = []
+    for frame in ws.sent:
+        for message in json.loads(frame):
+            (fields,) = message.values()
+            ids.append(fields["Id"])
+    return ids
+
+
+class TestFlowControl:
+    """Tests for the bounded in-flight window and send queue."""
+
+    async def test_window_bounds_in_flight(self):
+        """Commands beyond the window wait until a slot frees up."""
+        connector, ws = connected_connector(flow_control=FlowControl(max_in_flight=2))
+
+        tasks = [
+            asyncio.create_task(connector.send(vibrate(i, feature_index=i), timeout=1))
+            for i in range(4)
+        ]
+        await asyncio.sleep(0.01)
+
+        assert sent_ids(ws) == [1, 2]
+        stats = connector.send_queue_stats
+        assert stats.in_flight == 2
+        assert stats.queued == 2
+        assert stats.high_water == 2
+
+        connector._message_sorter.resolve(1, Ok(id=1))
+        await asyncio.sleep(0.01)
+        assert sent_ids(ws) == [1, 2, 3]
+
+        for msg_id in (2, 3):
+            connector._message_sorter.resolve(msg_id, Ok(id=msg_id))
+        await asyncio.sleep(0.01)
+        connector._message_sorter.resolve(4, Ok(id=4))
+        await asyncio.gather(*tasks)
+
+        stats = connector.send_queue_stats
+        assert stats.in_flight == 0
+        assert stats.queued == 0
+        assert stats.waited == 2
+        assert stats.max_wait >= stats.mean_wait > 0
+
+    async def test_control_messages_bypass_window(self):
+        """Pings are never held back by device commands."""
+        connector, ws = connected_connector(flow_control=FlowControl(max_in_flight=1))
+
+        command = asyncio.create_task(connector.send(vibrate(1), timeout=1))
+        ping = asyncio.create_task(connector.send(Ping(id=0), timeout=1))
+        await asyncio.sleep(0.01)
+
+        assert sent_ids(ws) == [1, 2]
+        assert connector.send_queue_stats.in_flight == 1
+        for msg_id in (1, 2):
+            connector._message_sorter.resolve(msg_id, Ok(id=msg_id))
+        await asyncio.gather(command, ping)
+
+    async def test_reject_when_queue_full(self):
+        """The reject policy fails new commands once the queue is full."""
+        flow = FlowControl(max_in_flight=1, max_queued=1, overflow=OverflowPolicy.REJECT)
+        connector, ws = connected_connector(flow_control=flow)
+
+        tasks = [asyncio.create_task(connector.send(vibrate(i, i), timeout=1)) for i in range(2)]
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ButtplugConnectorError, match="queue full"):
+            await connector.send(vibrate(9, 9), timeout=1)
+        assert connector.send_queue_stats.rejected == 1
+
+        connector._message_sorter.resolve(1, Ok(id=1))
+        await asyncio.sleep(0.01)
+        connector._message_sorter.resolve(2, Ok(id=2))
+        await asyncio.gather(*tasks)
+
+    async def test_drop_oldest_when_queue_full(self):
+        """The drop-oldest policy fails the oldest queued command."""
+        flow = FlowControl(max_in_flight=1, max_queued=1, overflow=OverflowPolicy.DROP_OLDEST)
+        connector, ws = connected_connector(flow_control=flow)
+
+        first = asyncio.create_task(connector.send(vibrate(0, 0), timeout=1))
+        oldest = asyncio.create_task(connector.send(vibrate(1, 1), timeout=1))
+        await asyncio.sleep(0.01)
+        newest = asyncio.create_task(connector.send(vibrate(2, 2), timeout=1))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ButtplugConnectorError, match="Dropped"):
+            await oldest
+        assert connector.send_queue_stats.dropped == 1
+
+        connector._message_sorter.resolve(1, Ok(id=1))
+        await asyncio.sleep(0.01)
+        frame = json.loads(ws.sent[-1])
+        assert frame[0]["OutputCmd"]["FeatureIndex"] == 2
+        connector._message_sorter.resolve(2, Ok(id=2))
+        await asyncio.gather(first, newest)
+
+    async def test_replace_coalesces_same_feature(self):
+        """The replace policy keeps only the newest queued command per feature."""
+        flow = FlowControl(max_in_flight=1, overflow=OverflowPolicy.REPLACE)
+        connector, ws = connected_connector(flow_control=flow)
+
+        first = asyncio.create_task(connector.send(vibrate(1), timeout=1))
+        await asyncio.sleep(0)
+        stale = asyncio.create_task(connector.send(vibrate(2), timeout=1))
+        await asyncio.sleep(0)
+        latest = asyncio.create_task(connector.send(vibrate(3), timeout=1))
+        await asyncio.sleep(0.01)
+
+        assert connector.send_queue_stats.queued == 1
+        assert connector.send_queue_stats.replaced == 1
+
+        connector._message_sorter.resolve(1, Ok(id=1))
+        await asyncio.sleep(0.01)
+        frame = json.loads(ws.sent[-1])
+        assert frame[0]["OutputCmd"]["Command"] == {"Vibrate": {"Value": 3}}
+        assert len(ws.sent) == 2
+
+        # Both coalesced callers get the response to the command that went out
+        connector._message_sorter.resolve(2, Ok(id=2))
+        results = await asyncio.gather(first, stale, latest)
+        assert [r.id for r in results] == [1, 2, 2]
+
+    async def test_pipelined_holds_slot_until_acknowledged(self):
+        """Pipelined commands count against the window until their Ok arrives."""
+        connector, ws = connected_connector(flow_control=FlowControl(max_in_flight=1))
+        connector._receive_task = asyncio.create_task(connector._receive_loop())
+
+        await connector.send_pipelined(vibrate(1))
+        waiting = asyncio.create_task(connector.send_pipelined(vibrate(2, 1)))
+        await asyncio.sleep(0.01)
+        assert sent_ids(ws) == [1]
+        assert not waiting.done()
+
+        ws.incoming.put_nowait(json.dumps([{"Ok": {"Id": 1}}]))
+        await asyncio.wait_for(waiting, timeout=1)
+        assert sent_ids(ws) == [1, 2]
+
+        await connector.disconnect()
+        assert connector.send_queue_stats.in_flight == 0
+
+    async def test_failed_batch_write_releases_pipelined_slots(self):
+        """Pipelined sends in a batch whose write fails give back their slots."""
+        connector, ws = connected_connector(
+            batch_window=0.0, flow_control=FlowControl(max_in_flight=1)
+        )
+
+        async def broken_send(data: str) -> None:
+            raise OSError("socket gone")
+
+        ws.send = broken_send  # type: ignore[method-assign]
+
+        await connector.send_pipelined(vibrate(1))
+        assert connector.send_queue_stats.in_flight == 1
+        await asyncio.sleep(0.01)
+
+        assert connector.send_queue_stats.in_flight == 0
+        assert connector.pipeline_stats.outstanding == 0
+        assert connector.pipeline_stats.sent == 0
+
+    async def test_failed_batch_encode_releases_pipelined_slots(self):
+        """Pipelined slots are given back when encoding the batch fails."""
+        connector, ws = connected_connector(
+            batch_window=0.0, flow_control=FlowControl(max_in_flight=1)
+        )
+        connector._codec = BrokenCodec()
+
+        await connector.send_pipelined(vibrate(1))
+        await asyncio.sleep(0.01)
+
+        assert connector.send_queue_stats.in_flight == 0
+        assert connector.pipeline_stats.outstanding == 0
+        assert ws.sent == []
+
+    async def test_disconnect_fails_queued(self):
+        """Queued commands fail when the connection closes."""
+        connector, ws = connected_connector(flow_control=FlowControl(max_in_flight=1))
+
+        first = asyncio.create_task(connector.send(vibrate(0, 0), timeout=1))
+        queued = asyncio.create_task(connector.send(vibrate(1, 1), timeout=1))
+        await asyncio.sleep(0.01)
+        await connector.disconnect()
+
+        for task in (first, queued):
+            with pytest.raises(ButtplugConnectorError):
+                await task
+        stats = connector.send_queue_stats
+        assert stats.in_flight == 0
+        assert stats.queued == 0
+
+    def test_invalid_settings(self):
+        """The window must allow at least one command."""
+        with pytest.raises(ValueError):
+            FlowControl(max_in_flight=0)
+
+
+class TestUnsolicitedDispatch:
+    """Tests for handing unsolicited messages to the message callback."""
+
+    async def test_slow_callback_does_not_block_responses(self):
+        """Responses resolve while the message callback is still busy."""
+        connector, ws = connected_connector()
+        release = asyncio.Event()
+        received: list[ButtplugMessage] = []
+
+        async def on_message(msg: ButtplugMessage) -> None:
+            await release.wait()
+            received.append(msg)
+
+        connector.set_message_callback(on_message)
+        connector._receive_task = asyncio.create_task(connector._receive_loop())
+
+        request = asyncio.create_task(connector.send(Ping(id=0), timeout=1))
+        await asyncio.sleep(0)
+        ws.incoming.put_nowait(json.dumps([{"ScanningFinished": {"Id": 0}}]))
+        ws.incoming.put_nowait(json.dumps([{"Ok": {"Id": 1}}]))
+
+        response = await asyncio.wait_for(request, timeout=1)
+        assert response.id == 1
+        assert received == []
+        assert connector.dispatch_stats.backlog + len(received) <= 1
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert [m.get_message_type() for m in received] == ["ScanningFinished"]
+        assert connector.dispatch_stats.dispatched == 1
+
+        await connector.disconnect()
+
+    async def test_full_backlog_applies_backpressure(self):
+        """A full dispatch queue makes the receive loop wait, in order."""
+        connector = WebSocketConnector("ws://test", dispatch_queue_size=2)
+        ws = FakeWebSocket()
+        connector._ws = ws  # type: ignore[assignment]
+        connector._connected = True
+        release = asyncio.Event()
+        received: list[int] = []
+
+        async def on_message(msg: ButtplugMessage) -> None:
+            await release.wait()
+            received.append(msg.device_index)  # type: ignore[attr-defined]
+
+        connector.set_message_callback(on_message)
+        connector._receive_task = asyncio.create_task(connector._receive_loop())
+
+        for index in range(5):
+            reading = {"Id": 0, "DeviceIndex": index, "FeatureIndex": 0}
+            reading["Reading"] = {"Battery": {"Value": 50}}
+            ws.incoming.put_nowait(json.dumps([{"InputReading": reading}]))
+        await asyncio.sleep(0.01)
+
+        stats = connector.dispatch_stats
+        assert stats.backlog == 2
+        assert stats.high_water == 2
+        assert stats.stalls >= 1
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert received == [0, 1, 2, 3, 4]
+
+        await connector.disconnect()
+
+    async def test_backlog_delivered_before_disconnect_callback(self):
+        """Messages that arrived before the drop are delivered first."""
+        connector, ws = connected_connector()
+        events: list[str] = []
+
+        async def on_message(msg: ButtplugMessage) -> None:
+            await asyncio.sleep(0.01)
+            events.append(msg.get_message_type())
+
+        async def on_disconnect() -> None:
+            events.append("disconnect")
+
+        connector.set_message_callback(on_message)
+        connector.set_disconnect_callback(on_disconnect)
+        connector._receive_task = asyncio.create_task(connector._receive_loop())
+
+        ws.incoming.put_nowait(json.dumps([{"ScanningFinished": {"Id": 0}}]))
+
+        async def closed() -> str:
+            raise websockets.exceptions.ConnectionClosed(None, None)
+
+        await asyncio.sleep(0)
+        ws.recv = closed  # type: ignore[method-assign]
+        ws.incoming.put_nowait("[]")
+        await asyncio.wait_for(connector._receive_task, timeout=1)
+
+        assert events == ["ScanningFinished", "disconnect"]
+
+    async def test_callback_errors_counted(self):
+        """A raising callback is counted and doesn't stop dispatch."""
+        connector, ws = connected_connector()
+        calls = 0
+
+        async def on_message(msg: ButtplugMessage) -> None:
+            nonlocal calls
+            calls += 1
+            raise RuntimeError("boom")
+
+        connector.set_message_callback(on_message)
+        connector._receive_task = asyncio.create_task(connector._receive_loop())
+        ws.incoming.put_nowait(
+            json.dumps([{"ScanningFinished": {"Id": 0}}, {"ScanningFinished": {"Id": 0}}])
+        )
+        await asyncio.sleep(0.01)
+
+        assert calls == 2
+        assert connector.dispatch_stats.errors == 2
+
+        await connector.disconnect()
+
+
+def available_codecs() -> list[JsonCodec]:
+    """Every codec that can be constructed in this environment."""
+    codecs: list[JsonCodec] = [StdlibJsonCodec()]
+    for codec_type in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec_type())
+        except ImportError:
+            pass
+    return codecs
+
+
+class TestJsonCodecs:
+    """Tests for the pluggable JSON codecs."""
+
+    @pytest.mark.parametrize("codec", available_codecs(), ids=lambda c: c.name)
+    def test_roundtrip(self, codec: JsonCodec):
+        """Codecs round-trip protocol frames from bytes and str."""
+        frame = [{"OutputCmd": {"Id": 1, "Command": {"Vibrate": {"Value": 10}}}}]
+        encoded = codec.encode(frame)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == frame
+        assert codec.decode(encoded) == frame
+        assert codec.decode(encoded.decode()) == frame
+
+    @pytest.mark.parametrize("codec", available_codecs(), ids=lambda c: c.name)
+    def test_decode_malformed_raises_value_error(self, codec: JsonCodec):
+        """Malformed frames raise ValueError regardless of backend."""
+        with pytest.raises(ValueError):
+            codec.decode("[{not json")
+
+    def test_default_codec_prefers_installed_backend(self):
+        """default_codec picks a fast backend when one is installed."""
+        names = [c.name for c in available_codecs()]
+        expected = next((n for n in ("msgspec", "orjson") if n in names), "json")
+        assert default_codec().name == expected
+
+    async def test_connector_uses_codec(self):
+        """The connector encodes outgoing frames with its codec."""
+        connector = WebSocketConnector("ws://test", codec=StdlibJsonCodec())
+        ws = FakeWebSocket()
+        connector._ws = ws  # type: ignore[assignment]
+        connector._connected = True
+
+        await connector.send_no_response(Ping(id=0))
+
+        assert connector.codec.name == "json"
+        assert ws.sent == ['[{"Ping":{"Id":1}}]']
@@ -154,6 +154,44 @@ class TestDeviceFeature:
         with pytest.raises(ButtplugDeviceError, match="out of range"):
             vibrate_feature.convert_to_step(OutputType.VIBRATE, 25)
 
+    def test_convert_to_steps_matches_scalar(self, mock_client: MockClient) -> None:
+        """convert_to_steps rounds exactly like convert_to_step."""
+        np = pytest.importorskip("numpy")
+        defn = DeviceFeatureDefinition(
+            feature_index=0,
+            output={"Rotate": FeatureOutputDefinition(value=(-37, 37), duration=None)},
+        )
+        feature = DeviceFeature(mock_client, 0, defn)  # type: ignore[arg-type]
+        values = np.concatenate([np.linspace(-1.0, 1.0, 2001), [-0.0, 1e-12, -1e-12]])
+
+        steps = feature.convert_to_steps(OutputType.ROTATE, values)
+
+        assert steps.dtype == np.int64
+        assert steps.tolist() == [
+            feature.convert_to_step(OutputType.ROTATE, float(v)) for v in values
+        ]
+
+    def test_convert_to_steps_int_and_shape(self, vibrate_feature: DeviceFeature) -> None:
+        """Integer arrays are steps, and the input shape is kept."""
+        np = pytest.importorskip("numpy")
+
+        steps = vibrate_feature.convert_to_steps(OutputType.VIBRATE, np.array([[0, 5], [10, 20]]))
+        assert steps.tolist() == [[0, 5], [10, 20]]
+        assert vibrate_feature.convert_to_steps("Vibrate", [0.5, 1.0]).tolist() == [10, 20]
+
+    def test_convert_to_steps_invalid(self, vibrate_feature: DeviceFeature) -> None:
+        """Any invalid element fails the whole conversion."""
+        np = pytest.importorskip("numpy")
+
+        with pytest.raises(ButtplugDeviceError, match="must be between"):
+            vibrate_feature.convert_to_steps(OutputType.VIBRATE, np.array([0.5, 1.5]))
+        with pytest.raises(ButtplugDeviceError, match="must be between"):
+            vibrate_feature.convert_to_steps(OutputType.VIBRATE, np.array([0.5, np.nan]))
+        with pytest.raises(ButtplugDeviceError, match="out of range"):
+            vibrate_feature.convert_to_steps(OutputType.VIBRATE, np.array([3, 25]))
+        with pytest.raises(ButtplugDeviceError, match="does not support"):
+            vibrate_feature.convert_to_steps(OutputType.ROTATE, np.array([0.5]))
+
 
 class TestButtplugDevice:
     """Tests for ButtplugDevice capability checking (no client interaction)."""
@@ -280,3 +318,43 @@ class TestButtplugDevice:
 
         rotate_feature = device.features[2]
         assert rotate_feature.step_count(OutputType.ROTATE) == 10
+
+    def test_lookups_accept_protocol_names(
+        self, mock_client: MockClient, multi_feature_device_info: DeviceInfo
+    ) -> None:
+        """Capability lookups work with enum members and plain protocol names."""
+        device = ButtplugDevice(mock_client, multi_feature_device_info)  # type: ignore[arg-type]
+
+        assert device.has_output("Vibrate") is True
+        assert device.get_features_with_output("Rotate") == [device.features[2]]
+        assert device.features[3].supports_input_command("Battery", InputCommandType.READ)
+        assert device.output_types == {"Vibrate", "Rotate"}
+        assert device.input_types == {InputType.BATTERY}
+
+    def test_returned_feature_lists_are_copies(
+        self, mock_client: MockClient, multi_feature_device_info: DeviceInfo
+    ) -> None:
+        """Mutating a returned list doesn't corrupt the index."""
+        device = ButtplugDevice(mock_client, multi_feature_device_info)  # type: ignore[arg-type]
+
+        device.get_features_with_output(OutputType.VIBRATE).clear()
+
+        assert len(device.get_features_with_output(OutputType.VIBRATE)) == 2
+
+    def test_rebind_rebuilds_indexes(
+        self, mock_client: MockClient, multi_feature_device_info: DeviceInfo
+    ) -> None:
+        """Capabilities follow the device info after a re-bind."""
+        device = ButtplugDevice(mock_client, multi_feature_device_info)  # type: ignore[arg-type]
+        info = multi_feature_device_info.model_copy(deep=True)
+        del info.device_features[2]
+        info.device_features[1].output = {
+            "Oscillate": FeatureOutputDefinition(value=(0, 5), duration=None)
+        }
+
+        device._rebind(info)
+
+        assert device.has_output(OutputType.ROTATE) is False
+        assert device.get_features_with_output(OutputType.VIBRATE) == [device.features[0]]
+        assert device.features[1].step_count(OutputType.OSCILLATE) == 5
+        assert device.features[1].has_output(OutputType.VIBRATE) is False
@@ -0,0 +1,79 @@
+"""Tests for sensor reading history."""
+
+import pytest
+
+from buttplug import SensorHistory
+
+
+class TestSensorHistory:
+    """Tests for the SensorHistory ring buffer."""
+
+    def test_keeps_newest_in_order(self):
+        """Once full, the oldest readings are overwritten and order is kept."""
+        history = SensorHistory(capacity=4)
+        for i in range(10):
+            history.append(float(i), i * 10.0)
+
+        assert len(history) == 4
+        assert history.total == 10
+        assert history.timestamps.tolist() == [6.0, 7.0, 8.0, 9.0]
+        assert history.values.tolist() == [60.0, 70.0, 80.0, 90.0]
+        assert history.latest == (9.0, 90.0)
+
+    def test_partial_and_empty(self):
+        """Histories that aren't full yet hold only what was appended."""
+        history = SensorHistory(capacity=4)
+        assert history.latest is None
+        assert history.values.tolist() == []
+
+        history.append(1.0, 5.0)
+        history.append(2.0, 6.0)
+        assert history.values.tolist() == [5.0, 6.0]
+
+        history.clear()
+        assert len(history) == 0
+        assert history.total == 0
+
+    def test_views_share_buffer(self):
+        """Snapshots are views, not copies, and memory stays fixed."""
+        history = SensorHistory(capacity=3)
+        for i in range(1000):
+            history.append(float(i), float(i))
+
+        assert history.values.obj is history._values
+        assert history.timestamps.obj is history._timestamps
+        assert len(history._values) == 6
+
+    def test_arrays(self):
+        """NumPy arrays are views of the same buffer."""
+        np = pytest.importorskip("numpy")
+        history = SensorHistory(capacity=3)
+        for i in range(5):
+            history.append(float(i), float(i))
+
+        timestamps, values = history.arrays()
+
+        assert values.tolist() == [2.0, 3.0, 4.0]
+        assert np.shares_memory(values, np.frombuffer(history._values))
+        assert timestamps.dtype == np.float64
+
+    def test_decimate(self):
+        """Buckets keep the minimum, maximum and mean of their readings."""
+        history = SensorHistory(capacity=8)
+        for i, value in enumerate([1, 9, 2, 2, 5, 5, 0, 4]):
+            history.append(float(i), float(value))
+
+        result = history.decimate(3)
+
+        assert result.timestamps == [0.0, 2.0, 5.0]
+        assert result.minimums == [1.0, 2.0, 0.0]
+        assert result.maximums == [9.0, 5.0, 5.0]
+        assert result.means == pytest.approx([5.0, 3.0, 3.0])
+        assert len(history.decimate(100).means) == 8
+
+    def test_invalid(self):
+        """Capacity and bucket counts must be positive."""
+        with pytest.raises(ValueError):
+            SensorHistory(capacity=0)
+        with pytest.raises(ValueError):
+            SensorHistory().decimate(0)
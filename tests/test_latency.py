@@ -0,0 +1,65 @@
+"""Tests for round-trip latency histograms."""
+
+import pytest
+
+from buttplug import LatencyHistogram
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_empty(self):
+        """An empty histogram reports zeros."""
+        histogram = LatencyHistogram()
+
+        assert histogram.count == 0
+        assert histogram.mean == 0.0
+        assert histogram.percentile(99) == 0.0
+
+    def test_summary(self):
+        """Count, min, max and mean track the recorded times."""
+        histogram = LatencyHistogram()
+        for ms in (1, 2, 3, 10):
+            histogram.record(ms / 1000)
+
+        assert histogram.count == 4
+        assert histogram.min == pytest.approx(0.001)
+        assert histogram.max == pytest.approx(0.010)
+        assert histogram.mean == pytest.approx(0.004)
+
+    @pytest.mark.parametrize("scale", [1e-5, 1e-3, 1.0, 60.0])
+    def test_percentiles_within_relative_error(self, scale):
+        """Percentiles stay within about 3% of the exact value at any scale."""
+        histogram = LatencyHistogram()
+        for i in range(1, 1001):
+            histogram.record(i * scale)
+
+        for percent in (50, 90, 99, 99.9):
+            exact = percent * 10 * scale
+            assert histogram.percentile(percent) == pytest.approx(exact, rel=1 / 32)
+        assert histogram.percentile(100) == pytest.approx(1000 * scale, rel=1e-6)
+        assert histogram.percentile(0) == pytest.approx(scale, rel=1 / 32)
+
+    def test_merge_and_copy(self):
+        """Merging adds counts; copies are independent."""
+        fast, slow = LatencyHistogram(), LatencyHistogram()
+        for _ in range(90):
+            fast.record(0.001)
+        for _ in range(10):
+            slow.record(0.5)
+
+        combined = fast.copy()
+        combined.merge(slow)
+        fast.record(1.0)
+
+        assert combined.count == 100
+        assert combined.min == pytest.approx(0.001)
+        assert combined.max == pytest.approx(0.5)
+        assert combined.percentile(50) == pytest.approx(0.001, rel=1 / 32)
+        assert combined.percentile(95) == pytest.approx(0.5, rel=1 / 32)
+        assert fast.count == 91
+
+    def test_invalid_percent(self):
+        """Percentiles outside 0-100 are rejected."""
+        with pytest.raises(ValueError):
+            LatencyHistogram().percentile(101)
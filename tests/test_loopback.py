@@ -0,0 +1,856 @@
+"""Tests for the in-process loopback connector."""
+
+import asyncio
+import math
+
+import pytest
+
+from buttplug import (
+    BatchResult,
+    ButtplugClient,
+    ButtplugConnector,
+    ButtplugDeviceError,
+    DeviceOutputCommand,
+    ErrorCode,
+    InputType,
+    LoopbackConnector,
+    OutputType,
+    ReadCachePolicy,
+    ReconnectPolicy,
+    SensorOverflow,
+)
+from buttplug._messages import Ping
+from buttplug.errors import ButtplugConnectorError
+
+
+class TestLoopbackConnector:
+    """Tests for LoopbackConnector against a LoopbackServer."""
+
+    def test_is_buttplug_connector(self, loopback_server):
+        """Loopback connectors plug into the same interface as WebSocket ones."""
+        assert isinstance(LoopbackConnector(loopback_server), ButtplugConnector)
+
+    async def test_send_round_trip(self, loopback_server):
+        """Requests are encoded, answered and matched by Id."""
+        connector = LoopbackConnector(loopback_server)
+        await connector.connect()
+
+        response = await connector.send(Ping(id=0))
+
+        assert response.get_message_type() == "Ok"
+        assert loopback_server.count("Ping") == 1
+        await connector.disconnect()
+        assert loopback_server.connection_count == 0
+
+    async def test_send_when_not_connected(self, loopback_server):
+        """Sending before connect() fails."""
+        connector = LoopbackConnector(loopback_server)
+
+        with pytest.raises(ButtplugConnectorError):
+            await connector.send(Ping(id=0))
+
+    async def test_batched_frames(self, loopback_server):
+        """Batched sends reach the server as one frame and all resolve."""
+        connector = LoopbackConnector(loopback_server, batch_window=0.0)
+        await connector.connect()
+
+        responses = await asyncio.gather(*(connector.send(Ping(id=0)) for _ in range(5)))
+
+        assert [r.get_message_type() for r in responses] == ["Ok"] * 5
+        assert loopback_server.count("Ping") == 5
+        await connector.disconnect()
+
+    async def test_send_batch_is_one_frame(self, loopback_server):
+        """A batch is written as a single frame and answered in order."""
+        connector = LoopbackConnector(loopback_server)
+        await connector.connect()
+        frames = []
+        write_frame = connector._write_frame
+
+        async def counting_write(frame):
+            frames.append(frame)
+            await write_frame(frame)
+
+        connector._write_frame = counting_write
+
+        responses = await connector.send_batch([Ping(id=0), Ping(id=0), Ping(id=0)])
+
+        assert len(frames) == 1
+        assert [r.get_message_type() for r in responses] == ["Ok"] * 3
+        assert len({r.id for r in responses}) == 3
+        assert await connector.send_batch([]) == []
+        await connector.disconnect()
+
+    async def test_dropped_connection_reported(self, loopback_server):
+        """Dropping the server side fires the disconnect callback."""
+        connector = LoopbackConnector(loopback_server)
+        disconnected = asyncio.Event()
+
+        async def on_disconnect():
+            disconnected.set()
+
+        connector.set_disconnect_callback(on_disconnect)
+        await connector.connect()
+        loopback_server.drop_connections()
+        await asyncio.wait_for(disconnected.wait(), timeout=1)
+
+        assert connector.connected is False
+
+
+class TestClientOverLoopback:
+    """Tests for ButtplugClient using a loopback connector."""
+
+    async def test_connect_with_connector(self, loopback_server):
+        """connect() accepts a connector instance instead of a URL."""
+        client = ButtplugClient("Test")
+        await client.connect(LoopbackConnector(loopback_server))
+
+        assert client.connected is True
+        assert client.server_name == "Loopback Server"
+        assert set(client.devices) == {0, 1}
+
+        await client.disconnect()
+        assert client.connected is False
+
+    async def test_output_and_stop(self, loopback_server):
+        """Output commands are recorded by the server and cleared by stop."""
+        client = ButtplugClient("Test")
+        await client.connect(LoopbackConnector(loopback_server))
+
+        await client.devices[0].features[0].run_output(DeviceOutputCommand(OutputType.VIBRATE, 0.5))
+        assert loopback_server.outputs[(0, 0)] == {"Vibrate": {"Value": 10}}
+
+        await client.devices[0].stop()
+        assert loopback_server.outputs == {}
+
+        await client.disconnect()
+
+    async def test_unsupported_output_is_device_error(self, loopback_server):
+        """Server Errors surface as ButtplugDeviceError."""
+        client = ButtplugClient("Test")
+        await client.connect(LoopbackConnector(loopback_server))
+
+        feature = client.devices[0].features[0]
+        loopback_server.devices["0"]["DeviceFeatures"]["0"]["Output"] = {}
+        with pytest.raises(ButtplugDeviceError):
+            await feature.run_output(DeviceOutputCommand(OutputType.VIBRATE, 0.5))
+
+        await client.disconnect()
+
+    async def test_battery_read(self, loopback_server):
+        """Sensor reads return the configured reading."""
+        loopback_server.set_reading(0, 2, "Battery", 75)
+        client = ButtplugClient("Test")
+        await client.connect(LoopbackConnector(loopback_server))
+
+        assert await client.devices[0].battery() == pytest.approx(0.75)
+
+        await client.disconnect()
+
+    async def test_connection_stats(self, loopback_server):
+        """Round-trip times are recorded per message type and device."""
+        client = ButtplugClient("Test")
+        assert client.connection_stats.frames_out == 0
+        await client.connect(LoopbackConnector(loopback_server))
+
+        await client.devices[0].features[0].run_output(DeviceOutputCommand(OutputType.VIBRATE, 0.5))
+
+        stats = client.connection_stats
+        assert stats.frames_out == stats.frames_in == len(loopback_server.received)
+        assert stats.latency_by_type["OutputCmd"].count == 1
+        assert stats.latency_by_type["RequestServerInfo"].count == 1
+        assert set(stats.latency_by_device) == {0}
+        assert stats.in_flight == stats.timeouts == stats.malformed_frames == 0
+
+        await client.disconnect()
+
+    async def test_device_added_and_removed(self, loopback_server, sample_device_list_data):
+        """Unsolicited DeviceList pushes update the client's devices."""
+        client = ButtplugClient("Test")
+        added = []
+        removed = []
+        client.on_device_added = added.append
+        client.on_device_removed = removed.append
+        await client.connect(LoopbackConnector(loopback_server))
+        added.clear()
+
+        loopback_server.remove_device(1)
+        await asyncio.sleep(0.01)
+        assert set(client.devices) == {0}
+        assert [d.index for d in removed] == [1]
+
+        loopback_server.add_device(sample_device_list_data["Devices"]["1"])
+        await asyncio.sleep(0.01)
+        assert set(client.devices) == {0, 1}
+        assert [d.index for d in added] == [1]
+
+        await client.disconnect()
+
+    async def test_slow_callback_does_not_block_commands(
+        self, loopback_server, sample_device_list_data
+    ):
+        """Commands complete while an event callback is still running."""
+        client = ButtplugClient("Test")
+        release = asyncio.Event()
+
+        async def on_device_added(device):
+            await release.wait()
+
+        await client.connect(LoopbackConnector(loopback_server))
+        client.on_device_added = on_device_added
+        loopback_server.remove_device(1)
+        loopback_server.add_device(sample_device_list_data["Devices"]["1"])
+        await asyncio.sleep(0.01)
+
+        command = DeviceOutputCommand(OutputType.VIBRATE, 0.5)
+        await asyncio.wait_for(client.devices[0].features[0].run_output(command), timeout=1)
+        assert client.dispatch_stats.backlog == 0
+        assert client.dispatch_stats.dispatched == 1
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert client.dispatch_stats.dispatched == 2
+
+        await client.disconnect()
+
+
+class TestReconnectOverLoopback:
+    """Tests for automatic reconnect against a loopback server."""
+
+    async def test_drop_during_handshake_retry(self, loopback_server):
+        """A drop while reconnecting is retried by the same reconnect loop."""
+        client = ButtplugClient("Test")
+        client.reconnect_policy = ReconnectPolicy(initial_delay=0.01)
+        reconnects = 0
+        reconnected = asyncio.Event()
+
+        def on_reconnected():
+            nonlocal reconnects
+            reconnects += 1
+            reconnected.set()
+
+        client.on_reconnected = on_reconnected
+        await client.connect(LoopbackConnector(loopback_server))
+
+        # Drop the connection again as soon as the first handshake retry starts
+        receive = loopback_server._receive
+        drops = 1
+
+        def drop_handshake(session, frame):
+            nonlocal drops
+            if drops and b"RequestServerInfo" in frame:
+                drops -= 1
+                loopback_server.drop_connections()
+                return
+            receive(session, frame)
+
+        loopback_server._receive = drop_handshake  # type: ignore[method-assign]
+        loopback_server.drop_connections()
+        task = None
+        while task is None:
+            await asyncio.sleep(0)
+            task = client._reconnect_task
+
+        await asyncio.wait_for(reconnected.wait(), timeout=2)
+        await asyncio.sleep(0.05)
+
+        assert drops == 0
+        assert reconnects == 1
+        assert task.done() and not client.reconnecting
+        assert client.connected is True
+        assert loopback_server.connection_count == 1
+
+        await client.disconnect()
+
+    async def test_drop_during_restore(self, loopback_server, sensor_device):
+        """A drop after the handshake starts a new reconnect that restores again."""
+        loopback_server.add_device(sensor_device)
+        client = ButtplugClient("Test")
+        client.reconnect_policy = ReconnectPolicy(initial_delay=0.01)
+        reconnected = asyncio.Event()
+        client.on_reconnected = reconnected.set
+        await client.connect(LoopbackConnector(loopback_server))
+        readings = client.devices[2].features[0].subscribe(InputType.PRESSURE)
+        await readings.start()
+
+        # Drop the connection again when the subscription is being restored
+        receive = loopback_server._receive
+        drops = 1
+
+        def drop_resubscribe(session, frame):
+            nonlocal drops
+            if drops and b"Subscribe" in frame:
+                drops -= 1
+                loopback_server.drop_connections()
+                return
+            receive(session, frame)
+
+        loopback_server._receive = drop_resubscribe  # type: ignore[method-assign]
+        loopback_server.drop_connections()
+        await asyncio.wait_for(reconnected.wait(), timeout=2)
+
+        assert drops == 0
+        assert client.connected is True
+        assert loopback_server.connection_count == 1
+        loopback_server.push_reading(2, 0, "Pressure", 5)
+        reading = await asyncio.wait_for(readings.__anext__(), timeout=1)
+        assert reading.value == 5
+
+        await readings.close()
+        await client.disconnect()
+
+
+class TestOutputCache:
+    """Tests for suppressing redundant output commands."""
+
+    @staticmethod
+    async def caching_client(server):
+        client = ButtplugClient("Test")
+        client.cache_outputs = True
+        await client.connect(LoopbackConnector(server))
+        return client
+
+    async def test_disabled_by_default(self, loopback_server):
+        """Without caching every command reaches the server."""
+        client = ButtplugClient("Test")
+        await client.connect(LoopbackConnector(loopback_server))
+        feature = client.devices[0].features[0]
+
+        for _ in range(3):
+            await feature.run_output(DeviceOutputCommand(OutputType.VIBRATE, 0.5))
+
+        assert loopback_server.count("OutputCmd") == 3
+        assert client.output_cache_stats.suppressed == 0
+        await client.disconnect()
+
+    async def test_same_step_suppressed(self, loopback_server):
+        """Values quantizing to the acknowledged step aren't sent again."""
+        client = await self.caching_client(loopback_server)
+        feature = client.devices[0].features[0]
+
+        # 20 steps: 0.46 and 0.5 are both step 10
+        await feature.run_output(DeviceOutputCommand(OutputType.VIBRATE, 0.46))
+        await feature.run_output(DeviceOutputCommand(OutputType.VIBRATE, 0.5))
+        await feature.run_output(DeviceOutputCommand(OutputType.VIBRATE, 0.6))
+
+        assert loopback_server.count("OutputCmd") == 2
+        stats = client.output_cache_stats
+        assert (stats.sent, stats.suppressed) == (2, 1)
+        assert stats.suppression_rate == pytest.approx(1 / 3)
+        await client.disconnect()
+
+    async def test_features_cached_separately(self, loopback_server):
+        """The same step on another feature is still sent."""
+        client = await self.caching_client(loopback_server)
+        command = DeviceOutputCommand(OutputType.VIBRATE, 0.5)
+
+        await client.devices[0].features[0].run_output(command)
+        await client.devices[0].features[1].run_output(command)
+
+        assert loopback_server.count("OutputCmd") == 2
+        await client.disconnect()
+
+    async def test_duration_is_part_of_key(self, loopback_server):
+        """A position with a different duration is not redundant."""
+        client = await self.caching_client(loopback_server)
+        feature = client.devices[1].features[0]
+
+        await feature.run_output(
+            DeviceOutputCommand(OutputType.POSITION_WITH_DURATION, 0.5, duration=200)
+        )
+        await feature.run_output(
+            DeviceOutputCommand(OutputType.POSITION_WITH_DURATION, 0.5, duration=200)
+        )
+        await feature.run_output(
+            DeviceOutputCommand(OutputType.POSITION_WITH_DURATION, 0.5, duration=400)
+        )
+
+        assert loopback_server.count("OutputCmd") == 2
+        await client.disconnect()
+
+    async def test_stop_invalidates(self, loopback_server):
+        """After a stop the same value is sent again."""
+        client = await self.caching_client(loopback_server)
+        feature = client.devices[0].features[0]
+        command = DeviceOutputCommand(OutputType.VIBRATE, 0.5)
+
+        await feature.run_output(command)
+        await client.devices[0].stop()
+        await feature.run_output(command)
+        await feature.stop()
+        await feature.run_output(command)
+        await client.stop_all_devices()
+        await feature.run_output(command)
+
+        assert loopback_server.count("OutputCmd") == 4
+        await client.disconnect()
+
+    async def test_error_invalidates(self, loopback_server):
+        """A failed command leaves the device state unknown."""
+        client = await self.caching_client(loopback_server)
+        feature = client.devices[0].features[0]
+        command = DeviceOutputCommand(OutputType.VIBRATE, 0.5)
+        await feature.run_output(command)
+
+        output = loopback_server.devices["0"]["DeviceFeatures"]["0"].pop("Output")
+        with pytest.raises(ButtplugDeviceError):
+            await feature.run_output(DeviceOutputCommand(OutputType.VIBRATE, 0.7))
+        loopback_server.devices["0"]["DeviceFeatures"]["0"]["Output"] = output
+
+        await feature.run_output(command)
+        await feature.run_output(command)
+
+        assert loopback_server.count("OutputCmd") == 3
+        assert loopback_server.outputs[(0, 0)] == {"Vibrate": {"Value": 10}}
+        await client.disconnect()
+
+    async def test_disabling_clears_cache(self, loopback_server):
+        """Turning caching off and on again starts from an empty cache."""
+        client = await self.caching_client(loopback_server)
+        feature = client.devices[0].features[0]
+        command = DeviceOutputCommand(OutputType.VIBRATE, 0.5)
+
+        await feature.run_output(command)
+        client.cache_outputs = False
+        client.cache_outputs = True
+        await feature.run_output(command)
+
+        assert loopback_server.count("OutputCmd") == 2
+        await client.disconnect()
+
+    async def test_slow_signal_mostly_suppressed(self, loopback_server):
+        """A slow sine sampled at a high rate needs only a few commands."""
+        client = await self.caching_client(loopback_server)
+        feature = client.devices[0].features[0]
+
+        samples = 1000
+        for i in range(samples):
+            value = 0.5 + 0.5 * math.sin(2 * math.pi * i / samples)
+            await feature.run_output(DeviceOutputCommand(OutputType.VIBRATE, value))
+
+        assert loopback_server.count("OutputCmd") * 10 < samples
+        assert client.output_cache_stats.suppressed + client.output_cache_stats.sent == samples
+        await client.disconnect()
+
+
+class TestFindFeatures:
+    """Tests for the client-wide capability index."""
+
+    async def test_find_by_output_type(self, loopback_server):
+        """Features are found across devices without walking them."""
+        client = ButtplugClient("Test")
+        await client.connect(LoopbackConnector(loopback_server))
+
+        vibrators = client.find_features(OutputType.VIBRATE)
+        assert [(d.index, f.index) for d, f in vibrators] == [(0, 0), (0, 1)]
+        strokers = client.find_features("HwPositionWithDuration")
+        assert [(d.index, f.index) for d, f in strokers] == [(1, 0)]
+        assert client.find_features(OutputType.ROTATE) == []
+
+        await client.disconnect()
+        assert client.find_features(OutputType.VIBRATE) == []
+
+    async def test_name_pattern(self, loopback_server):
+        """Name patterns are case-insensitive globs over name and display name."""
+        client = ButtplugClient("Test")
+        await client.connect(LoopbackConnector(loopback_server))
+
+        assert len(client.find_features(OutputType.VIBRATE, "*vibrator")) == 2
+        assert len(client.find_features(OutputType.VIBRATE, "MY *")) == 2
+        assert client.find_features(OutputType.VIBRATE, "*stroker*") == []
+
+        await client.disconnect()
+
+    async def test_index_follows_device_list(self, loopback_server, sample_device_list_data):
+        """Added, removed and changed devices update the index."""
+        client = ButtplugClient("Test")
+        await client.connect(LoopbackConnector(loopback_server))
+        assert len(client.find_features(OutputType.POSITION_WITH_DURATION)) == 1
+
+        loopback_server.remove_device(1)
+        await asyncio.sleep(0.01)
+        assert client.find_features(OutputType.POSITION_WITH_DURATION) == []
+
+        loopback_server.add_device(sample_device_list_data["Devices"]["1"])
+        await asyncio.sleep(0.01)
+        ((device, _),) = client.find_features(OutputType.POSITION_WITH_DURATION)
+        assert device is client.devices[1]
+
+        # Same device re-sent with a feature gone
+        del loopback_server.devices["0"]["DeviceFeatures"]["1"]
+        loopback_server.add_device(loopback_server.devices["0"])
+        await asyncio.sleep(0.01)
+        assert [f.index for _, f in client.find_features(OutputType.VIBRATE)] == [0]
+
+        await client.disconnect()
+
+
+class TestApply:
+    """Tests for multi-feature, multi-device output batches."""
+
+    async def test_applies_across_devices_in_one_frame(self, loopback_server):
+        """Every entry reaches the server in a single frame."""
+        client = ButtplugClient("Test")
+        connector = LoopbackConnector(loopback_server)
+        await client.connect(connector)
+        frames = []
+        write_frame = connector._write_frame
+
+        async def counting_write(frame):
+            frames.append(frame)
+            await write_frame(frame)
+
+        connector._write_frame = counting_write
+
+        result = await client.apply(
+            {
+                (0, 0, OutputType.VIBRATE): 0.4,
+                (0, 1, "Vibrate"): 15,
+                (1, 0, OutputType.POSITION_WITH_DURATION): DeviceOutputCommand(
+                    OutputType.POSITION_WITH_DURATION, 1.0, duration=5000
+                ),
+            }
+        )
+
+        assert result == BatchResult(sent=3)
+        assert result.ok
+        assert len(frames) == 1
+        assert loopback_server.outputs == {
+            (0, 0): {"Vibrate": {"Value": 8}},
+            (0, 1): {"Vibrate": {"Value": 15}},
+            (1, 0): {"HwPositionWithDuration": {"Value": 100, "Duration": 1000}},
+        }
+        await client.disconnect()
+
+    @pytest.mark.parametrize(
+        "key, value",
+        [
+            ((5, 0, OutputType.VIBRATE), 0.5),
+            ((0, 9, OutputType.VIBRATE), 0.5),
+            ((0, 0, OutputType.ROTATE), 0.5),
+            ((0, 0, "Wiggle"), 0.5),
+            ((0, 0, OutputType.VIBRATE), 1.5),
+            ((0, 0, OutputType.VIBRATE), DeviceOutputCommand(OutputType.ROTATE, 0.5)),
+        ],
+    )
+    async def test_invalid_entry_sends_nothing(self, loopback_server, key, value):
+        """Validation happens before anything is sent."""
+        client = ButtplugClient("Test")
+        await client.connect(LoopbackConnector(loopback_server))
+
+        with pytest.raises(ButtplugDeviceError):
+            await client.apply({(0, 1, OutputType.VIBRATE): 0.5, key: value})
+
+        assert loopback_server.count("OutputCmd") == 0
+        await client.disconnect()
+
+    async def test_server_errors_reported_per_entry(self, loopback_server):
+        """Rejected entries are listed; the rest are applied."""
+        client = ButtplugClient("Test")
+        await client.connect(LoopbackConnector(loopback_server))
+        loopback_server.devices["0"]["DeviceFeatures"]["1"]["Output"] = {}
+
+        result = await client.apply(
+            {(0, 0, OutputType.VIBRATE): 0.5, (0, 1, OutputType.VIBRATE): 0.5}
+        )
+
+        assert not result.ok
+        assert result.sent == 2
+        assert list(result.errors) == [(0, 1, OutputType.VIBRATE)]
+        assert isinstance(result.errors[(0, 1, OutputType.VIBRATE)], ButtplugDeviceError)
+        assert loopback_server.outputs == {(0, 0): {"Vibrate": {"Value": 10}}}
+        await client.disconnect()
+
+    async def test_redundant_entries_skipped(self, loopback_server):
+        """With cache_outputs, entries already at their step aren't sent."""
+        client = ButtplugClient("Test")
+        client.cache_outputs = True
+        await client.connect(LoopbackConnector(loopback_server))
+        scene = {(0, 0, OutputType.VIBRATE): 0.5, (0, 1, OutputType.VIBRATE): 0.5}
+
+        await client.apply(scene)
+        result = await client.apply({**scene, (0, 1, OutputType.VIBRATE): 0.8})
+
+        assert (result.sent, result.skipped) == (1, 1)
+        assert loopback_server.count("OutputCmd") == 3
+        await client.disconnect()
+
+    async def test_invalid_entry_leaves_output_state(self, loopback_server):
+        """A failing entry leaves earlier redundant entries' state untouched."""
+        client = ButtplugClient("Test")
+        client.cache_outputs = True
+        await client.connect(LoopbackConnector(loopback_server))
+        await client.apply({(0, 0, OutputType.VIBRATE): 0.5})
+        feature = client.devices[0].features[0]
+        last = dict(feature._last_outputs)
+
+        with pytest.raises(ButtplugDeviceError):
+            await client.apply(
+                {
+                    (0, 0, OutputType.VIBRATE): DeviceOutputCommand(OutputType.VIBRATE, 0.5),
+                    (0, 1, OutputType.VIBRATE): 1.5,
+                }
+            )
+
+        assert feature._last_outputs == last
+        assert all(feature._last_outputs[k] is v for k, v in last.items())
+        await client.disconnect()
+
+    async def test_keeps_other_scheduled_output_types(self, loopback_server):
+        """Applying one output type leaves other scheduled types of the feature queued."""
+        loopback_server.devices["0"]["DeviceFeatures"]["0"]["Output"]["Rotate"] = {"Value": [0, 20]}
+        client = ButtplugClient("Test")
+        await client.connect(LoopbackConnector(loopback_server))
+        device = client.devices[0]
+        feature = device.features[0]
+
+        feature.submit_output(DeviceOutputCommand(OutputType.VIBRATE, 5))
+        feature.submit_output(DeviceOutputCommand(OutputType.ROTATE, 10))
+        await client.apply({(0, 0, OutputType.VIBRATE): 15})
+        await device.output_scheduler.drain()
+
+        sent = [
+            fields["Command"]
+            for name, fields in loopback_server.received
+            if name == "OutputCmd" and fields["FeatureIndex"] == 0
+        ]
+        assert sent == [{"Vibrate": {"Value": 15}}, {"Rotate": {"Value": 10}}]
+        await client.disconnect()
+
+    async def test_not_connected(self):
+        """Applying without a connection fails."""
+        client = ButtplugClient("Test")
+        with pytest.raises(ButtplugConnectorError):
+            await client.apply({(0, 0, OutputType.VIBRATE): 0.5})
+
+
+class TestSubscribe:
+    """Tests for streaming sensor readings through subscriptions."""
+
+    @pytest.fixture
+    def loopback_server(self, loopback_server, sensor_device):
+        loopback_server.add_device(sensor_device)
+        return loopback_server
+
+    def input_commands(self, server):
+        return [fields["Command"] for name, fields in server.received if name == "InputCmd"]
+
+    async def test_readings_routed(self, loopback_client, loopback_server):
+        """Pushed readings reach the subscription for their sensor only."""
+        pressure = loopback_client.devices[2].features[0]
+
+        async with pressure.subscribe(InputType.PRESSURE) as readings:
+            loopback_server.push_reading(2, 1, "Button", 1)
+            for value in (10, 20, 30):
+                loopback_server.push_reading(2, 0, "Pressure", value)
+            values = [
+                (await asyncio.wait_for(readings.__anext__(), timeout=1)).value for _ in range(3)
+            ]
+
+        assert values == [10, 20, 30]
+        assert self.input_commands(loopback_server) == ["Subscribe", "Unsubscribe"]
+        assert readings.closed
+
+    async def test_shared_server_subscription(self, loopback_client, loopback_server):
+        """Subscribers to one sensor share a server subscription until the last leaves."""
+        button = loopback_client.devices[2].features[1]
+        first = button.subscribe(InputType.BUTTON)
+        second = button.subscribe(InputType.BUTTON)
+        await first.start()
+        await second.start()
+
+        loopback_server.push_reading(2, 1, "Button", 1)
+        assert (await asyncio.wait_for(first.__anext__(), timeout=1)).value == 1
+        assert (await asyncio.wait_for(second.__anext__(), timeout=1)).value == 1
+
+        await first.close()
+        assert self.input_commands(loopback_server) == ["Subscribe"]
+        await second.close()
+        assert self.input_commands(loopback_server) == ["Subscribe", "Unsubscribe"]
+
+    @pytest.mark.parametrize(
+        "overflow, expected",
+        [(SensorOverflow.DROP, [0, 1, 2]), (SensorOverflow.KEEP_LATEST, [7, 8, 9])],
+    )
+    async def test_overflow(self, loopback_client, loopback_server, overflow, expected):
+        """Full buffers drop the newest or the oldest readings."""
+        pressure = loopback_client.devices[2].features[0]
+
+        async with pressure.subscribe(InputType.PRESSURE, 3, overflow) as readings:
+            for value in range(10):
+                loopback_server.push_reading(2, 0, "Pressure", value)
+            # Wait until every reading has been routed
+            while readings.received < 10:
+                await asyncio.sleep(0.001)
+            values = [(await readings.__anext__()).value for _ in range(3)]
+
+        assert values == expected
+        assert readings.dropped == 7
+
+    async def test_iteration_ends_when_device_removed(self, loopback_client, loopback_server):
+        """A removed device's subscriptions stop iterating."""
+        pressure = loopback_client.devices[2].features[0]
+        readings = []
+
+        async def consume():
+            async with pressure.subscribe(InputType.PRESSURE) as subscription:
+                async for reading in subscription:
+                    readings.append(reading.value)
+
+        task = asyncio.create_task(consume())
+        while not loopback_client._subscriptions:
+            await asyncio.sleep(0.001)
+        loopback_server.push_reading(2, 0, "Pressure", 5)
+        loopback_server.remove_device(2)
+        await asyncio.wait_for(task, timeout=1)
+
+        assert readings == [5]
+        assert loopback_client._subscriptions == {}
+
+    async def test_history_recorded(self, loopback_client, loopback_server):
+        """With history_size set, pushed and read values are kept per sensor."""
+        loopback_client.history_size = 2
+        pressure = loopback_client.devices[2].features[0]
+        loopback_server.set_reading(2, 0, "Pressure", 7)
+
+        async with pressure.subscribe(InputType.PRESSURE) as readings:
+            for value in (1, 2, 3):
+                loopback_server.push_reading(2, 0, "Pressure", value)
+            while readings.received < 3:
+                await asyncio.sleep(0.001)
+        await pressure._read_input(InputType.PRESSURE)
+
+        history = pressure.history(InputType.PRESSURE)
+        assert history.values.tolist() == [3.0, 7.0]
+        assert history.total == 4
+        assert loopback_client.sensor_history(2, 0, "Pressure") is history
+        assert pressure.history(InputType.BUTTON) is None
+
+        loopback_server.remove_device(2)
+        while 2 in loopback_client.devices:
+            await asyncio.sleep(0.001)
+        assert loopback_client.sensor_history(2, 0, "Pressure") is None
+
+    async def test_concurrent_subscribers_share_failure(self, loopback_client, loopback_server):
+        """A subscriber joining a pending Subscribe fails with it if it's rejected."""
+        button = loopback_client.devices[2].features[1]
+        del loopback_server.devices["2"]["DeviceFeatures"]["1"]["Input"]
+        first = button.subscribe(InputType.BUTTON)
+        second = button.subscribe(InputType.BUTTON)
+
+        results = await asyncio.gather(first.start(), second.start(), return_exceptions=True)
+
+        assert all(isinstance(result, ButtplugDeviceError) for result in results)
+        assert not first.active and not second.active
+        assert loopback_client._subscriptions == {}
+        assert self.input_commands(loopback_server) == ["Subscribe"]
+
+    async def test_rejected_resubscribe_ends_iteration(self, loopback_client, loopback_server):
+        """Subscriptions the server refuses after a reconnect stop iterating."""
+        reconnected = asyncio.Event()
+        loopback_client.reconnect_policy = ReconnectPolicy(initial_delay=0.01)
+        loopback_client.on_reconnected = reconnected.set
+        pressure = loopback_client.devices[2].features[0]
+        readings = pressure.subscribe(InputType.PRESSURE)
+        await readings.start()
+
+        answer_input = loopback_server._input
+
+        def reject_subscribe(msg_id, fields):
+            if fields["Command"] == "Subscribe":
+                return loopback_server._error(msg_id, ErrorCode.DEVICE, "Sensor gone")
+            return answer_input(msg_id, fields)
+
+        loopback_server._input = reject_subscribe  # type: ignore[method-assign]
+        loopback_server.drop_connections()
+        await asyncio.wait_for(reconnected.wait(), timeout=2)
+
+        with pytest.raises(StopAsyncIteration):
+            await asyncio.wait_for(readings.__anext__(), timeout=1)
+        assert loopback_client._subscriptions == {}
+
+    async def test_unsupported(self, loopback_client):
+        """Only sensors that accept Subscribe can be subscribed to."""
+        battery = loopback_client.devices[0].features[2]
+        with pytest.raises(ButtplugDeviceError):
+            battery.subscribe(InputType.BATTERY)
+
+
+class TestReadCache:
+    """Tests for caching battery and RSSI reads."""
+
+    async def test_disabled_by_default(self, loopback_client, loopback_server):
+        """Without a policy every read goes to the server."""
+        await loopback_client.devices[0].battery()
+        await loopback_client.devices[0].battery()
+
+        assert loopback_server.count("InputCmd") == 2
+
+    async def test_fresh_hit(self, loopback_client, loopback_server):
+        """Reads within the TTL are answered from cache."""
+        loopback_client.read_cache = ReadCachePolicy(ttl=60)
+        loopback_server.set_reading(0, 2, "Battery", 80)
+
+        assert await loopback_client.devices[0].battery() == 0.8
+        loopback_server.set_reading(0, 2, "Battery", 50)
+        assert await loopback_client.devices[0].battery() == 0.8
+
+        assert loopback_server.count("InputCmd") == 1
+        stats = loopback_client.read_cache_stats
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.hit_rate == 0.5
+
+    async def test_concurrent_reads_collapsed(self, loopback_client, loopback_server):
+        """Concurrent misses share one request."""
+        loopback_client.read_cache = ReadCachePolicy(ttl=60)
+        loopback_server.set_reading(0, 2, "Battery", 40)
+
+        results = await asyncio.gather(*(loopback_client.devices[0].battery() for _ in range(5)))
+
+        assert results == [0.4] * 5
+        assert loopback_server.count("InputCmd") == 1
+        assert loopback_client.read_cache_stats.collapsed == 4
+
+    async def test_stale_while_revalidate(self, loopback_client, loopback_server):
+        """Stale values are served at once while one background read refreshes them."""
+        loopback_client.read_cache = ReadCachePolicy(ttl=0, max_stale=60)
+        loopback_server.set_reading(0, 2, "Battery", 90)
+        await loopback_client.devices[0].battery()
+        loopback_server.set_reading(0, 2, "Battery", 70)
+
+        stale = [await loopback_client.devices[0].battery() for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        assert stale == [0.9, 0.9, 0.9]
+        assert loopback_server.count("InputCmd") == 2
+        assert loopback_client.read_cache_stats.refreshes == 1
+        assert await loopback_client.devices[0].battery() == 0.7
+
+    async def test_too_stale_waits(self, loopback_client, loopback_server):
+        """Past max_stale, callers wait for a fresh value."""
+        loopback_client.read_cache = ReadCachePolicy(ttl=0, max_stale=0)
+        loopback_server.set_reading(0, 2, "Battery", 90)
+        await loopback_client.devices[0].battery()
+        await asyncio.sleep(0.001)
+        loopback_server.set_reading(0, 2, "Battery", 70)
+
+        assert await loopback_client.devices[0].battery() == 0.7
+        assert loopback_client.read_cache_stats.misses == 2
+
+    async def test_errors_not_cached(self, loopback_client, loopback_server):
+        """A failed read fails its callers and leaves nothing cached."""
+        loopback_client.read_cache = ReadCachePolicy(ttl=60)
+        loopback_server.devices["0"]["DeviceFeatures"]["2"]["Input"] = {}
+
+        with pytest.raises(ButtplugDeviceError):
+            await loopback_client.devices[0].battery()
+        loopback_server.devices["0"]["DeviceFeatures"]["2"]["Input"] = {
+            "Battery": {"Value": [[0, 100]], "Command": ["Read"]}
+        }
+        loopback_server.set_reading(0, 2, "Battery", 30)
+        assert await loopback_client.devices[0].battery() == 0.3
+
+    def test_invalid_policy(self):
+        """Negative durations are rejected."""
+        with pytest.raises(ValueError):
+            ReadCachePolicy(ttl=-1)
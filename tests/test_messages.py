@@ -20,7 +20,7 @@ from buttplug._messages import (
     StopCmd,
     StopScanning,
 )
-from buttplug._messages.base import parse_message, parse_messages
+from buttplug._messages.base import message_types, parse_message, parse_messages
 from buttplug.enums import ErrorCode
 
 
@@ -274,6 +274,138 @@ class TestCommandMessages:
         ]
 
 
+class TestCompactMessages:
+    """Tests for the hot-path messages that bypass pydantic."""
+
+    def test_compact_messages_have_no_instance_dict(self):
+        """Compact messages are fully slotted."""
+        msg = OutputCmd(id=1, device_index=0, feature_index=0, command={"Vibrate": {"Value": 1}})
+
+        assert not hasattr(msg, "__dict__")
+        assert not hasattr(Ok(id=1), "__dict__")
+
+    def test_compact_message_equality_and_repr(self):
+        """Compact messages compare by field values."""
+        assert StopCmd(id=1, device_index=2) == StopCmd(id=1, device_index=2)
+        assert StopCmd(id=1, device_index=2) != StopCmd(id=1, device_index=3)
+        assert Ok(id=1) != Ok(id=2)
+        assert repr(Ok(id=3)) == "Ok(id=3)"
+
+    def test_compact_roundtrip(self, sample_input_reading_data):
+        """Compact messages survive a to_protocol/parse roundtrip."""
+        messages = [
+            Ok(id=1),
+            OutputCmd(id=2, device_index=0, feature_index=1, command={"Vibrate": {"Value": 4}}),
+            StopCmd(id=3, device_index=0, feature_index=1, inputs=False),
+            parse_message({"InputReading": sample_input_reading_data}),
+        ]
+
+        for msg in messages:
+            assert parse_messages(msg.to_protocol()) == [msg]
+
+    def test_compact_rejects_extra_fields(self):
+        """Compact messages reject unknown fields like the pydantic models do."""
+        with pytest.raises(ValueError, match="unexpected field"):
+            parse_message({"Ok": {"Id": 1, "Extra": True}})
+
+    def test_compact_rejects_missing_fields(self):
+        """Compact messages reject missing required fields."""
+        with pytest.raises(ValueError, match="missing field"):
+            parse_message({"OutputCmd": {"Id": 1, "DeviceIndex": 0}})
+
+    def test_compact_rejects_wrong_types(self):
+        """Compact messages reject non-integer ids and values."""
+        with pytest.raises(ValueError, match="must be an integer"):
+            parse_message({"Ok": {"Id": "1"}})
+        with pytest.raises(ValueError, match="must be an integer"):
+            parse_message(
+                {
+                    "InputReading": {
+                        "Id": 1,
+                        "DeviceIndex": 0,
+                        "FeatureIndex": 0,
+                        "Reading": {"Battery": {"Value": True}},
+                    }
+                }
+            )
+        with pytest.raises(ValueError, match="must be an integer"):
+            parse_message({"Ok": {"Id": 1.5}})
+
+    def test_integral_floats_accepted(self):
+        """Integral floats are accepted as integers, as the pydantic models did."""
+        data = {
+            "InputReading": {
+                "Id": 1.0,
+                "DeviceIndex": 0,
+                "FeatureIndex": 2.0,
+                "Reading": {"Battery": {"Value": 50.0}},
+            }
+        }
+
+        msg = parse_message(data)
+
+        assert (msg.id, msg.feature_index) == (1, 2)
+        assert msg.reading["Battery"].value == 50
+        assert type(msg.reading["Battery"].value) is int
+
+
+class TestFastDecoding:
+    """Tests for the non-strict fast decoding path."""
+
+    def test_registry_built_once(self):
+        """The message type registry is built once and reused."""
+        assert message_types() is message_types()
+        assert message_types()["Ok"] is Ok
+
+    def test_fast_ok(self):
+        """Ok decodes on the fast path."""
+        msg = parse_message({"Ok": {"Id": 7}}, strict=False)
+
+        assert isinstance(msg, Ok)
+        assert msg.id == 7
+
+    def test_fast_error(self):
+        """Error decodes on the fast path with a real ErrorCode."""
+        data = {"Error": {"Id": 3, "ErrorMessage": "Device gone", "ErrorCode": 4}}
+        msg = parse_message(data, strict=False)
+
+        assert isinstance(msg, Error)
+        assert msg.error_code is ErrorCode.DEVICE
+        assert msg.error_message == "Device gone"
+
+    def test_fast_input_reading(self, sample_input_reading_data):
+        """InputReading decodes on the fast path to the same result as strict."""
+        data = {"InputReading": sample_input_reading_data}
+
+        assert parse_message(data, strict=False) == parse_message(data)
+
+    def test_fast_path_skips_validation(self):
+        """Strict mode rejects what the fast path lets through."""
+        data = {"Ok": {"Id": 1, "Extra": True}}
+
+        assert parse_message(data, strict=False).id == 1
+        with pytest.raises(ValueError):
+            parse_message(data, strict=True)
+
+    def test_fast_path_falls_back_on_malformed(self):
+        """Malformed fast-path messages still raise ValueError."""
+        with pytest.raises(ValueError, match="missing field"):
+            parse_message({"Ok": {}}, strict=False)
+        with pytest.raises(ValueError):
+            parse_message({"Error": {"Id": 1, "ErrorMessage": "x", "ErrorCode": 99}}, strict=False)
+
+    def test_other_types_validated_when_not_strict(self):
+        """Messages without a fast path are always validated."""
+        msg = parse_messages([{"ScanningFinished": {"Id": 0}}], strict=False)
+
+        assert isinstance(msg[0], ScanningFinished)
+
+    def test_parse_messages_requires_array(self):
+        """parse_messages rejects frames that aren't arrays."""
+        with pytest.raises(ValueError, match="Expected message array"):
+            parse_messages({"Ok": {"Id": 1}})  # type: ignore[arg-type]
+
+
 class TestMessageParsing:
     """Tests for message parsing utilities."""
 
@@ -0,0 +1,120 @@
+"""Tests for motion planning on position outputs."""
+
+import asyncio
+
+import pytest
+
+from buttplug import (
+    ButtplugDeviceError,
+    MotionPlanner,
+    OutputType,
+    Pattern,
+    Trajectory,
+    TrajectoryPlayer,
+)
+
+
+def moves(plan):
+    """(start ms, end ms, step) of every planned move."""
+    return [(round(m.start * 1000), round(m.end * 1000), m.step) for m in plan.moves]
+
+
+@pytest.fixture
+def stroker(loopback_client):
+    return loopback_client.devices[1].features[0]
+
+
+class TestMotionPlanner:
+    """Tests for MotionPlanner against the loopback stroker (100 steps, 1s moves)."""
+
+    def test_dense_ramp_becomes_one_move(self, stroker):
+        """Collinear points are merged into a single move."""
+        trajectory = Trajectory.from_actions([(i * 10, i) for i in range(101)])
+
+        plan = MotionPlanner().plan(stroker, trajectory)
+
+        assert moves(plan) == [(0, 0, 0), (0, 1000, 100)]
+        assert plan.stats.points == 101
+        assert plan.stats.moves == 2
+        assert plan.stats.compression_ratio == pytest.approx(50.5)
+
+    def test_corners_kept(self, stroker):
+        """Simplification keeps every turn of a dense stroke."""
+        ramp = [(i * 10, i * 10) for i in range(11)]
+        trajectory = Trajectory.from_actions(
+            ramp + [(100 + i * 10, 100 - i * 10) for i in range(1, 11)]
+        )
+
+        plan = MotionPlanner().plan(stroker, trajectory)
+
+        assert moves(plan) == [(0, 0, 0), (0, 100, 100), (100, 200, 0)]
+
+    def test_tolerance(self, stroker):
+        """Wobble within the tolerance is dropped, larger wobble is kept."""
+        trajectory = Trajectory.from_actions([(0, 0), (100, 52), (200, 100)])
+
+        assert len(MotionPlanner(tolerance=3).plan(stroker, trajectory).moves) == 2
+        assert len(MotionPlanner(tolerance=1).plan(stroker, trajectory).moves) == 3
+
+    def test_velocity_limit(self, stroker):
+        """Segments too fast for the device fall short of their target, on time."""
+        trajectory = Trajectory.from_actions([(0, 0), (100, 100), (300, 0)])
+
+        plan = MotionPlanner(max_velocity=500).plan(stroker, trajectory)
+
+        assert moves(plan) == [(0, 0, 0), (0, 100, 50), (100, 300, 0)]
+        assert plan.stats.velocity_limited == 1
+
+    def test_acceleration_limit(self, stroker):
+        """Velocity changes between segments are limited."""
+        trajectory = Trajectory.from_actions([(0, 0), (100, 50), (200, 0)])
+
+        plan = MotionPlanner(max_acceleration=5000).plan(stroker, trajectory)
+
+        # 0 -> 500 steps/s is within the limit, 500 -> -500 is held at 0
+        assert moves(plan)[1:] == [(0, 100, 50), (100, 200, 50)]
+        assert plan.stats.acceleration_limited == 1
+
+    def test_long_moves_split(self, stroker):
+        """Merging stops at the feature's maximum duration, and long segments split."""
+        trajectory = Trajectory.from_actions([(i * 100, i * 4) for i in range(26)])
+
+        plan = MotionPlanner().plan(stroker, trajectory)
+
+        assert moves(plan) == [(0, 0, 0), (0, 833, 33), (833, 1667, 67), (1667, 2500, 100)]
+        assert all(m.duration <= 1.0 for m in plan.moves)
+
+    def test_pattern_source(self, stroker):
+        """Pattern samples are planned as points on a path."""
+        pattern = Pattern.sampled([i / 50 for i in range(51)], rate=100)
+
+        plan = MotionPlanner().plan(stroker, pattern)
+
+        assert moves(plan) == [(0, 0, 0), (0, 500, 100)]
+
+    def test_unsupported(self, loopback_client, stroker):
+        """Planning needs the position output on the feature."""
+        trajectory = Trajectory.from_actions([(0, 0)])
+        vibrator = loopback_client.devices[0].features[0]
+        with pytest.raises(ButtplugDeviceError):
+            MotionPlanner().plan(vibrator, trajectory)
+        with pytest.raises(ButtplugDeviceError):
+            MotionPlanner(output_type=OutputType.POSITION).plan(stroker, trajectory)
+        with pytest.raises(ValueError):
+            MotionPlanner(output_type=OutputType.VIBRATE)
+
+    async def test_trajectory_player_uses_plan(self, stroker, loopback_server):
+        """A player given a planner sends the planned moves."""
+        trajectory = Trajectory.from_actions([(i * 2, i) for i in range(51)])
+        player = TrajectoryPlayer(stroker, trajectory, planner=MotionPlanner())
+
+        assert player.plan.stats.compression_ratio > 10
+        player.start()
+        await asyncio.wait_for(player.wait(), timeout=1)
+
+        sent = [
+            fields["Command"]["HwPositionWithDuration"]
+            for name, fields in loopback_server.received
+            if name == "OutputCmd"
+        ]
+        assert [(move["Value"], move["Duration"]) for move in sent] == [(50, 100)]
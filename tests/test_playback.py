@@ -0,0 +1,215 @@
+"""Tests for pattern playback."""
+
+import asyncio
+import time
+
+import pytest
+
+from buttplug import (
+    ButtplugDeviceError,
+    OutputType,
+    Pattern,
+    PatternPlayer,
+)
+
+
+def sent_steps(server, feature_index=0):
+    """Vibrate steps the server received for a feature of device 0, in order."""
+    return [
+        fields["Command"]["Vibrate"]["Value"]
+        for name, fields in server.received
+        if name == "OutputCmd" and fields["FeatureIndex"] == feature_index
+    ]
+
+
+class TestPattern:
+    """Tests for building patterns."""
+
+    def test_sampled(self):
+        """Samples are spaced by the rate, and the length covers the last one."""
+        pattern = Pattern.sampled([0.0, 0.5, 1.0, 0.5], rate=10)
+
+        assert list(pattern.timestamps) == pytest.approx([0.0, 0.1, 0.2, 0.3])
+        assert pattern.length == pytest.approx(0.4)
+
+    def test_keyframes_interpolated(self):
+        """Keyframes are linearly interpolated at the given rate."""
+        pattern = Pattern.keyframes([(0.0, 0.0), (1.0, 1.0), (1.5, 0.0)], rate=4)
+
+        assert list(pattern.timestamps) == pytest.approx([0.0, 0.25, 0.5, 0.75, 1.0, 1.25, 1.5])
+        assert list(pattern.values) == pytest.approx([0.0, 0.25, 0.5, 0.75, 1.0, 0.5, 0.0])
+        assert pattern.length == 1.5
+
+    def test_int_keyframes_are_percents(self):
+        """Int keyframe values are percents at the endpoints too, not raw steps."""
+        pattern = Pattern.keyframes([(0.0, 0), (2.0, 1)], rate=1)
+
+        assert list(pattern.values) == pytest.approx([0.0, 0.5, 1.0])
+        assert all(type(value) is float for value in pattern.values)
+
+    @pytest.mark.parametrize(
+        "timestamps, values, duration",
+        [
+            ([], [], None),
+            ([0.0, 1.0], [0.5], None),
+            ([-1.0, 1.0], [0.5, 0.5], None),
+            ([0.0, 2.0, 1.0], [0.5, 0.5, 0.5], None),
+            ([0.0, 2.0], [0.5, 0.5], 1.0),
+        ],
+    )
+    def test_invalid(self, timestamps, values, duration):
+        """Malformed patterns are rejected."""
+        with pytest.raises(ValueError):
+            Pattern(timestamps, values, duration)
+
+
+class TestPatternPlayer:
+    """Tests for PatternPlayer against a loopback server."""
+
+    async def test_plays_to_end(self, loopback_client, loopback_server):
+        """Every step change is sent once, then outputs are stopped."""
+        feature = loopback_client.devices[0].features[0]
+        pattern = Pattern.sampled([0.0, 0.5, 0.5, 0.52, 1.0, 0.0], rate=100)
+        player = PatternPlayer([(feature, OutputType.VIBRATE, pattern)])
+
+        player.start()
+        assert player.playing
+        await asyncio.wait_for(player.wait(), timeout=1)
+
+        assert not player.playing
+        assert sent_steps(loopback_server) == [0, 10, 11, 20, 0]
+        assert loopback_server.count("StopCmd") == 1
+        assert player.position == pytest.approx(player.length)
+        stats = player.stats
+        assert stats.sent == 5
+        assert stats.errors == 0
+        assert stats.timed == 4  # Everything but the first value
+        assert stats.max_jitter < 0.05
+
+    async def test_multiple_features(self, loopback_client, loopback_server):
+        """Tracks on different features share the timeline."""
+        features = loopback_client.devices[0].features
+        player = PatternPlayer(
+            [
+                (features[0], OutputType.VIBRATE, Pattern([0.0, 0.02], [0.5, 1.0])),
+                (features[1], "Vibrate", Pattern([0.0, 0.01, 0.03], [1.0, 0.5, 0.0])),
+            ],
+            stop_outputs=False,
+        )
+        assert player.length == 0.03
+
+        player.start()
+        await asyncio.wait_for(player.wait(), timeout=1)
+
+        assert sent_steps(loopback_server, 0) == [10, 20]
+        assert sent_steps(loopback_server, 1) == [20, 10, 0]
+        assert loopback_server.count("StopCmd") == 0
+
+    async def test_loop_and_stop(self, loopback_client, loopback_server):
+        """Looping restarts the pattern until stopped."""
+        feature = loopback_client.devices[0].features[0]
+        pattern = Pattern.sampled([0.25, 0.75], rate=50)
+        player = PatternPlayer([(feature, OutputType.VIBRATE, pattern)], loop=True)
+
+        player.start()
+        await asyncio.sleep(0.15)
+        assert player.playing
+        await player.stop()
+
+        steps = sent_steps(loopback_server)
+        assert len(steps) >= 4
+        assert steps[:4] == [5, 15, 5, 15]
+        assert not player.playing
+        assert loopback_server.outputs == {}
+
+    async def test_pause_and_resume(self, loopback_client, loopback_server):
+        """Pausing freezes the position and stops outputs; resuming restores them."""
+        feature = loopback_client.devices[0].features[0]
+        pattern = Pattern.sampled([0.5, 1.0], rate=10)
+        player = PatternPlayer([(feature, OutputType.VIBRATE, pattern)])
+
+        player.start()
+        await asyncio.sleep(0.02)
+        player.pause()
+        position = player.position
+        await asyncio.sleep(0.15)
+
+        assert player.paused
+        assert player.position == position
+        assert loopback_server.outputs == {}
+        assert sent_steps(loopback_server) == [10]
+
+        player.resume()
+        await asyncio.sleep(0.01)
+        assert loopback_server.outputs[(0, 0)] == {"Vibrate": {"Value": 10}}
+        await asyncio.wait_for(player.wait(), timeout=1)
+        assert sent_steps(loopback_server) == [10, 10, 20]
+
+    async def test_seek(self, loopback_client, loopback_server):
+        """Seeking sends the value current at the new position right away."""
+        feature = loopback_client.devices[0].features[0]
+        pattern = Pattern.sampled([0.1, 0.5, 1.0], rate=2)
+        player = PatternPlayer([(feature, OutputType.VIBRATE, pattern)])
+
+        player.start()
+        await asyncio.sleep(0.01)
+        player.seek(1.2)
+        await asyncio.sleep(0.01)
+
+        assert sent_steps(loopback_server) == [2, 20]
+        assert player.position == pytest.approx(1.2, abs=0.05)
+        await player.stop()
+
+    async def test_speed(self, loopback_client, loopback_server):
+        """Speed scales how fast the pattern plays."""
+        feature = loopback_client.devices[0].features[0]
+        pattern = Pattern.sampled([0.1, 0.2, 0.3, 0.4], rate=20)
+        player = PatternPlayer([(feature, OutputType.VIBRATE, pattern)], speed=4.0)
+
+        start = time.monotonic()
+        player.start()
+        await asyncio.wait_for(player.wait(), timeout=1)
+
+        assert time.monotonic() - start < 0.15
+        assert sent_steps(loopback_server) == [2, 4, 6, 8]
+        with pytest.raises(ValueError):
+            player.speed = 0
+
+    async def test_late_events_skipped(self, loopback_client, loopback_server):
+        """A blocked loop catches up to the current value instead of replaying."""
+        feature = loopback_client.devices[0].features[0]
+        pattern = Pattern.sampled([i / 20 for i in range(21)], rate=200)
+        player = PatternPlayer([(feature, OutputType.VIBRATE, pattern)], stop_outputs=False)
+
+        player.start()
+        await asyncio.sleep(0)
+        time.sleep(0.06)  # Block the event loop
+        await asyncio.wait_for(player.wait(), timeout=1)
+
+        steps = sent_steps(loopback_server)
+        assert steps[-1] == 20
+        assert len(steps) < 21
+        assert player.stats.skipped > 0
+        assert player.stats.max_jitter >= 0.03
+
+    async def test_invalid_values_rejected_up_front(self, loopback_client):
+        """Patterns are quantized, and so validated, when the player is built."""
+        feature = loopback_client.devices[0].features[0]
+        with pytest.raises(ButtplugDeviceError):
+            PatternPlayer([(feature, OutputType.VIBRATE, Pattern([0.0, 0.1], [0.5, 1.5]))])
+        with pytest.raises(ButtplugDeviceError):
+            PatternPlayer([(feature, OutputType.ROTATE, Pattern([0.0], [0.5]))])
+        with pytest.raises(ValueError):
+            PatternPlayer([(feature, OutputType.VIBRATE, Pattern([0.0], [0.5]))], loop=True)
+
+    async def test_numpy_pattern(self, loopback_client, loopback_server):
+        """NumPy arrays are quantized according to their dtype."""
+        np = pytest.importorskip("numpy")
+        feature = loopback_client.devices[0].features[0]
+        pattern = Pattern(np.array([0.0, 0.01]), np.array([0.5, 1.0], dtype=np.float32))
+        player = PatternPlayer([(feature, OutputType.VIBRATE, pattern)], stop_outputs=False)
+
+        player.start()
+        await asyncio.wait_for(player.wait(), timeout=1)
+
+        assert sent_steps(loopback_server) == [10, 20]
@@ -0,0 +1,120 @@
+"""Tests for aligning sensor readings onto a common timeline."""
+
+import asyncio
+import math
+
+import pytest
+
+from buttplug import (
+    InputType,
+    Interpolation,
+    SensorHistory,
+    SensorResampler,
+    resample,
+)
+
+
+def history(*readings):
+    result = SensorHistory(capacity=16)
+    for timestamp, value in readings:
+        result.append(timestamp, value)
+    return result
+
+
+@pytest.fixture
+def loopback_server(loopback_server, sensor_device):
+    loopback_server.add_device(sensor_device)
+    return loopback_server
+
+
+class TestResample:
+    """Tests for resampling recorded histories."""
+
+    def test_hold(self):
+        """Each source holds its last reading; staleness is its age."""
+        pytest.importorskip("numpy")
+        pressure = history((0.0, 10.0), (0.25, 20.0))
+        button = history((0.1, 1.0))
+
+        block = resample([pressure, button], rate=10, end=0.3)
+
+        assert block.timestamps.tolist() == pytest.approx([0.0, 0.1, 0.2, 0.3])
+        assert block.values[:, 0].tolist() == [10.0, 10.0, 10.0, 20.0]
+        assert block.staleness[:, 0].tolist() == pytest.approx([0.0, 0.1, 0.2, 0.05])
+        assert math.isnan(block.values[0, 1])
+        assert block.staleness[0, 1] == math.inf
+        assert block.values[1:, 1].tolist() == [1.0, 1.0, 1.0]
+
+    def test_linear(self):
+        """Linear interpolation fills in between readings."""
+        pytest.importorskip("numpy")
+        pressure = history((0.0, 0.0), (1.0, 100.0))
+
+        block = resample([pressure], rate=4, method=Interpolation.LINEAR)
+
+        assert block.values[:, 0].tolist() == pytest.approx([0, 25, 50, 75, 100])
+
+    def test_empty(self):
+        """Empty histories need an explicit range."""
+        pytest.importorskip("numpy")
+        with pytest.raises(ValueError):
+            resample([SensorHistory()], rate=10)
+        block = resample([SensorHistory()], rate=10, start=0.0, end=0.1)
+        assert block.values.shape == (2, 1)
+
+
+class TestSensorResampler:
+    """Tests for resampling live subscriptions."""
+
+    def test_sample(self):
+        """Frames hold or interpolate each source independently."""
+        resampler = SensorResampler([], rate=10, method=Interpolation.LINEAR)
+        resampler._histories = [history((0.0, 0.0), (1.0, 100.0)), history((2.0, 1.0))]
+
+        frame = resampler.sample(0.5)
+
+        assert frame.values[0] == 50.0
+        assert math.isnan(frame.values[1])
+        assert frame.staleness == (0.5, math.inf)
+
+    async def test_frames_from_subscriptions(self, loopback_client, loopback_server):
+        """Readings from several sensors come out as aligned frames at the rate."""
+        pressure, button = (
+            loopback_client.devices[2].features[0],
+            loopback_client.devices[2].features[1],
+        )
+        sources = [pressure.subscribe(InputType.PRESSURE), button.subscribe(InputType.BUTTON)]
+        frames = []
+
+        async with SensorResampler(sources, rate=100) as resampler:
+            loopback_server.push_reading(2, 0, "Pressure", 500)
+            async for frame in resampler:
+                frames.append(frame)
+                if len(frames) == 2:
+                    loopback_server.push_reading(2, 1, "Button", 1)
+                if len(frames) == 5:
+                    break
+
+        # Frames sit on the 10ms grid (a busy loop may skip some)
+        gaps = [(b.timestamp - a.timestamp) / 0.01 for a, b in zip(frames, frames[1:])]
+        assert all(round(gap) >= 1 and gap == pytest.approx(round(gap)) for gap in gaps)
+        assert frames[-1].values == (500.0, 1.0)
+        assert frames[-1].staleness[0] > frames[-1].staleness[1]
+        assert math.isnan(frames[0].values[1])
+        assert all(source.closed for source in sources)
+
+    async def test_ends_when_sources_close(self, loopback_client, loopback_server):
+        """Iteration stops once the device behind every source is gone."""
+        pressure = loopback_client.devices[2].features[0]
+
+        async def consume():
+            async with SensorResampler(
+                [pressure.subscribe(InputType.PRESSURE)], rate=100
+            ) as frames:
+                async for _ in frames:
+                    pass
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.02)
+        loopback_server.remove_device(2)
+        await asyncio.wait_for(task, timeout=1)
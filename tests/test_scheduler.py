@@ -0,0 +1,112 @@
+"""Tests for latest-value-wins output scheduling."""
+
+import asyncio
+
+import pytest
+
+from buttplug import (
+    ButtplugDeviceError,
+    DeviceOutputCommand,
+    OutputType,
+)
+
+
+def vibrate(value: float) -> DeviceOutputCommand:
+    return DeviceOutputCommand(OutputType.VIBRATE, value)
+
+
+class TestOutputScheduler:
+    """Tests for OutputScheduler."""
+
+    async def test_burst_coalesces_to_latest(self, loopback_client, loopback_server):
+        """Only the newest value of a burst is sent."""
+        feature = loopback_client.devices[0].features[0]
+
+        for step in range(21):
+            feature.submit_output(vibrate(step))
+        await loopback_client.devices[0].output_scheduler.drain()
+
+        assert loopback_server.count("OutputCmd") == 1
+        assert loopback_server.outputs[(0, 0)] == {"Vibrate": {"Value": 20}}
+        stats = loopback_client.devices[0].output_scheduler.stats
+        assert stats.submitted == 21
+        assert stats.coalesced == 20
+        assert stats.sent == 1
+
+    async def test_device_submit_flushes_features_together(self, loopback_client, loopback_server):
+        """Device-level submits cover every matching feature in one flush."""
+        device = loopback_client.devices[0]
+
+        device.submit_output(vibrate(0.5))
+        await device.output_scheduler.drain()
+
+        assert loopback_server.count("OutputCmd") == 2
+        assert device.output_scheduler.stats.flushes == 1
+
+    async def test_flushes_paced_by_timing_gap(self, loopback_client, loopback_server):
+        """A second flush waits for the device's message timing gap."""
+        feature = loopback_client.devices[0].features[0]
+        scheduler = loopback_client.devices[0].output_scheduler
+        assert scheduler.gap == pytest.approx(0.05)
+
+        feature.submit_output(vibrate(0.1))
+        await scheduler.drain()
+        feature.submit_output(vibrate(0.2))
+        await asyncio.sleep(0.02)
+        assert loopback_server.count("OutputCmd") == 1
+
+        await asyncio.wait_for(scheduler.drain(), timeout=1)
+        assert loopback_server.count("OutputCmd") == 2
+
+    async def test_stream_output_never_queues(self, loopback_client, loopback_server):
+        """A fast source is sampled at the device's pace, ending on its last value."""
+        feature = loopback_client.devices[0].features[0]
+
+        async def source():
+            for i in range(200):
+                yield vibrate((i % 21) / 20)
+                await asyncio.sleep(0.001)
+            yield vibrate(0.75)
+
+        await asyncio.wait_for(feature.stream_output(source()), timeout=5)
+
+        assert loopback_server.count("OutputCmd") < 20
+        assert loopback_server.outputs[(0, 0)] == {"Vibrate": {"Value": 15}}
+
+    async def test_stop_discards_pending(self, loopback_client, loopback_server):
+        """Stopping a device drops updates that haven't gone out yet."""
+        device = loopback_client.devices[0]
+        feature = device.features[0]
+
+        feature.submit_output(vibrate(0.1))
+        await device.output_scheduler.drain()
+        feature.submit_output(vibrate(0.9))
+        await device.stop()
+        await asyncio.sleep(0.1)
+
+        assert loopback_server.count("OutputCmd") == 1
+        assert loopback_server.outputs == {}
+        assert device.output_scheduler.pending_count == 0
+
+    async def test_invalid_submit_raises_immediately(self, loopback_client):
+        """Unsupported outputs and out-of-range values fail at submit time."""
+        feature = loopback_client.devices[0].features[0]
+
+        with pytest.raises(ButtplugDeviceError):
+            feature.submit_output(DeviceOutputCommand(OutputType.ROTATE, 0.5))
+        with pytest.raises(ButtplugDeviceError):
+            feature.submit_output(vibrate(50))
+        assert loopback_client.devices[0].output_scheduler.pending_count == 0
+
+    async def test_removed_device_drops_pending(self, loopback_client, loopback_server):
+        """Pending updates of a removed device are never sent."""
+        device = loopback_client.devices[0]
+        device.submit_output(vibrate(0.1))
+        await device.output_scheduler.drain()
+        device.submit_output(vibrate(0.5))
+
+        loopback_server.remove_device(0)
+        await asyncio.sleep(0.1)
+
+        assert loopback_server.count("OutputCmd") == 2
+        assert device.output_scheduler.pending_count == 0
@@ -0,0 +1,158 @@
+"""Tests for the fleet sensor sweeper."""
+
+import asyncio
+
+import pytest
+
+from buttplug import InputType, LoopbackServer, SensorSweeper
+
+
+def battery_device(index):
+    return {
+        "DeviceName": f"Battery Device {index}",
+        "DeviceIndex": index,
+        "DeviceFeatures": {
+            "0": {
+                "FeatureIndex": 0,
+                "FeatureDescription": "Battery",
+                "Input": {"Battery": {"Value": [[0, 100]], "Command": ["Read"]}},
+            },
+            "1": {
+                "FeatureIndex": 1,
+                "FeatureDescription": "RSSI",
+                "Input": {"RSSI": {"Value": [[-100, 0]], "Command": ["Read"]}},
+            },
+        },
+    }
+
+
+@pytest.fixture
+def loopback_server():
+    """Five battery devices with Battery and RSSI readings."""
+    server = LoopbackServer({str(i): battery_device(i) for i in range(5)})
+    for i in range(5):
+        server.set_reading(i, 0, "Battery", 50 + i)
+        server.set_reading(i, 1, "RSSI", -40)
+    return server
+
+
+class TestSensorSweeper:
+    """Tests for SensorSweeper against a loopback server."""
+
+    async def test_sweep_snapshot_and_changes(self, loopback_client, loopback_server):
+        """A sweep reads every matching sensor into the snapshot and reports changes."""
+        sweeper = SensorSweeper(loopback_client, [InputType.BATTERY])
+        changes = []
+        sweeper.on_change += changes.append
+
+        snapshot = await sweeper.sweep()
+
+        assert {key: reading.value for key, reading in snapshot.items()} == {
+            (i, 0, "Battery"): 50 + i for i in range(5)
+        }
+        assert [change.previous for change in changes] == [None] * 5
+
+        loopback_server.set_reading(3, 0, "Battery", 40)
+        await sweeper.sweep()
+
+        assert len(changes) == 6
+        assert (changes[-1].previous, changes[-1].reading.value) == (53, 40)
+        assert sweeper.stats.reads == 10
+        assert sweeper.stats.sensors == 5
+
+    async def test_intervals_adapt(self, loopback_client, loopback_server):
+        """Stable values back off; fast drops speed polling up again."""
+        sweeper = SensorSweeper(
+            loopback_client,
+            [InputType.BATTERY, InputType.RSSI],
+            min_interval=1,
+            max_interval=4,
+            backoff=2,
+        )
+        await sweeper.sweep()
+        await sweeper.sweep()
+        await sweeper.sweep()
+        await sweeper.sweep()
+
+        assert sweeper.interval(0, 0, InputType.BATTERY) == 4
+        assert sweeper.interval(0, 1, InputType.RSSI) == 4
+
+        loopback_server.set_reading(0, 0, "Battery", 49)  # Small drop - still stable
+        loopback_server.set_reading(0, 1, "RSSI", -50)  # Degrading
+        await sweeper.sweep()
+
+        assert sweeper.interval(0, 0, InputType.BATTERY) == 4
+        assert sweeper.interval(0, 1, InputType.RSSI) == 2
+
+        loopback_server.set_reading(0, 0, "Battery", 40)
+        await sweeper.sweep()
+        assert sweeper.interval(0, 0, InputType.BATTERY) == 2
+
+    async def test_concurrency_bounded(self, loopback_client):
+        """No more than max_concurrency reads are in flight."""
+        sweeper = SensorSweeper(
+            loopback_client, [InputType.BATTERY, InputType.RSSI], max_concurrency=2
+        )
+        send = loopback_client._send_device_message
+        in_flight = peak = 0
+
+        async def slow_send(msg):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.005)
+            try:
+                return await send(msg)
+            finally:
+                in_flight -= 1
+
+        loopback_client._send_device_message = slow_send
+        await sweeper.sweep()
+
+        assert peak == 2
+        assert len(sweeper.snapshot) == 10
+
+    async def test_background_sweeping(self, loopback_client, loopback_server):
+        """Running sweepers poll on their intervals and follow the device list."""
+        sweeper = SensorSweeper(loopback_client, min_interval=0.01, max_interval=0.01)
+        sweeper.start()
+        await asyncio.sleep(0.05)
+
+        assert len(sweeper.snapshot) == 5
+        reads = sweeper.stats.reads
+        assert reads >= 10
+
+        loopback_server.remove_device(4)
+        loopback_server.set_reading(0, 0, "Battery", 10)
+        await asyncio.sleep(0.05)
+        await sweeper.stop()
+
+        assert (4, 0, "Battery") not in sweeper.snapshot
+        assert sweeper.snapshot[(0, 0, "Battery")].value == 10
+        assert not sweeper.running
+
+    async def test_handler_errors_kept(self, loopback_client):
+        """Exceptions from on_change handlers end up in last_error, not the loop."""
+        sweeper = SensorSweeper(loopback_client, min_interval=0.01, max_interval=0.01)
+        error = RuntimeError("handler failed")
+
+        def failing_handler(change):
+            raise error
+
+        sweeper.on_change += failing_handler
+        sweeper.start()
+        await asyncio.sleep(0.05)
+
+        assert sweeper.last_error is error
+        assert sweeper.running
+        assert len(sweeper.snapshot) == 5
+        await sweeper.stop()
+
+    def test_invalid_options(self, loopback_client):
+        """Intervals, backoff and concurrency are validated."""
+        with pytest.raises(ValueError):
+            SensorSweeper(loopback_client, min_interval=10, max_interval=5)
+        with pytest.raises(ValueError):
+            SensorSweeper(loopback_client, backoff=0.5)
+        with pytest.raises(ValueError):
+            SensorSweeper(loopback_client, max_concurrency=0)
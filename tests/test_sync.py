@@ -0,0 +1,141 @@
+"""Tests for the synchronous client facade."""
+
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+import pytest
+
+from buttplug import (
+    ButtplugDeviceError,
+    DeviceOutputCommand,
+    LoopbackConnector,
+    OutputType,
+    SyncButtplugClient,
+)
+
+
+@pytest.fixture
+def sync_client(loopback_server):
+    """SyncButtplugClient connected to the loopback server."""
+    client = SyncButtplugClient("Test")
+    client.connect(LoopbackConnector(loopback_server), timeout=5)
+    yield client
+    client.close()
+
+
+class TestSyncButtplugClient:
+    """Tests for SyncButtplugClient."""
+
+    def test_connect_and_devices(self, sync_client):
+        """Blocking connect completes the handshake and lists devices."""
+        assert sync_client.connected is True
+        assert set(sync_client.devices) == {0, 1}
+
+    def test_run_output_blocks_until_acked(self, sync_client, loopback_server):
+        """run_output returns once the server has answered."""
+        sync_client.run_output(0, DeviceOutputCommand(OutputType.VIBRATE, 0.5), timeout=5)
+
+        assert loopback_server.outputs[(0, 0)] == {"Vibrate": {"Value": 10}}
+        assert loopback_server.outputs[(0, 1)] == {"Vibrate": {"Value": 10}}
+
+    def test_run_output_raises_device_errors(self, sync_client):
+        """Errors raised on the loop reach the calling thread."""
+        with pytest.raises(ButtplugDeviceError):
+            sync_client.run_output(7, DeviceOutputCommand(OutputType.VIBRATE, 0.5), timeout=5)
+
+    def test_submit_output_returns_future(self, sync_client, loopback_server):
+        """submit_output hands back a concurrent future."""
+        future = sync_client.submit_output(
+            0, DeviceOutputCommand(OutputType.VIBRATE, 1.0), feature_index=1
+        )
+
+        assert isinstance(future, Future)
+        assert future.result(timeout=5) is None
+        assert loopback_server.outputs == {(0, 1): {"Vibrate": {"Value": 20}}}
+
+    def test_post_from_many_threads(self, sync_client, loopback_server):
+        """Posts from several threads all arrive, drained in batches."""
+        per_thread = 50
+
+        def producer(step: int) -> None:
+            for _ in range(per_thread):
+                sync_client.post_output(
+                    0, DeviceOutputCommand(OutputType.VIBRATE, step), feature_index=0
+                )
+
+        threads = [threading.Thread(target=producer, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # A blocking call queued after every post completes after them
+        sync_client.call(sync_client.client.stop_all_devices, timeout=5)
+
+        assert loopback_server.count("OutputCmd") == 4 * per_thread
+        stats = sync_client.ingestion_stats
+        assert stats.submitted >= 4 * per_thread
+        assert stats.wakeups < stats.submitted
+        assert stats.failed_posts == 0
+
+    def test_call_timeout_is_builtin(self, sync_client):
+        """An expired wait raises the builtin TimeoutError on every Python version."""
+
+        async def slow() -> None:
+            await asyncio.sleep(1)
+
+        with pytest.raises(TimeoutError) as excinfo:
+            sync_client.call(slow, timeout=0.01)
+
+        assert excinfo.type is TimeoutError
+
+    def test_failed_posts_counted(self, sync_client):
+        """Fire-and-forget failures show up in the stats."""
+        sync_client.post_output(7, DeviceOutputCommand(OutputType.VIBRATE, 0.5))
+        sync_client.call(sync_client.client.stop_all_devices, timeout=5)
+
+        assert sync_client.ingestion_stats.failed_posts == 1
+
+    def test_blocking_call_from_loop_thread_rejected(self, sync_client):
+        """Blocking on the loop thread would deadlock, so it raises instead."""
+
+        async def nested() -> None:
+            sync_client.stop_all_devices()
+
+        with pytest.raises(RuntimeError, match="loop thread"):
+            sync_client.call(nested, timeout=5)
+
+    def test_close_disconnects(self, loopback_server):
+        """close() disconnects and stops the loop thread."""
+        client = SyncButtplugClient("Test")
+        client.connect(LoopbackConnector(loopback_server), timeout=5)
+        client.close()
+
+        assert client.connected is False
+        assert loopback_server.connection_count == 0
+        with pytest.raises(RuntimeError):
+            client.post_output(0, DeviceOutputCommand(OutputType.VIBRATE, 0.5))
+
+    def test_submit_racing_close_fails(self):
+        """A call submitted while close() runs fails instead of waiting forever."""
+        client = SyncButtplugClient("Test")
+
+        class ClosingDeque(deque):
+            def append(self, job):
+                # close() completes between the closed check and the append
+                closer = threading.Thread(target=client.close)
+                closer.start()
+                closer.join(5)
+                super().append(job)
+
+        client._jobs = ClosingDeque()
+
+        async def noop() -> None:
+            pass
+
+        future = client.submit(noop)
+
+        with pytest.raises(RuntimeError, match="closed"):
+            future.result(timeout=1)
+        assert not client._jobs
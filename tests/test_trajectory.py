@@ -0,0 +1,186 @@
+"""Tests for funscript-style trajectory playback."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from buttplug import (
+    ButtplugDeviceError,
+    Trajectory,
+    TrajectoryPlayer,
+)
+
+
+def sent_moves(server):
+    """(position step, duration) of every move the server received, in order."""
+    return [
+        (move["Value"], move["Duration"])
+        for name, fields in server.received
+        if name == "OutputCmd"
+        for move in [fields["Command"]["HwPositionWithDuration"]]
+    ]
+
+
+class TestTrajectory:
+    """Tests for loading trajectories."""
+
+    def test_from_funscript(self):
+        """Actions are read, sorted and inverted as the script says."""
+        script = json.dumps(
+            {
+                "version": "1.0",
+                "inverted": True,
+                "actions": [{"at": 500, "pos": 100}, {"at": 0, "pos": 10}],
+            }
+        )
+
+        trajectory = Trajectory.from_funscript(script)
+
+        assert [(a.at, a.pos) for a in trajectory.actions] == [(0, 90.0), (500, 0.0)]
+        assert trajectory.duration == 0.5
+
+    @pytest.mark.parametrize(
+        "script",
+        [
+            "{}",
+            '{"actions": [{"at": 0}]}',
+            '{"actions": []}',
+            '{"actions": [{"at": 0, "pos": 150}]}',
+            "[1, 2]",
+        ],
+    )
+    def test_invalid_funscript(self, script):
+        """Malformed scripts raise ValueError."""
+        with pytest.raises(ValueError):
+            Trajectory.from_funscript(script)
+
+
+class TestTrajectoryPlayer:
+    """Tests for TrajectoryPlayer against a loopback server."""
+
+    async def test_segments_become_moves(self, loopback_client, loopback_server):
+        """Each segment is one move toward its end position, lasting the segment."""
+        stroker = loopback_client.devices[1].features[0]
+        trajectory = Trajectory.from_actions([(20, 0), (60, 100), (80, 50)])
+        player = TrajectoryPlayer(stroker, trajectory)
+
+        player.start()
+        await asyncio.wait_for(player.wait(), timeout=1)
+
+        assert sent_moves(loopback_server) == [(0, 20), (100, 40), (50, 20)]
+        assert player.stats.sent == 3
+        assert player.stats.errors == 0
+        assert player.stats.rtt > 0
+
+    async def test_long_segments_split(self, loopback_client, loopback_server):
+        """Segments longer than the maximum duration are split into moves."""
+        stroker = loopback_client.devices[1].features[0]
+        trajectory = Trajectory.from_actions([(0, 0), (2500, 100)])
+
+        player = TrajectoryPlayer(stroker, trajectory)
+
+        assert player.move_count == 4
+        assert player._steps == [0, 34, 67, 100]
+        assert player._ends[-1] == 2.5
+
+    async def test_moves_sent_ahead_by_lead(self, loopback_client, loopback_server):
+        """Moves go out a lookahead before their start."""
+        stroker = loopback_client.devices[1].features[0]
+        trajectory = Trajectory.from_actions([(0, 0), (100, 100), (200, 0)])
+        player = TrajectoryPlayer(stroker, trajectory, lookahead=0.05)
+
+        player.start()
+        await asyncio.sleep(0.07)
+
+        # Started 50ms into the first segment, and the move starting at 100ms
+        # is already out
+        (first, duration), second = sent_moves(loopback_server)
+        assert first == 100
+        assert duration == pytest.approx(50, abs=2)
+        assert second == (0, 100)
+        assert player.lead == pytest.approx(0.05 + 0.5 * player.stats.rtt)
+        await player.stop()
+
+    async def test_seek_moves_toward_current_target(self, loopback_client, loopback_server):
+        """Seeking mid-segment sends that segment's target for the remaining time."""
+        stroker = loopback_client.devices[1].features[0]
+        trajectory = Trajectory.from_actions([(0, 0), (1000, 100), (2000, 0)])
+        player = TrajectoryPlayer(stroker, trajectory)
+
+        player.start()
+        await asyncio.sleep(0.01)
+        player.seek(1.5)
+        await asyncio.sleep(0.01)
+
+        value, duration = sent_moves(loopback_server)[-1]
+        assert value == 0
+        assert duration == pytest.approx(500, abs=20)
+        await player.stop()
+
+    async def test_pause_and_sync(self, loopback_client, loopback_server):
+        """Pausing stops issuing moves; sync follows an external clock."""
+        stroker = loopback_client.devices[1].features[0]
+        trajectory = Trajectory.from_actions([(0, 0), (30, 100), (60, 0), (90, 100)])
+        player = TrajectoryPlayer(stroker, trajectory, sync_tolerance=0.01)
+
+        player.start()
+        await asyncio.sleep(0.005)
+        player.sync(0.005, paused=True)
+        count = len(sent_moves(loopback_server))
+        await asyncio.sleep(0.1)
+
+        assert player.paused
+        assert player.position == 0.005
+        assert len(sent_moves(loopback_server)) == count
+
+        # Small deviations are tolerated, large ones jump
+        player.sync(0.05)
+        assert not player.paused
+        player.sync(0.052)
+        assert player.position == pytest.approx(0.05, abs=0.005)
+        await asyncio.sleep(0.01)
+        assert sent_moves(loopback_server)[-1] == (0, pytest.approx(10, abs=5))
+
+        await asyncio.wait_for(player.wait(), timeout=1)
+        assert sent_moves(loopback_server)[-1][0] == 100
+
+    async def test_speed_scales_durations(self, loopback_client, loopback_server):
+        """At double speed moves are sent twice as often and last half as long."""
+        stroker = loopback_client.devices[1].features[0]
+        trajectory = Trajectory.from_actions([(0, 0), (40, 100), (80, 0)])
+        player = TrajectoryPlayer(stroker, trajectory)
+        player.start()
+        player.speed = 2.0
+
+        await asyncio.wait_for(player.wait(), timeout=1)
+
+        assert [d for _, d in sent_moves(loopback_server)][-2:] == [20, 20]
+
+    @pytest.mark.parametrize("max_lateness, late", [(0.0, 1), (1.0, 0)])
+    async def test_max_lateness_independent_of_sync_tolerance(
+        self, loopback_client, loopback_server, max_lateness, late
+    ):
+        """Moves issued behind schedule count as late by max_lateness alone."""
+        stroker = loopback_client.devices[1].features[0]
+        trajectory = Trajectory.from_actions([(0, 0), (20, 100), (200, 0)])
+        player = TrajectoryPlayer(
+            stroker, trajectory, sync_tolerance=0.5 - max_lateness / 2, max_lateness=max_lateness
+        )
+        player.start()
+        await asyncio.sleep(0)
+        time.sleep(0.05)  # Block the loop past the second move's start
+
+        await asyncio.wait_for(player.wait(), timeout=1)
+
+        assert player.stats.late == late
+        value, duration = sent_moves(loopback_server)[-1]
+        assert value == 0
+        assert (duration < 180) == bool(late)
+
+    async def test_requires_position_output(self, loopback_client):
+        """Only features with HwPositionWithDuration can play trajectories."""
+        vibrator = loopback_client.devices[0].features[0]
+        with pytest.raises(ButtplugDeviceError):
+            TrajectoryPlayer(vibrator, Trajectory.from_actions([(0, 50)]))